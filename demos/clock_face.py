@@ -14,6 +14,7 @@ def clock_face() -> None:
     clock_rad = (canvas_size - (2 * border)) // 2
     trans = translation(canvas_size // 2, canvas_size // 2, 0)
     scale = scaling(clock_rad, clock_rad, 0)
+    to_canvas = trans * scale  # Combine once rather than for every hour
 
     start_p = point(0, 1, 0)
     hours = [start_p]
@@ -22,7 +23,7 @@ def clock_face() -> None:
         hours.append(hour_rot * hours[0])
 
     for hour in hours:
-        tmp = trans * scale * hour
+        tmp = to_canvas * hour
         c.write_pixel(round(tmp.x), round(tmp.y), color(0, 1, 0))
 
     c.to_ppm(Path("./demos/out/chapter_4.ppm"))
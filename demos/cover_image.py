@@ -1,5 +1,4 @@
 import math
-from functools import partial
 from pathlib import Path
 
 from ray_tracer.camera import Camera
@@ -11,11 +10,10 @@ from ray_tracer.shapes import Cube, Plane, Sphere
 from ray_tracer.transforms import rot, scaling, translation, view_transform
 from ray_tracer.world import World
 
-MAT_P = partial(Material, diffuse=0.7, ambient=0.1, specular=0.0, reflective=0.1)
-WHITE_MAT = MAT_P(color=WHITE)
-BLUE_MAT = MAT_P(color=BLUE)
-RED_MAT = MAT_P(color=RED)
-PURPLE_MAT = MAT_P(color=PURPLE)
+WHITE_MAT = Material(color=WHITE, diffuse=0.7, ambient=0.1, specular=0.0, reflective=0.1)
+BLUE_MAT = Material(color=BLUE, diffuse=0.7, ambient=0.1, specular=0.0, reflective=0.1)
+RED_MAT = Material(color=RED, diffuse=0.7, ambient=0.1, specular=0.0, reflective=0.1)
+PURPLE_MAT = Material(color=PURPLE, diffuse=0.7, ambient=0.1, specular=0.0, reflective=0.1)
 
 STD_OBJ = translation(1, -1, 1) * scaling(0.5, 0.5, 0.5)
 LARGE_OBJ = STD_OBJ * scaling(3.5, 3.5, 3.5)
@@ -17,12 +17,9 @@ def first_camera() -> None:
     floor_material = Material(color(1, 0.9, 0.9), specular=0)
 
     floor = Sphere(flatten_sphere, floor_material)
-    left_wall = Sphere(
-        translation(0, 0, 5) * rot(x=pi / 2, y=-pi / 4) * flatten_sphere, floor_material
-    )
-    right_wall = Sphere(
-        translation(0, 0, 5) * rot(x=pi / 2, y=pi / 4) * flatten_sphere, floor_material
-    )
+    wall_shift = translation(0, 0, 5)
+    left_wall = Sphere(wall_shift * rot(x=pi / 2, y=-pi / 4) * flatten_sphere, floor_material)
+    right_wall = Sphere(wall_shift * rot(x=pi / 2, y=pi / 4) * flatten_sphere, floor_material)
 
     # Add some spheres to the scene
     middle = Sphere(
@@ -1,38 +1,41 @@
 from pathlib import Path
 
+import numpy as np
+
 from ray_tracer.canvas import Canvas
-from ray_tracer.rayple import color, point
-from ray_tracer.rays import Ray
+from ray_tracer.rayple import color
 from ray_tracer.shapes import Sphere
 
 
 def ray_sphere() -> None:
     canvas_size = 100
-    c = Canvas(canvas_size, canvas_size)
 
     wall_z = 10
     wall_size = 7
     half_wall = wall_size / 2
     pixel_size = wall_size / canvas_size
 
-    ray_origin = point(0, 0, -5)
+    ray_origin = np.array((0, 0, -5))
     ray_color = color(0, 1, 0)
-    s = Sphere()
 
-    for y in range(canvas_size + 1):
-        world_y = half_wall - pixel_size * y
-        for x in range(canvas_size + 1):
-            world_x = -half_wall + pixel_size * x
-            wall_coord = point(world_x, world_y, wall_z)
+    # Build the normalized ray directions for every pixel at once, rather than one Ray at a time
+    ys, xs = np.mgrid[0:canvas_size, 0:canvas_size]
+    world_x = -half_wall + pixel_size * xs
+    world_y = half_wall - pixel_size * ys
+    wall_coords = np.stack((world_x, world_y, np.full_like(world_x, wall_z)), axis=-1)
+    ray_dirs = wall_coords - ray_origin
+    ray_dirs /= np.linalg.norm(ray_dirs, axis=-1, keepdims=True)
 
-            ray_to_wall = wall_coord - ray_origin  # vector
-            r = Ray(ray_origin, ray_to_wall.normalize())
+    # Our sphere is a unit sphere at the origin, so the rays are already in object space
+    ray_dirs = ray_dirs.reshape(-1, 3)
+    ray_origins = np.broadcast_to(ray_origin, ray_dirs.shape)
+    *_, hit_mask = Sphere.batch_local_intersect(ray_origins, ray_dirs)
+    hit_mask = hit_mask.reshape(canvas_size, canvas_size)
 
-            intersections = s.intersect(r)
-            if intersections:
-                c.write_pixel(x, y, ray_color)
+    pixels = np.zeros((canvas_size, canvas_size, 3))
+    pixels[hit_mask] = (*ray_color,)
 
-    c.to_ppm(Path("./demos/out/chapter_5.ppm"))
+    Canvas.from_array(pixels).to_ppm(Path("./demos/out/chapter_5.ppm"))
 
 
 if __name__ == "__main__":
@@ -1,58 +1,60 @@
 from pathlib import Path
 
+import numpy as np
+
 from ray_tracer.canvas import Canvas
 from ray_tracer.colors import WHITE
-from ray_tracer.lights import PointLight, lighting
+from ray_tracer.lights import PointLight, lighting_batch
 from ray_tracer.materials import Material
 from ray_tracer.rayple import color, point
-from ray_tracer.rays import Ray
 from ray_tracer.shapes import Sphere
 
 
 def shaded_ray_sphere() -> None:
     canvas_size = 100
-    c = Canvas(canvas_size, canvas_size)
 
     wall_z = 10
     wall_size = 7
     half_wall = wall_size / 2
     pixel_size = wall_size / canvas_size
 
-    ray_origin = point(0, 0, -5)
+    ray_origin = np.array((0, 0, -5))
     s = Sphere(material=Material(color=color(1, 0.2, 1)))
 
     light_position = point(-10, 10, -10)
     light_color = WHITE
     light = PointLight(light_position, light_color)
 
-    for y in range(canvas_size + 1):
-        world_y = half_wall - pixel_size * y
-        for x in range(canvas_size + 1):
-            world_x = -half_wall + pixel_size * x
-            wall_coord = point(world_x, world_y, wall_z)
-
-            ray_to_wall = wall_coord - ray_origin  # vector
-            r = Ray(ray_origin, ray_to_wall.normalize())
-            eye = -r.direction
-
-            intersections = s.intersect(r)
-            if intersections:
-                if hit := intersections.hit:
-                    hit = intersections.hit
-                    surface_point = r.position(hit.t)
-                    normal = hit.obj.normal_at(surface_point, hit)
-                    lit_color = lighting(
-                        material=hit.obj.material,
-                        obj=hit.obj,
-                        light=light,
-                        surf_pos=surface_point,
-                        eye_v=eye,
-                        normal=normal,
-                    )
-
-                c.write_pixel(x, y, lit_color)
-
-    c.to_ppm(Path("./demos/out/chapter_6.ppm"))
+    # Build the normalized ray directions for every pixel at once, rather than one Ray at a time
+    ys, xs = np.mgrid[0:canvas_size, 0:canvas_size]
+    world_x = -half_wall + pixel_size * xs
+    world_y = half_wall - pixel_size * ys
+    wall_coords = np.stack((world_x, world_y, np.full_like(world_x, wall_z)), axis=-1)
+    ray_dirs = wall_coords - ray_origin
+    ray_dirs /= np.linalg.norm(ray_dirs, axis=-1, keepdims=True)
+
+    # Our sphere is a unit sphere at the origin, so the rays are already in object space
+    ray_dirs = ray_dirs.reshape(-1, 3)
+    ray_origins = np.broadcast_to(ray_origin, ray_dirs.shape)
+    t0, t1, hit_mask = s.batch_local_intersect(ray_origins, ray_dirs)
+
+    # Use the nearest non-negative root as the hit
+    ts = np.where(t0[hit_mask] > 0, t0[hit_mask], t1[hit_mask])
+
+    # For a unit sphere at the origin, the surface point doubles as its normal
+    surface_points = ray_origin + ray_dirs[hit_mask] * ts[:, np.newaxis]
+
+    pixels = np.zeros((canvas_size, canvas_size, 3))
+    pixels[hit_mask.reshape(canvas_size, canvas_size)] = lighting_batch(
+        material=s.material,
+        obj=s,
+        light=light,
+        surf_pos=surface_points,
+        eye_v=-ray_dirs[hit_mask],
+        normal=surface_points,
+    )
+
+    Canvas.from_array(pixels).to_ppm(Path("./demos/out/chapter_6.ppm"))
 
 
 if __name__ == "__main__":
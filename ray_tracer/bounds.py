@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from itertools import product
+
+import numpy as np
+
+from ray_tracer import EPSILON, NUMERIC_T
+from ray_tracer.rays import Ray
+from ray_tracer.transforms import Matrix
+
+INF = math.inf
+
+
+@dataclass(slots=True)
+class BoundingBox:
+    """
+    Axis-aligned bounding box (AABB) representation.
+
+    Bounding boxes are described by their minimum and maximum `(x, y, z)` extents; unbounded
+    directions are represented using `math.inf`. An empty box is initialized with inverted infinite
+    extents so that any added point or box will reset them.
+    """
+
+    minimum: tuple[NUMERIC_T, NUMERIC_T, NUMERIC_T] = (INF, INF, INF)
+    maximum: tuple[NUMERIC_T, NUMERIC_T, NUMERIC_T] = (-INF, -INF, -INF)
+
+    @property
+    def is_finite(self) -> bool:  # noqa: D102
+        return all(math.isfinite(comp) for comp in (*self.minimum, *self.maximum))
+
+    @property
+    def is_empty(self) -> bool:  # noqa: D102
+        return any(lo > hi for lo, hi in zip(self.minimum, self.maximum))
+
+    @property
+    def centroid(self) -> tuple[NUMERIC_T, NUMERIC_T, NUMERIC_T]:  # noqa: D102
+        x_min, y_min, z_min = self.minimum
+        x_max, y_max, z_max = self.maximum
+        return ((x_min + x_max) / 2, (y_min + y_max) / 2, (z_min + z_max) / 2)
+
+    @property
+    def surface_area(self) -> NUMERIC_T:  # noqa: D102
+        dx, dy, dz = (hi - lo for lo, hi in zip(self.minimum, self.maximum))
+        return 2 * (dx * dy + dy * dz + dz * dx)
+
+    def add_point(self, x: NUMERIC_T, y: NUMERIC_T, z: NUMERIC_T) -> None:
+        """Grow the box's extents, if necessary, to include the provided point."""
+        x_min, y_min, z_min = self.minimum
+        x_max, y_max, z_max = self.maximum
+        self.minimum = (min(x_min, x), min(y_min, y), min(z_min, z))
+        self.maximum = (max(x_max, x), max(y_max, y), max(z_max, z))
+
+    def merge(self, other: BoundingBox) -> BoundingBox:
+        """Return a new box that encloses both the current box and `other`."""
+        return BoundingBox(
+            minimum=tuple(map(min, self.minimum, other.minimum)),  # type: ignore[arg-type]
+            maximum=tuple(map(max, self.maximum, other.maximum)),  # type: ignore[arg-type]
+        )
+
+    def transform(self, t_matrix: Matrix) -> BoundingBox:
+        """
+        Return the axis-aligned box enclosing the current box after `t_matrix` is applied.
+
+        All eight corners are transformed and a new box is fit around them, which may be larger than
+        the transformed shape itself (e.g. a rotated box), but will always contain it.
+
+        NOTE: Because infinite extents can't be meaningfully transformed, if the current box is not
+        finite then an infinite box is returned instead. Empty boxes remain empty.
+        """
+        if self.is_empty:
+            return BoundingBox()
+
+        if not self.is_finite:
+            return BoundingBox(minimum=(-INF, -INF, -INF), maximum=(INF, INF, INF))
+
+        corners = np.array([(*corner, 1) for corner in product(*zip(self.minimum, self.maximum))])
+        transformed = corners @ t_matrix.matrix.T
+
+        return BoundingBox(
+            minimum=tuple(transformed[:, :3].min(axis=0).tolist()),  # type: ignore[arg-type]
+            maximum=tuple(transformed[:, :3].max(axis=0).tolist()),  # type: ignore[arg-type]
+        )
+
+    def intersects(self, ray: Ray) -> bool:
+        """
+        Determine whether the provided `Ray` passes through the box.
+
+        The box is treated as the intersection of three pairs of parallel planes (slabs), the same
+        as `Cube`; the ray hits the box if the largest near `t` is no larger than the smallest far
+        `t`.
+
+        NOTE: Negative timesteps are considered, so this is a test of the ray's entire line.
+
+        NOTE: Comparisons are padded by `EPSILON` so rays grazing a face or edge (e.g. tangent to a
+        sphere) aren't culled by floating point error.
+        """
+        # The axes are unrolled rather than looped over, since this is run for every BVH node &
+        # bounded shape a ray is tested against
+        x_min, y_min, z_min = self.minimum
+        x_max, y_max, z_max = self.maximum
+        origin, direction = ray.origin, ray.direction
+
+        dx = direction.x
+        if dx == 0:
+            # Ray is parallel to this slab, so it either always or never lies within it
+            ox = origin.x
+            if ox < x_min - EPSILON or ox > x_max + EPSILON:
+                return False
+            t_min, t_max = -INF, INF
+        else:
+            t_min = (x_min - origin.x) / dx
+            t_max = (x_max - origin.x) / dx
+            if t_min > t_max:
+                t_min, t_max = t_max, t_min
+
+        dy = direction.y
+        if dy == 0:
+            oy = origin.y
+            if oy < y_min - EPSILON or oy > y_max + EPSILON:
+                return False
+        else:
+            t0 = (y_min - origin.y) / dy
+            t1 = (y_max - origin.y) / dy
+            if t0 > t1:
+                t0, t1 = t1, t0
+            if t0 > t_min:
+                t_min = t0
+            if t1 < t_max:
+                t_max = t1
+            if t_min > t_max + EPSILON:
+                return False
+
+        dz = direction.z
+        if dz == 0:
+            oz = origin.z
+            if oz < z_min - EPSILON or oz > z_max + EPSILON:
+                return False
+        else:
+            t0 = (z_min - origin.z) / dz
+            t1 = (z_max - origin.z) / dz
+            if t0 > t1:
+                t0, t1 = t1, t0
+            if t0 > t_min:
+                t_min = t0
+            if t1 < t_max:
+                t_max = t1
+            if t_min > t_max + EPSILON:
+                return False
+
+        return True
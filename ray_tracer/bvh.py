@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import typing as t
+from dataclasses import dataclass, field
+
+from ray_tracer.bounds import BoundingBox
+from ray_tracer.intersections import Intersections, empty_intersections
+from ray_tracer.rays import Ray
+
+if t.TYPE_CHECKING:
+    from ray_tracer.shapes import Shape
+
+LEAF_SIZE = 2
+
+
+@dataclass(slots=True, eq=False)
+class BVHNode:
+    """
+    Bounding volume hierarchy (BVH) node.
+
+    Interior nodes have both a `left` and `right` child node, while leaf nodes instead hold the
+    `shapes` contained within their bounds. A node's `bounds` enclose everything beneath it, so a
+    ray that misses a node's box can't hit any of its shapes.
+    """
+
+    bounds: BoundingBox
+    left: BVHNode | None = None
+    right: BVHNode | None = None
+    shapes: list[Shape] = field(default_factory=list)
+
+    def intersect(self, ray: Ray) -> Intersections:
+        """
+        Calculate the `Ray`'s intersections with all shapes in the hierarchy.
+
+        Subtrees whose bounds are missed by the ray are skipped entirely.
+
+        NOTE: Intersections are aggregated but are not sorted.
+        """
+        all_intersections = empty_intersections()
+        node_stack = [self]
+        while node_stack:
+            node = node_stack.pop()
+            if not node.bounds.intersects(ray):
+                continue
+
+            if node.left is None or node.right is None:
+                for obj in node.shapes:
+                    all_intersections.extend(obj.intersect(ray))
+            else:
+                node_stack.append(node.right)
+                node_stack.append(node.left)
+
+        return all_intersections
+
+
+def _split_cost(boxes: list[BoundingBox]) -> list[float]:
+    """Calculate the running surface area heuristic cost of enclosing successive `boxes`."""
+    costs = []
+    running = BoundingBox()
+    for n_boxes, box in enumerate(boxes, start=1):
+        running = running.merge(box)
+        costs.append(running.surface_area * n_boxes)
+
+    return costs
+
+
+def build_bvh(shapes: t.Sequence[Shape], leaf_size: int = LEAF_SIZE) -> BVHNode:
+    """
+    Build a BVH from the provided shapes' parent space bounding boxes.
+
+    The hierarchy is built top-down; at each node, the shapes are sorted by their centroids along
+    the node's longest centroid axis and split where the surface area heuristic (SAH) is minimized,
+    i.e. where the sum of each side's surface area weighted by its number of shapes is smallest.
+    Nodes are left as leaves once they contain `leaf_size` or fewer shapes.
+
+    NOTE: Shapes are expected to have finite bounds; unbounded shapes (e.g. `Plane`) can't be
+    usefully partitioned and should be tested separately.
+    """
+    boxed = [(obj.parent_space_bounds(), obj) for obj in shapes]
+    return _build_node(boxed, leaf_size)
+
+
+def _build_node(boxed: list[tuple[BoundingBox, Shape]], leaf_size: int) -> BVHNode:
+    node_bounds = BoundingBox()
+    centroid_bounds = BoundingBox()
+    for box, _ in boxed:
+        node_bounds = node_bounds.merge(box)
+        centroid_bounds.add_point(*box.centroid)
+
+    if len(boxed) <= leaf_size:
+        return BVHNode(node_bounds, shapes=[obj for _, obj in boxed])
+
+    extents = [hi - lo for lo, hi in zip(centroid_bounds.minimum, centroid_bounds.maximum)]
+    axis = extents.index(max(extents))
+    boxed = sorted(boxed, key=lambda pair: pair[0].centroid[axis])
+
+    # Sweep from both ends so the cost of every split position is available in linear time
+    boxes = [box for box, _ in boxed]
+    left_costs = _split_cost(boxes)
+    right_costs = _split_cost(boxes[::-1])[::-1]
+    split_costs = [left_costs[idx - 1] + right_costs[idx] for idx in range(1, len(boxed))]
+
+    split = split_costs.index(min(split_costs)) + 1
+    return BVHNode(
+        node_bounds,
+        left=_build_node(boxed[:split], leaf_size),
+        right=_build_node(boxed[split:], leaf_size),
+    )
@@ -1,10 +1,14 @@
 import math
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from itertools import product
+
+import numpy as np
 
 from ray_tracer import NUMERIC_T
 from ray_tracer.canvas import Canvas
-from ray_tracer.rayple import point
+from ray_tracer.rayple import Rayple, VECTOR, point
+from ray_tracer.rayple_batch import point_batch
 from ray_tracer.rays import Ray
 from ray_tracer.transforms import Matrix
 from ray_tracer.world import World
@@ -20,6 +24,11 @@ class Camera:  # noqa: D101
     pixel_size: NUMERIC_T = field(init=False)
     _half_width: NUMERIC_T = field(init=False)
     _half_height: NUMERIC_T = field(init=False)
+    _inv_transform: Matrix = field(init=False)
+    _ray_origin: Rayple = field(init=False)
+    _view_of: Matrix | None = field(default=None, init=False, repr=False)
+    _world_xs: np.ndarray = field(init=False)
+    _world_ys: np.ndarray = field(init=False)
 
     def __post_init__(self) -> None:
         """
@@ -40,31 +49,141 @@ class Camera:  # noqa: D101
 
         self.pixel_size = (self._half_width * 2) / self.h_size
 
-    def ray_for_pixel(self, x: int, y: int) -> Ray:
-        """Compute a ray from the camera to the center of the pixel at the given XY coordinates."""
-        x_offset = (x + 0.5) * self.pixel_size
-        y_offset = (y + 0.5) * self.pixel_size
+        # The untransformed world coordinates of each pixel center only depend on the pixel's index,
+        # so they can be calculated for every row & column up front
+        self._world_xs = self._half_width - (np.arange(self.h_size) + 0.5) * self.pixel_size
+        self._world_ys = self._half_height - (np.arange(self.v_size) + 0.5) * self.pixel_size
+
+        self._update_view()
+
+    def _update_view(self) -> None:
+        """
+        Cache the inverse of the camera transform & the transformed ray origin.
 
-        # Determine the untransformed coordinates of the pixel in world space
-        world_x = self._half_width - x_offset
-        world_y = self._half_height - y_offset
+        These are the same for every pixel, so they're only recalculated if `transform` has been
+        reassigned since they were last cached.
+        """
+        if self._view_of is self.transform:
+            return
+
+        self._inv_transform = self.transform.inv()
+        self._ray_origin = self._inv_transform * point(0, 0, 0)
+        self._view_of = self.transform
+
+    def ray_for_pixel(self, x: NUMERIC_T, y: NUMERIC_T) -> Ray:
+        """Compute a ray from the camera to the center of the pixel at the given XY coordinates."""
+        # Compute the untransformed coordinates of the pixel in world space
+        # These are calculated directly rather than looked up from the per-pixel tables used by
+        # rays_for_pixels, so fractional & off-canvas coordinates are supported
+        self._update_view()
+        world_x = self._half_width - (x + 0.5) * self.pixel_size
+        world_y = self._half_height - (y + 0.5) * self.pixel_size
 
         # Then transform the canvas point & origin in order to compute the ray's direction
         # Since we're assuming that the canvas is exactly one unit in front of the camera, we can
         # say that z = -1
-        inv_trans = self.transform.inv()
-        pixel = inv_trans * point(world_x, world_y, -1)
-        origin = inv_trans * point(0, 0, 0)
-        direction = (pixel - origin).normalize()
+        pixel = self._inv_transform * point(world_x, world_y, -1)
+
+        # The subtraction & normalization are done on the raw components, which skips the type
+        # checks and intermediate Rayple of the operator overloads
+        origin = self._ray_origin
+        dx = pixel.x - origin.x
+        dy = pixel.y - origin.y
+        dz = pixel.z - origin.z
+        inv_mag = 1 / math.hypot(dx, dy, dz)
+        direction = Rayple(dx * inv_mag, dy * inv_mag, dz * inv_mag, VECTOR)
 
         return Ray(origin, direction)
 
-    def render(self, world: World) -> Canvas:
-        """Render the camera's current fiew of the world."""
-        img = Canvas(self.h_size, self.v_size)
-        for y, x in product(range(self.v_size - 1), range(self.h_size - 1)):
-            r = self.ray_for_pixel(x, y)
-            c = world.color_at(r)
-            img.write_pixel(x, y, c)
+    def rays_for_pixels(self, xs: np.ndarray, ys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the rays from the camera to the centers of the pixels at the given XY coordinates.
+
+        Rather than building a `Ray` per pixel, rays are returned as a pair of `Nx3` arrays of ray
+        origins and normalized ray directions, where row `i` corresponds to the pixel located at
+        `(xs[i], ys[i])`.
+        """
+        self._update_view()
+        world_x = self._world_xs[np.ravel(xs)]
+        world_y = self._world_ys[np.ravel(ys)]
+
+        # Transform all of the canvas points at once
+        pixels = point_batch(np.column_stack((world_x, world_y, np.full_like(world_x, -1))))
+        pixels = pixels.transform(self._inv_transform)
+
+        origins = point_batch(np.tile((*self._ray_origin,), (world_x.size, 1)))
+        directions = (pixels - origins).normalize()
+
+        return origins.xyz, directions.xyz
+
+    def _tiles(self, tile_size: int) -> t.Iterator[tuple[range, range]]:
+        """Split the canvas into square tiles, yielded as `(x_range, y_range)` pixel spans."""
+        for y_start in range(0, self.v_size, tile_size):
+            for x_start in range(0, self.h_size, tile_size):
+                yield (
+                    range(x_start, min(x_start + tile_size, self.h_size)),
+                    range(y_start, min(y_start + tile_size, self.v_size)),
+                )
+
+    def render_tile(self, world: World, x_range: range, y_range: range) -> np.ndarray:
+        """Render the block of pixels spanned by the provided ranges into an `HxWx3` color array."""
+        # Primary rays are independent of each other, so generate the whole tile's worth of ray
+        # directions with a single batched transform rather than a matrix multiply per pixel
+        ys, xs = np.mgrid[y_range.start : y_range.stop, x_range.start : x_range.stop]
+        _, directions = self.rays_for_pixels(xs, ys)
+
+        origin = self._ray_origin
+        colors = []
+        for dx, dy, dz in directions.tolist():
+            c = world.color_at(Ray(origin, Rayple(dx, dy, dz, VECTOR)))
+            colors.append((c.x, c.y, c.z))
+
+        return np.array(colors).reshape(len(y_range), len(x_range), 3)
+
+    def render(self, world: World, tile_size: int = 16, workers: int = 1) -> Canvas:
+        """
+        Render the camera's current fiew of the world.
+
+        The canvas is rendered in square tiles of up to `tile_size` pixels per side, which keeps
+        neighboring rays, and the scene data they touch, close together in time.
+
+        The world's BVH is rebuilt before rendering if its objects have changed since it was last
+        built; see `World.rebuild`.
+
+        Tiles are independent of each other, so if `workers` is greater than `1` they are split
+        across a pool of that many processes. Each worker receives its own copy of the camera &
+        world once, when the pool is started, rather than once per tile.
+        """
+        # Pick up any changes made to the world since it was last rendered
+        world.rebuild()
+
+        tiles = list(self._tiles(tile_size))
+        if workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(self, world)
+            ) as pool:
+                blocks = list(pool.map(_render_worker_tile, tiles))
+        else:
+            blocks = [self.render_tile(world, x_range, y_range) for x_range, y_range in tiles]
+
+        # Write each finished tile as a block rather than going through the canvas' per-pixel
+        # validation
+        canvas = Canvas(self.h_size, self.v_size)
+        for (x_range, y_range), tile in zip(tiles, blocks):
+            canvas.write_block(x_range.start, y_range.start, tile)
+
+        return canvas
+
+
+# Scene shared by the tiles rendered in a worker process, set once by the pool's initializer
+_worker_scene: tuple[Camera, World] | None = None
+
+
+def _init_worker(camera: Camera, world: World) -> None:  # pragma: no cover
+    global _worker_scene
+    _worker_scene = (camera, world)
+
 
-        return img
+def _render_worker_tile(tile: tuple[range, range]) -> np.ndarray:  # pragma: no cover
+    camera, world = _worker_scene  # type: ignore[misc]
+    return camera.render_tile(world, *tile)
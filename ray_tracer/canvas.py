@@ -1,9 +1,10 @@
-import textwrap
+from __future__ import annotations
+
 from pathlib import Path
 
 import numpy as np
 
-from ray_tracer.rayple import Rayple, RaypleType, color
+from ray_tracer.rayple import COLOR, Rayple, color
 
 
 class Canvas:  # noqa: D101
@@ -13,18 +14,61 @@ class Canvas:  # noqa: D101
         self.width = width
         self.height = height
 
-        self._pixels = np.zeros(shape=(height, width, 3))
+        # Single precision is plenty for display colors & halves the memory footprint of the buffer
+        # NOTE: Values within single precision of an 8-bit step (e.g. 0.79999999) are stored as the
+        # step itself, so they quantize one level higher than the same value in double precision
+        self._pixels = np.zeros(shape=(height, width, 3), dtype=np.float32)
+
+    @classmethod
+    def from_array(cls, pixels: np.ndarray) -> Canvas:
+        """
+        Build a canvas from an existing `HxWx3` array of RGB pixel values.
+
+        This allows a complete image to be handed over in one shot rather than writing each pixel
+        individually.
+        """
+        if pixels.ndim != 3 or pixels.shape[2] != 3:
+            raise ValueError(f"Expected an HxWx3 pixel array. Received shape: {pixels.shape}")
+
+        height, width, _ = pixels.shape
+        canvas = cls(width, height)
+        canvas.write_block(0, 0, pixels)
+
+        return canvas
 
     def pixel_at(self, x: int, y: int) -> Rayple:
         """Return the Color value for the queried pixel."""
-        return color(*self._pixels[y, x, :])
+        return color(*self._pixels[y, x, :].tolist())
+
+    def pixel_at_rgb(self, x: int, y: int) -> tuple[float, float, float]:
+        """Return the queried pixel's `(r, g, b)` values without building a Color `Rayple`."""
+        r, g, b = self._pixels[y, x, :].tolist()
+        return r, g, b
 
     def write_pixel(self, x: int, y: int, color: Rayple) -> None:
         """Map the provided Color value to the specified pixel location."""
-        if color.w != RaypleType.COLOR:
+        if color.w != COLOR:
             raise ValueError(f"Expected Color Rayple. Received: {type(color.w)}")
 
-        self._pixels[y, x, :] = (*color,)
+        self._pixels[y, x, :] = color.x, color.y, color.z
+
+    def write_block(self, x0: int, y0: int, block: np.ndarray) -> None:
+        """
+        Write an `HxWx3` array of RGB pixel values with its upper left corner at `(x0, y0)`.
+
+        The block is written in a single slice assignment rather than pixel by pixel; it must fit
+        entirely within the canvas.
+        """
+        if block.ndim != 3 or block.shape[2] != 3:
+            raise ValueError(f"Expected an HxWx3 pixel array. Received shape: {block.shape}")
+
+        height, width, _ = block.shape
+        if x0 < 0 or y0 < 0 or (x0 + width) > self.width or (y0 + height) > self.height:
+            raise ValueError(
+                f"Block of size {width}x{height} at ({x0}, {y0}) does not fit within the canvas."
+            )
+
+        self._pixels[y0 : y0 + height, x0 : x0 + width, :] = block
 
     def to_ppm(self, out_filepath: Path, maxlen: int | None = 70) -> None:
         """
@@ -37,10 +81,65 @@ class Canvas:  # noqa: D101
         """
         full_text = (
             f"{_build_ppm_header(self.width, self.height)}\n"
-            f"{_pixels_to_ppm(self._pixels, maxlen=maxlen)}\n"
+            f"{_format_ppm_values(self._quantized(), maxlen=maxlen)}\n"
         )
         out_filepath.write_text(full_text)
 
+    def to_ppm_binary(self, out_filepath: Path) -> None:
+        """
+        Output the current canvas as a binary Portable Pixmap (PPM).
+
+        Binary (`P6`) PPMs store each color value as a single byte rather than as ASCII text, so the
+        quantized pixel buffer can be written out as-is.
+
+        See: https://en.wikipedia.org/wiki/Netpbm for more info on the file format.
+        """
+        header = f"{_build_ppm_header(self.width, self.height, identifier='P6')}\n"
+        out_filepath.write_bytes(header.encode("ascii") + self._quantized().tobytes())
+
+    def _quantized(self) -> np.ndarray:
+        """Provide the canvas' pixels as 8-bit integer color values."""
+        return _quantize(self._pixels)
+
+
+class QuantizedCanvas(Canvas):
+    """
+    Canvas variant storing colors as 16-bit fixed point values rather than floats.
+
+    Color values are clamped to `[0, 1]` & scaled by `65535` when written, then scaled back when
+    read, giving a resolution of `1/65535`; this is well beyond what's needed for 8-bit output, at
+    half the memory of the single precision `Canvas`.
+    """
+
+    SCALE = np.iinfo(np.uint16).max
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self._pixels = np.zeros(shape=(height, width, 3), dtype=np.uint16)
+
+    def pixel_at(self, x: int, y: int) -> Rayple:  # noqa: D102
+        return color(*self.pixel_at_rgb(x, y))
+
+    def pixel_at_rgb(self, x: int, y: int) -> tuple[float, float, float]:  # noqa: D102
+        r, g, b = self._pixels[y, x, :].tolist()
+        return r / self.SCALE, g / self.SCALE, b / self.SCALE
+
+    def write_pixel(self, x: int, y: int, color: Rayple) -> None:  # noqa: D102
+        if color.w != COLOR:
+            raise ValueError(f"Expected Color Rayple. Received: {type(color.w)}")
+
+        self._pixels[y, x, :] = _quantize(np.array((color.x, color.y, color.z)), maxval=self.SCALE)
+
+    def write_block(self, x0: int, y0: int, block: np.ndarray) -> None:  # noqa: D102
+        super().write_block(x0, y0, _quantize(block, maxval=self.SCALE))
+
+    def _quantized(self) -> np.ndarray:
+        # 65535 == 255 * 257, so integer division by 257 truncates the same way `Canvas` does; as
+        # the colors are scaled from double precision, values just below an 8-bit step aren't
+        # rounded up onto it by single precision storage
+        return (self._pixels // 257).astype(np.uint8)
+
 
 def _build_ppm_header(width: int, height: int, identifier: str = "P3", maxval: int = 255) -> str:
     """
@@ -55,6 +154,19 @@ def _build_ppm_header(width: int, height: int, identifier: str = "P3", maxval: i
     return header
 
 
+def _quantize(pixels: np.ndarray, maxval: int = 255) -> np.ndarray:
+    """
+    Scale the provided pixel array to integer color values in a single pass.
+
+    Color values are assumed to be between `0` and `1`, inclusive, and are scaled by `maxval` then
+    truncated to integers. Any scaled values less than `0` or greater than `maxval` are clamped.
+
+    The smallest unsigned integer type able to hold `maxval` is used for the output array.
+    """
+    dtype = np.uint8 if maxval <= np.iinfo(np.uint8).max else np.uint16
+    return np.clip(pixels * maxval, 0, maxval).astype(dtype)
+
+
 def _pixels_to_ppm(pixels: np.ndarray, maxval: int = 255, maxlen: int | None = 70) -> str:
     """
     Convert the provided pixel array to PPM format.
@@ -67,22 +179,54 @@ def _pixels_to_ppm(pixels: np.ndarray, maxval: int = 255, maxlen: int | None = 7
     If `maxlen` is not `None`, an attempt is made to limit each data row to a maximum length of
     `maxlen` characters.
     """
-    # Scale to maxval and clamp
-    scaled = (pixels * maxval).astype(int)
-    scaled[scaled > maxval] = maxval
-    scaled[scaled < 0] = 0
+    return _format_ppm_values(_quantize(pixels, maxval=maxval), maxlen=maxlen)
 
+
+def _format_ppm_values(scaled: np.ndarray, maxlen: int | None = 70) -> str:
+    """
+    Format the provided `NxMx3` array of integer color values as PPM data rows.
+
+    If `maxlen` is not `None`, an attempt is made to limit each data row to a maximum length of
+    `maxlen` characters.
+    """
     # Now unwrap into the pixel rows
-    _, height, *_ = pixels.shape
+    _, height, *_ = scaled.shape
     scaled = scaled.reshape([height, -1])
 
-    # There's probably a way to get numpy to do what we want but this is fine
-    # Temporarily remove numpy's print setting since we're manually delimiting
-    with np.printoptions(linewidth=np.inf, threshold=np.inf):  # type: ignore[arg-type]
-        tmp = np.array2string(scaled)
-        tmp = "\n".join(" ".join(row.strip("[] ").split()) for row in tmp.splitlines())
+    # Join the integer values directly rather than formatting the whole array with numpy & then
+    # stripping its brackets & padding back out
+    tmp = "\n".join(" ".join(map(str, row)) for row in scaled.tolist())
 
     if maxlen is not None:
-        return textwrap.fill(tmp, width=maxlen)
+        return _wrap_values(tmp, width=maxlen)
     else:
         return tmp
+
+
+def _wrap_values(text: str, width: int = 70) -> str:
+    """
+    Greedily wrap the provided whitespace delimited values into lines of at most `width` characters.
+
+    Existing line breaks are treated as spaces. This is equivalent to `textwrap.fill` for our
+    single-space delimited data, but jumps straight to the last space within reach of each line
+    rather than splitting the whole text into chunks & reassembling them.
+
+    NOTE: Any value longer than `width` is split across lines.
+    """
+    text = text.replace("\n", " ")
+
+    lines = []
+    start = 0
+    while len(text) - start > width:
+        # A line can hold exactly `width` characters, so a space right after them is a valid break
+        end = text.rfind(" ", start, start + width + 1)
+        if end <= start:
+            # No space to break at, so split the value itself
+            lines.append(text[start : start + width])
+            start += width
+        else:
+            lines.append(text[start:end])
+            start = end + 1
+
+    lines.append(text[start:])
+    return "\n".join(lines)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from enum import Enum, auto
 
-from ray_tracer.intersections import Intersections
+from ray_tracer.intersections import Intersections, empty_intersections
 from ray_tracer.rays import Ray
 from ray_tracer.shapes import Group, Shape
 
@@ -31,8 +31,30 @@ class CSG(Group):
         self.add_child(self.right_shape)
 
     def _local_intersect(self, transformed_ray: Ray) -> Intersections:
-        all_inters = self.left_shape.intersect(transformed_ray)
-        all_inters.extend(self.right_shape.intersect(transformed_ray))
+        left_inters = self.left_shape.intersect(transformed_ray)
+        right_inters = self.right_shape.intersect(transformed_ray)
+
+        # If only one side is hit then every intersection is either kept or dropped depending only
+        # on the operation, so the filtering can be skipped entirely:
+        #   * Union keeps whichever side was hit
+        #   * Intersection needs both sides, so nothing is kept
+        #   * Difference keeps the left side, but nothing is left to subtract from if it was missed
+        if not right_inters:
+            if self.operation == Operation.INTERSECTION:
+                return empty_intersections()
+
+            left_inters.sort()
+            return left_inters
+
+        if not left_inters:
+            if self.operation == Operation.UNION:
+                right_inters.sort()
+                return right_inters
+
+            return empty_intersections()
+
+        all_inters = left_inters
+        all_inters.extend(right_inters)
         all_inters.sort()
 
         return self._filter_intersections(all_inters)
@@ -52,10 +74,15 @@ class CSG(Group):
     def _filter_intersections(self, inters: Intersections) -> Intersections:
         in_left = False
         in_right = False
-        filtered_inters = Intersections([])
+        filtered_inters = empty_intersections()
+
+        # Resolve the shapes on the left side of the operation once, so each intersection only
+        # needs a set lookup; this is equivalent to calling `check_includes` on the left shape
+        left = self.left_shape
+        left_members = left.descendants if isinstance(left, Group) else frozenset((left,))
 
         for inter in inters:
-            left_hit = check_includes(self.left_shape, inter.obj)
+            left_hit = inter.obj in left_members
 
             if self._is_inter_allowed(left_hit, in_left, in_right):
                 filtered_inters.append(inter)
@@ -75,16 +102,7 @@ def check_includes(a: Shape, b: Shape) -> bool:
     If `a` is a `Group` (includes `CSG`), return `True` if any child of `a` includes `b`, otherwise
     if `a` is any other shape, compare them directly.
     """
-    obj_queue = [a]
-    while obj_queue:
-        obj = obj_queue.pop()
-
-        if isinstance(obj, Group):
-            if b in obj.children:
-                return True
-            else:
-                obj_queue.extend(obj.children)
-        else:
-            return obj == b
-
-    return False
+    if isinstance(a, Group):
+        return b in a.descendants
+    else:
+        return a is b
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import math
 import typing as t
-from collections import UserList
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from functools import cached_property
+from functools import cached_property, partial
+from operator import attrgetter
+
+import numpy as np
 
 from ray_tracer import EPSILON, NUMERIC_T
-from ray_tracer.rayple import Rayple, dot
+from ray_tracer.rayple import POINT, Rayple, dot
 from ray_tracer.rays import Ray
 
 if t.TYPE_CHECKING:
@@ -24,8 +27,30 @@ class Intersection:  # noqa: D101
     u: NUMERIC_T = 0
     v: NUMERIC_T = 0
 
+    def __init__(self, t: NUMERIC_T, obj: Shape, u: NUMERIC_T = 0, v: NUMERIC_T = 0) -> None:
+        # As with Rayple, intersections are created for every ray & shape pair, so skip the frozen
+        # dataclass __init__ and fill the slots directly
+        _set_t(self, t)
+        _set_obj(self, obj)
+        _set_u(self, u)
+        _set_v(self, v)
+
+
+# Slot setters for the frozen Intersection, since the dataclass's own attribute setting is blocked
+_set_t = Intersection.t.__set__  # type: ignore[attr-defined]
+_set_obj = Intersection.obj.__set__  # type: ignore[attr-defined]
+_set_u = Intersection.u.__set__  # type: ignore[attr-defined]
+_set_v = Intersection.v.__set__  # type: ignore[attr-defined]
+
+_by_t = attrgetter("t")
+
+BISECT_MIN_LEN = 16
+
+_list_init = list.__init__
+_list_sort = list.sort
+
 
-class Intersections(UserList):
+class Intersections(list[Intersection]):
     """
     Helper container for shape intersections.
 
@@ -33,22 +58,46 @@ class Intersections(UserList):
     """
 
     def __init__(self, in_data: t.Iterable[Intersection]) -> None:
-        self.data: list[Intersection] = list(in_data)
-        self.sort()
+        # A collection is created for every shape tested against every ray, so call into the list
+        # methods directly rather than paying for the super() & sort() lookups
+        _list_init(self, in_data)
+        if len(self) > 1:
+            _list_sort(self, key=_by_t)
 
     def sort(self, reverse: bool = False) -> None:  # type: ignore[override]  # noqa: D102
-        self.data.sort(key=lambda x: x.t, reverse=reverse)
+        # Most shapes are missed entirely or hit once, so don't bother calling into the sort
+        # Anything longer is handed to timsort, which already merges presorted runs in linear time
+        if len(self) < 2:
+            return
+
+        super().sort(key=_by_t, reverse=reverse)
 
     @cached_property
     def hit(self) -> Intersection | None:
-        """Determine the lowest non-negative intersection, otherwise return `None`."""
-        for intersect in self.data:
+        """
+        Determine the lowest non-negative intersection, otherwise return `None`.
+
+        NOTE: Intersections are assumed to be sorted, so longer collections are searched by
+        bisection.
+        """
+        # Bisection has more overhead per step than a plain scan, so it only pays for itself once
+        # there are more than a handful of intersections
+        if len(self) > BISECT_MIN_LEN:
+            idx = bisect_right(self, 0, key=_by_t)
+            return self[idx] if idx < len(self) else None
+
+        for intersect in self:
             if intersect.t > 0:
                 return intersect
         else:
             return None
 
 
+# Most shapes are missed by most rays, so empty collections are created by far the most often; the
+# list's __new__ already provides an empty collection, so the Python level __init__ can be skipped
+empty_intersections: t.Callable[[], Intersections] = partial(list.__new__, Intersections)
+
+
 @dataclass(slots=True)
 class Comps:  # noqa: D101
     t: NUMERIC_T
@@ -67,8 +116,12 @@ class Comps:  # noqa: D101
         # Create points shifted slightly in each normal direction to help prevent self-shadowing due
         # to floating point issues; if a point is on the surface it may be accidentally considered
         # inside/outside, depending on the error direction
-        self.over_point = self.point + self.normal * EPSILON
-        self.under_point = self.point - self.normal * EPSILON
+        # Both points share the same offset, so compute it once from the raw components
+        px, py, pz = self.point.x, self.point.y, self.point.z
+        nx, ny, nz = self.normal.x, self.normal.y, self.normal.z
+        off_x, off_y, off_z = nx * EPSILON, ny * EPSILON, nz * EPSILON
+        self.over_point = Rayple(px + off_x, py + off_y, pz + off_z, POINT)
+        self.under_point = Rayple(px - off_x, py - off_y, pz - off_z, POINT)
 
 
 def _calc_refractive_indices(
@@ -78,37 +131,44 @@ def _calc_refractive_indices(
     Calculate the refractive indices of the materials on either side of a ray-object intersection.
 
     Indices are return as a (<exited material>, <entered material>) tuple pair.
+
+    NOTE: `inter` is located in `all_inters` by identity, so it must be one of its members rather
+    than an equivalent `Intersection` instance.
     """
-    # Record the shapes that have been encountered but not yet exited
-    # May need to use a different container if all the membership checks end up being onerous
-    containers: list[Shape] = []
+    # Record the shapes that have been encountered but not yet exited, along with their refractive
+    # indices so they don't need to be looked back up through the shape's material
+    # Shapes hash by object ID, so an insertion-ordered dict gives us constant time membership
+    # checks & removals while still letting us grab the most recently entered shape
+    containers: dict[Shape, NUMERIC_T] = {}
     # We can assume that all_inters is never going to be empty
-    for i in all_inters:  # pragma: no branch
+    for i in all_inters:
         # Material being exited
-        if i == inter:
+        if i is inter:
             if not containers:
                 # No containing object
                 n1: NUMERIC_T = 1
             else:
-                n1 = containers[-1].material.refractive_index
+                n1 = next(reversed(containers.values()))
 
-        # If the intersections object is already in the containers list, then this intersection is
+        # If the intersections object is already in the containers, then this intersection is
         # assumed to be exiting the object. Otherwise, the intersection is entering the object and
-        # it should be added to the list of container shapes
-        try:
-            containers.remove(i.obj)
-        except ValueError:
-            containers.append(i.obj)
+        # it should be added to the container shapes
+        if i.obj in containers:
+            del containers[i.obj]
+        else:
+            containers[i.obj] = i.obj.material.refractive_index
 
         # Material being entered
-        if i == inter:
+        if i is inter:
             if not containers:
                 # No containing object
                 n2: NUMERIC_T = 1
             else:
-                n2 = containers[-1].material.refractive_index
+                n2 = next(reversed(containers.values()))
 
             break
+    else:
+        raise ValueError("The provided intersection must be a member of the intersections.")
 
     return n1, n2
 
@@ -171,7 +231,7 @@ def schlick(comps: Comps) -> float:
     # Total internal reflection can only occur if n1 > n2
     if comps.n1 > comps.n2:
         n = comps.n1 / comps.n2
-        sin2_t = n**2 * (1.0 - cos**2)
+        sin2_t = n * n * (1.0 - cos * cos)
 
         if sin2_t > 1:
             return 1.0
@@ -179,5 +239,43 @@ def schlick(comps: Comps) -> float:
         cos_t = math.sqrt(1.0 - sin2_t)
         cos = cos_t
 
-    r0 = ((comps.n1 - comps.n2) / (comps.n1 + comps.n2)) ** 2
-    return r0 + (1 - r0) * (1 - cos) ** 5
+    r0 = (comps.n1 - comps.n2) / (comps.n1 + comps.n2)
+    r0 = r0 * r0
+
+    # Build up the 5th power from a square rather than calling into pow
+    x = 1 - cos
+    x2 = x * x
+    return r0 + (1 - r0) * x2 * x2 * x
+
+
+def schlick_batch(
+    n1: np.ndarray | NUMERIC_T, n2: np.ndarray | NUMERIC_T, eye_dot_normal: np.ndarray
+) -> np.ndarray:
+    """
+    Use the Schlick approximation to determine the surface reflectance for a batch of hits.
+
+    Rather than taking precomputed `Comps`, the refractive indices on either side of each hit and
+    the dot product of each hit's eye & normal vectors are provided directly, allowing a caller
+    that has already computed them (e.g. while lighting) to reuse them. Indices may be provided as
+    scalars or as arrays matching `eye_dot_normal`.
+
+    See `schlick` for more information on the approximation.
+    """
+    n1 = np.asarray(n1, dtype=float)
+    n2 = np.asarray(n2, dtype=float)
+    cos = np.asarray(eye_dot_normal, dtype=float)
+
+    # Total internal reflection can only occur if n1 > n2
+    n = n1 / n2
+    sin2_t = n * n * (1.0 - cos * cos)
+    total_internal = (n1 > n2) & (sin2_t > 1)
+
+    cos_t = np.sqrt(np.maximum(1.0 - sin2_t, 0))
+    cos = np.where(n1 > n2, cos_t, cos)
+
+    r0 = (n1 - n2) / (n1 + n2)
+    r0 = r0 * r0
+
+    x = 1 - cos
+    x2 = x * x
+    return np.where(total_internal, 1.0, r0 + (1 - r0) * x2 * x2 * x)
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import math
+import typing as t
 from dataclasses import dataclass
 
-from ray_tracer.colors import BLACK
+import numpy as np
+
+from ray_tracer import NUMERIC_T
 from ray_tracer.materials import Material
-from ray_tracer.rayple import Rayple, RaypleType, dot
+from ray_tracer.rayple import POINT, Rayple, VECTOR, color
 from ray_tracer.shapes import Shape
 
+FLOAT3: t.TypeAlias = tuple[NUMERIC_T, NUMERIC_T, NUMERIC_T]
+
 
 @dataclass(frozen=True, slots=True)
 class PointLight:  # noqa: D101
@@ -39,42 +45,157 @@ def lighting(
 
     If `in_shadow` is `True`, then diffuse and specular components are ignored.
     """
-    if surf_pos.w != RaypleType.POINT:
+    if surf_pos.w != POINT:
         raise ValueError("Surface position must be a point.")
-    if eye_v.w != RaypleType.VECTOR:
+    if eye_v.w != VECTOR:
         raise ValueError("Eye vector must be a vector.")
-    if normal.w != RaypleType.VECTOR:
+    if normal.w != VECTOR:
         raise ValueError("Normal vector must be a vector.")
 
+    return _lighting_unchecked(material, obj, light, surf_pos, eye_v, normal, in_shadow)
+
+
+def _lighting_unchecked(
+    material: Material,
+    obj: Shape,
+    light: PointLight,
+    surf_pos: Rayple,
+    eye_v: Rayple,
+    normal: Rayple,
+    in_shadow: bool = False,
+) -> Rayple:
+    """
+    Calculate the shading from the given light source at the given point on an object.
+
+    This is `lighting` without its input validation, intended for the render pipeline where the
+    positions & vectors are produced internally and are already known to be the correct types.
+    """
     if material.pattern:
         surf_color = material.pattern.at_object(obj, surf_pos)
     else:
         surf_color = material.color
 
-    effective_color = surf_color * light.intensity
-    ambient = effective_color * material.ambient
+    r, g, b = _lighting_scalar(
+        surf_color=(surf_color.x, surf_color.y, surf_color.z),
+        ambient=material.ambient,
+        diffuse=material.diffuse,
+        specular=material.specular,
+        shininess=material.shininess,
+        light_pos=(light.position.x, light.position.y, light.position.z),
+        intensity=(light.intensity.x, light.intensity.y, light.intensity.z),
+        surf_pos=(surf_pos.x, surf_pos.y, surf_pos.z),
+        eye_v=(eye_v.x, eye_v.y, eye_v.z),
+        normal=(normal.x, normal.y, normal.z),
+        in_shadow=in_shadow,
+    )
+    return color(r, g, b)
+
+
+def _lighting_scalar(
+    surf_color: FLOAT3,
+    ambient: NUMERIC_T,
+    diffuse: NUMERIC_T,
+    specular: NUMERIC_T,
+    shininess: NUMERIC_T,
+    light_pos: FLOAT3,
+    intensity: FLOAT3,
+    surf_pos: FLOAT3,
+    eye_v: FLOAT3,
+    normal: FLOAT3,
+    in_shadow: bool = False,
+) -> FLOAT3:
+    """
+    Calculate the Phong shading at a surface point using raw `(x, y, z)` components.
+
+    This is the arithmetic core of `lighting`, operating directly on floats so no intermediate
+    `Rayple` instances are created. The surface color is assumed to already be resolved from the
+    material's color or pattern, and inputs are not validated.
+    """
+    cr, cg, cb = surf_color
+    ir, ig, ib = intensity
 
+    # Effective color is the Hadamard product of the surface color & the light intensity
+    er, eg, eb = cr * ir, cg * ig, cb * ib
     if in_shadow:
-        return ambient
+        return er * ambient, eg * ambient, eb * ambient
 
-    light_vec = (light.position - surf_pos).normalize()
-    light_dot_normal = dot(light_vec, normal)
+    px, py, pz = surf_pos
+    lx, ly, lz = light_pos
+    nx, ny, nz = normal
+
+    lx, ly, lz = lx - px, ly - py, lz - pz
+    inv_mag = 1 / math.hypot(lx, ly, lz)
+    lx, ly, lz = lx * inv_mag, ly * inv_mag, lz * inv_mag
+
+    light_dot_normal = lx * nx + ly * ny + lz * nz
     if light_dot_normal < 0:
         # A negative number means the light is on the other side of the surface, so the diffuse and
         # specular components go to 0
-        diffuse = BLACK
-        specular = BLACK
+        return er * ambient, eg * ambient, eb * ambient
+
+    # Ambient & diffuse both scale the effective color, so they can be combined
+    shade = ambient + diffuse * light_dot_normal
+    r, g, b = er * shade, eg * shade, eb * shade
+
+    # For the specular contribution, determine the angle between the reflection and eye vectors
+    # Reflecting the negated light vector across the normal gives: 2 * (l . n) * n - l
+    two_ldn = 2 * light_dot_normal
+    ex, ey, ez = eye_v
+    reflect_dot_eye = (two_ldn * nx - lx) * ex + (two_ldn * ny - ly) * ey + (two_ldn * nz - lz) * ez
+    if reflect_dot_eye > 0:
+        # Otherwise, light is reflecting away from the eye
+        factor = specular * reflect_dot_eye**shininess
+        r, g, b = r + ir * factor, g + ig * factor, b + ib * factor
+
+    return r, g, b
+
+
+def lighting_batch(
+    material: Material,
+    obj: Shape,
+    light: PointLight,
+    surf_pos: np.ndarray,
+    eye_v: np.ndarray,
+    normal: np.ndarray,
+    in_shadow: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Calculate the Phong shading from the given light source for a batch of points on an object.
+
+    Surface positions, eye vectors, and normal vectors are provided as `Nx3` arrays of `(x, y, z)`
+    components, and an `Nx3` array of `(r, g, b)` colors is returned. If provided, `in_shadow` is a
+    length `N` boolean array; diffuse and specular components are ignored for shadowed points.
+
+    See `lighting` for a description of the reflection model.
+    """
+    if material.pattern:
+        surf_colors = material.pattern.at_object_batch(obj, surf_pos)
     else:
-        diffuse = effective_color * material.diffuse * light_dot_normal
-
-        # For the specular contribution, determine the angle between the reflection and eye vectors
-        reflect_vec = -light_vec.reflect(normal)
-        reflect_dot_eye = dot(reflect_vec, eye_v)
-        if reflect_dot_eye <= 0:
-            # Light is reflecting away from the eye
-            specular = BLACK
-        else:
-            factor = reflect_dot_eye**material.shininess
-            specular = light.intensity * material.specular * factor
-
-    return ambient + diffuse + specular
+        surf_colors = np.array((*material.color,))
+
+    intensity = np.array((*light.intensity,))
+    effective_color = surf_colors * intensity
+
+    light_vec = np.array((*light.position,)) - surf_pos
+    light_vec /= np.linalg.norm(light_vec, axis=1, keepdims=True)
+    light_dot_normal = np.einsum("ij,ij->i", light_vec, normal)
+
+    # A negative light dot normal means the light is on the other side of the surface, so the
+    # diffuse and specular components go to 0
+    # Rather than indexing out the lit points, zero the unlit ones with a mask so every point goes
+    # through the same straight-line arithmetic
+    lit = light_dot_normal >= 0
+    if in_shadow is not None:
+        lit &= ~in_shadow
+
+    # Ambient & diffuse both scale the effective color, so they can be combined
+    shade = material.ambient + material.diffuse * light_dot_normal * lit
+    colors = effective_color * shade[:, np.newaxis]
+
+    # Reflecting the negated light vector across the normal gives: 2 * (l . n) * n - l
+    # Light reflecting away from the eye has no specular component
+    reflect_vec = 2 * light_dot_normal[:, np.newaxis] * normal - light_vec
+    reflect_dot_eye = np.maximum(np.einsum("ij,ij->i", reflect_vec, eye_v), 0)
+    factor = material.specular * reflect_dot_eye**material.shininess * (lit & (reflect_dot_eye > 0))
+
+    return colors + intensity * factor[:, np.newaxis]
@@ -53,3 +53,7 @@ class Material:
             )
         ):
             raise ValueError("Material reflection and refraction attributes must be non-negative.")
+
+        # Store the index as a plain float so `RefractionIndex` members don't have to go through the
+        # enum machinery every time the index is read while tracing refracted rays
+        object.__setattr__(self, "refractive_index", float(self.refractive_index))
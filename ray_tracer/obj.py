@@ -1,14 +1,20 @@
+import mmap
+import typing as t
+from dataclasses import dataclass, field
 from pathlib import Path
 
-import more_itertools as miter
+import numpy as np
 
-from ray_tracer.rayple import Rayple, point, vector
+from ray_tracer.rayple import Rayple
+from ray_tracer.rayple_batch import RaypleBatch, point_batch, vector_batch
 from ray_tracer.shapes import Group, SmoothTriangle, Triangle
 
+_COMMAND_BYTES = {b"f", b"g", b"v"}
+
 
 def parse_obj_src(
     src: str,
-) -> tuple[list[Rayple], list[Triangle | SmoothTriangle], list[Group], list[Rayple]]:
+) -> tuple[RaypleBatch, list[Triangle | SmoothTriangle], list[Group], RaypleBatch]:
     """
     Parse a Wavefront OBJ file into collections of geometric constructs.
 
@@ -18,6 +24,9 @@ def parse_obj_src(
         * `Group`s
         * Vertex Normals
 
+    Vertices & vertex normals are provided as packed `RaypleBatch` instances; indexing them yields
+    the corresponding `Rayple`.
+
     OBJ formats are assumed to consist of statements, each of which occupies a single line. Each
     statement is prefaced with a command, followed by a space-delimited list of arguments.
 
@@ -42,44 +51,66 @@ def parse_obj_src(
     NOTE: It is assumed that OBJ files and individual commands are well-formed, no validation is
     performed.
     """
-    all_vertices = []
-    all_triangles: list[Triangle | SmoothTriangle] = []
-    groups = [Group()]
-    all_vertex_normals = []
-    for line in src.splitlines():
-        if not line or line[0] not in {"v", "f", "g"}:
+    return _parse_obj_lines(src.splitlines())
+
+
+def _parse_obj_lines(
+    lines: t.Iterable[str],
+) -> tuple[RaypleBatch, list[Triangle | SmoothTriangle], list[Group], RaypleBatch]:
+    """Parse the provided OBJ statements; see `parse_obj_src` for a description of the format."""
+    # Bucket the lines by command in a single pass so the vertex & normal coordinates can each be
+    # parsed as one block, rather than converting every value with its own float() call
+    vertex_lines: list[str] = []
+    normal_lines: list[str] = []
+    statements: list[str] = []
+
+    # Dispatch on the command, which distinguishes the commands without depending on the order of
+    # checks (e.g. "v" is a prefix of "vn" & "vt") & skips unsupported commands; OBJ arguments are
+    # whitespace delimited, so the command may be followed by any whitespace, not just a space
+    dispatch = {
+        "v": vertex_lines.append,
+        "vn": normal_lines.append,
+        "f": statements.append,
+        "g": statements.append,
+    }
+    for line in lines:
+        command = line.split(maxsplit=1)
+        if not command:
             continue
 
-        if line.startswith("vn"):
-            x, y, z = (float(val) for val in line.split()[1:])
-            all_vertex_normals.append(vector(x, y, z))
-        elif line.startswith("v"):
-            x, y, z = (float(val) for val in line.split()[1:])
-            all_vertices.append(point(x, y, z))
-        elif line.startswith("f"):
+        handler = dispatch.get(command[0])
+        if handler is not None:
+            handler(line)
+
+    # Coordinates are stored packed, and a Rayple is only built once a face references its row
+    all_vertices = point_batch(_parse_coordinates(vertex_lines))
+    all_vertex_normals = vector_batch(_parse_coordinates(normal_lines))
+    vertex_lookup = _RowCache(all_vertices)
+    normal_lookup = _RowCache(all_vertex_normals)
+
+    all_triangles: list[Triangle | SmoothTriangle] = []
+    groups = [Group()]
+    for line in statements:
+        if line.startswith("f"):
             triangles: list[Triangle] | list[SmoothTriangle]
             if "/" in line:
                 # Smooth triangles
                 vertices = []
                 normals = []
                 for comp in line.split()[1:]:
-                    # Since we're assuming a properly formatted OBJ file we can fall back to 0 for
-                    # an unspecified texture vertex (we're ignoring it anyway)
-                    vertex_idx, _, normal_idx = (
-                        int(val) - 1 if val else 0 for val in comp.split("/")
-                    )
-                    vertices.append(all_vertices[vertex_idx])
-                    normals.append(all_vertex_normals[normal_idx])
+                    # Since we're assuming a properly formatted OBJ file the vertex index is always
+                    # present; the texture vertex is ignored, so it doesn't need to be parsed
+                    vertex_val, _, normal_val = comp.split("/")
+                    vertices.append(vertex_lookup[int(vertex_val) - 1])
+                    normals.append(normal_lookup[int(normal_val) - 1 if normal_val else 0])
 
                 triangles = _fan_triangulation_smooth(vertices, normals)
             else:
                 # Regular boring triangles
-                vertices = [all_vertices[int(val) - 1] for val in line.split()[1:]]
+                vertices = [vertex_lookup[int(val) - 1] for val in line.split()[1:]]
                 triangles = _fan_triangulation(vertices)
             all_triangles.extend(triangles)
-
-            for t in triangles:
-                groups[-1].add_child(t)
+            groups[-1].extend_children(triangles)
         elif line.startswith("g"):  # pragma: no branch
             new_group = Group()
             groups[0].add_child(new_group)
@@ -88,28 +119,53 @@ def parse_obj_src(
     return all_vertices, all_triangles, groups, all_vertex_normals
 
 
+def _parse_coordinates(lines: list[str]) -> np.ndarray:
+    """Parse the `(x, y, z)` arguments of the provided vertex or vertex normal statements."""
+    if not lines:
+        return np.empty((0, 3))
+
+    return np.loadtxt(lines, usecols=(1, 2, 3), dtype=np.float64, ndmin=2)
+
+
+@dataclass(slots=True)
+class _RowCache:
+    """Build the `Rayple` for each row of a `RaypleBatch` on first access & reuse it afterwards."""
+
+    batch: RaypleBatch
+    _rayples: list[Rayple | None] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._rayples = [None] * len(self.batch)
+
+    def __getitem__(self, idx: int) -> Rayple:
+        rayple = self._rayples[idx]
+        if rayple is None:
+            rayple = self.batch[idx]
+            self._rayples[idx] = rayple
+
+        return rayple
+
+
 def _fan_triangulation(vertices: list[Rayple]) -> list[Triangle]:
     """Split the provided convex polygon into its component triangles."""
-    triangles = []
-    for p2, p3 in miter.sliding_window(vertices[1:], 2):
-        triangles.append(Triangle(p1=vertices[0], p2=p2, p3=p3))
-
-    return triangles
+    # Each triangle in the fan pairs the first vertex with a pair of consecutive vertices, which
+    # can be generated by zipping offset slices of the vertex list
+    p1 = vertices[0]
+    return [Triangle(p1=p1, p2=p2, p3=p3) for p2, p3 in zip(vertices[1:-1], vertices[2:])]
 
 
 def _fan_triangulation_smooth(
     vertices: list[Rayple], vertex_normals: list[Rayple]
 ) -> list[SmoothTriangle]:
     """Split the provided convex polygon into its component smooth triangles."""
-    triangles = []
-    for (p2, p3), (n2, n3) in zip(
-        miter.sliding_window(vertices[1:], 2), miter.sliding_window(vertex_normals[1:], 2)
-    ):
-        triangles.append(
-            SmoothTriangle(p1=vertices[0], p2=p2, p3=p3, n1=vertex_normals[0], n2=n2, n3=n3)
+    p1 = vertices[0]
+    n1 = vertex_normals[0]
+    return [
+        SmoothTriangle(p1=p1, p2=p2, p3=p3, n1=n1, n2=n2, n3=n3)
+        for p2, p3, n2, n3 in zip(
+            vertices[1:-1], vertices[2:], vertex_normals[1:-1], vertex_normals[2:]
         )
-
-    return triangles
+    ]
 
 
 def parse_obj_file(filepath: Path) -> Group:
@@ -136,7 +192,21 @@ def parse_obj_file(filepath: Path) -> Group:
     NOTE: It is assumed that OBJ files and individual commands are well-formed, no validation is
     performed.
     """
-    src = filepath.read_text()
-    *_, groups, _ = parse_obj_src(src)
+    # Empty files can't be memory mapped
+    if filepath.stat().st_size == 0:
+        *_, groups, _ = parse_obj_src("")
+        return groups[0]
+
+    # Map the file rather than reading it into memory, so large meshes are paged in by the OS as
+    # they're parsed & only the lines of supported commands are decoded
+    with filepath.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        *_, groups, _ = _parse_obj_lines(_iter_mapped_lines(mm))
 
     return groups[0]
+
+
+def _iter_mapped_lines(mm: mmap.mmap) -> t.Iterator[str]:
+    """Yield the decoded lines of the mapped file that begin with a supported command."""
+    for raw in iter(mm.readline, b""):
+        if raw[:1] in _COMMAND_BYTES:
+            yield raw.decode().rstrip("\r\n")
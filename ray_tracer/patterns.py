@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import math
 import typing as t
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+
+import numpy as np
 
 from ray_tracer.colors import BLACK, WHITE
-from ray_tracer.rayple import Rayple, color
-from ray_tracer.transforms import Matrix
+from ray_tracer.rayple import POINT, Rayple, color
+from ray_tracer.rayple_batch import point_batch
+from ray_tracer.transforms import Matrix, ZERO_TOL
 
 if t.TYPE_CHECKING:
     from ray_tracer.shapes import Shape
@@ -20,21 +23,95 @@ class Pattern:
     Child classes must define `at_point` to calculate the pattern's color at the given point. This
     method assumes that the point has already been passed the appropriate transormations and is
     presented in pattern space.
+
+    Child classes may also define `at_points` to calculate the pattern's colors for an `Nx3` array
+    of pattern space points at once; otherwise, `at_point` is called for each point.
     """
 
     a: Rayple = WHITE
     b: Rayple = BLACK
     transform: Matrix = field(default_factory=Matrix.identity)
 
+    # Alternating patterns select their color by indexing with the parity of an integer, which
+    # avoids branching on every sample
+    _ab: tuple[Rayple, Rayple] = field(init=False, repr=False, compare=False)
+    # The pattern's transform is fixed at creation, so the shift into pattern space is specialized
+    # once rather than going through a Matrix * Rayple multiplication for every sample
+    _to_pattern: t.Callable[[Rayple], Rayple] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_ab", (self.a, self.b))
+        object.__setattr__(self, "_to_pattern", _specialize_point_transform(self.transform.inv()))
+
+    def __reduce__(self) -> tuple[type[Pattern], tuple[t.Any, ...]]:
+        # The specialized transform is a closure, which can't be pickled, so patterns are rebuilt
+        # from their init fields & the cached helpers are recreated by __post_init__
+        return type(self), tuple(getattr(self, f.name) for f in fields(self) if f.init)
+
     def at_point(self, pt: Rayple) -> Rayple:  # pragma: no cover  # noqa: D102
         raise NotImplementedError
 
     def at_object(self, obj: Shape, world_pt: Rayple) -> Rayple:
         """Apply the appropriate transformations to shift the query point into pattern space."""
         object_pt = obj.world_to_object(world_pt)
-        pattern_pt = self.transform.inv() * object_pt
+        return self.at_point(self._to_pattern(object_pt))
+
+    def at_points(self, pts: np.ndarray) -> np.ndarray:
+        """Calculate the pattern's colors for an `Nx3` array of pattern space points."""
+        colors = [self.at_point(Rayple(x, y, z, POINT)) for x, y, z in pts.tolist()]
+        return np.array([(c.x, c.y, c.z) for c in colors], dtype=float).reshape(-1, 3)
+
+    def at_object_batch(self, obj: Shape, world_pts: np.ndarray) -> np.ndarray:
+        """
+        Batched version of `at_object` for an `Nx3` array of world space points.
 
-        return self.at_point(pattern_pt)
+        The world to object and object to pattern space transformations are composed into a single
+        matrix, so the whole batch is shifted into pattern space with one matmul.
+        """
+        to_pattern = self.transform.inv() * obj.world_to_object_matrix()
+        pattern_pts = point_batch(world_pts).transform(to_pattern)
+
+        return self.at_points(pattern_pts.xyz).reshape(-1, 3)
+
+    def _select(self, mask: np.ndarray) -> np.ndarray:
+        """Choose `b` where the integer `mask` is odd and `a` where it is even."""
+        return np.where((mask & 1).astype(bool)[:, np.newaxis], (*self.b,), (*self.a,))
+
+
+def _specialize_point_transform(t_matrix: Matrix) -> t.Callable[[Rayple], Rayple]:
+    """
+    Build a function applying the provided affine transformation to a point.
+
+    The matrix coefficients are bound into the returned closure as plain floats, so each call is
+    straight scalar arithmetic. Identity transforms pass the point through unchanged.
+    """
+    if np.array_equal(t_matrix.matrix, np.identity(4)):
+        return _passthrough
+
+    (m00, m01, m02, m03), (m10, m11, m12, m13), (m20, m21, m22, m23), _ = t_matrix.matrix.tolist()
+
+    def transform_point(pt: Rayple) -> Rayple:
+        x = pt.x
+        y = pt.y
+        z = pt.z
+        px = m00 * x + m01 * y + m02 * z + m03
+        py = m10 * x + m11 * y + m12 * z + m13
+        pz = m20 * x + m21 * y + m22 * z + m23
+
+        # Snap floating point noise to zero the same way as Matrix * Rayple, since patterns floor
+        # their coordinates & e.g. -1e-17 would land on the wrong side of a stripe boundary
+        return Rayple(
+            px if abs(px) >= ZERO_TOL else 0,
+            py if abs(py) >= ZERO_TOL else 0,
+            pz if abs(pz) >= ZERO_TOL else 0,
+            POINT,
+        )
+
+    return transform_point
+
+
+def _passthrough(pt: Rayple) -> Rayple:  # noqa: D103
+    return pt
 
 
 @dataclass(frozen=True, slots=True)
@@ -42,10 +119,10 @@ class Stripe(Pattern):
     """Alternating color pattern along the x-axis."""
 
     def at_point(self, pt: Rayple) -> Rayple:  # noqa: D102
-        if math.floor(pt.x) % 2 == 0:
-            return self.a
-        else:
-            return self.b
+        return self._ab[math.floor(pt.x) & 1]
+
+    def at_points(self, pts: np.ndarray) -> np.ndarray:  # noqa: D102
+        return self._select(np.floor(pts[:, 0]).astype(np.int64))
 
 
 @dataclass(frozen=True, slots=True)
@@ -59,16 +136,25 @@ class Gradient(Pattern):
 
         return self.a + distance * fractional
 
+    def at_points(self, pts: np.ndarray) -> np.ndarray:  # noqa: D102
+        a = np.array((*self.a,))
+        distance = np.array((*self.b,)) - a
+        fractional = pts[:, 0] - np.floor(pts[:, 0])
+
+        return a + distance * fractional[:, np.newaxis]
+
 
 @dataclass(frozen=True, slots=True)
 class Ring(Pattern):
     """Alternating color pattern in concentric rings around the y-axis."""
 
     def at_point(self, pt: Rayple) -> Rayple:  # noqa: D102
-        if math.floor(math.sqrt(pt.x**2 + pt.z**2)) % 2 == 0:
-            return self.a
-        else:
-            return self.b
+        return self._ab[math.floor(math.sqrt(pt.x * pt.x + pt.z * pt.z)) & 1]
+
+    def at_points(self, pts: np.ndarray) -> np.ndarray:  # noqa: D102
+        xs = pts[:, 0]
+        zs = pts[:, 2]
+        return self._select(np.floor(np.sqrt(xs * xs + zs * zs)).astype(np.int64))
 
 
 @dataclass(frozen=True, slots=True)
@@ -76,10 +162,10 @@ class Checker(Pattern):
     """Repeating pattern of squares in 3 dimensions."""
 
     def at_point(self, pt: Rayple) -> Rayple:  # noqa: D102
-        if sum(math.floor(n) for n in pt) % 2 == 0:
-            return self.a
-        else:
-            return self.b
+        return self._ab[(math.floor(pt.x) + math.floor(pt.y) + math.floor(pt.z)) & 1]
+
+    def at_points(self, pts: np.ndarray) -> np.ndarray:  # noqa: D102
+        return self._select(np.floor(pts).astype(np.int64).sum(axis=1))
 
 
 @dataclass(frozen=True, slots=True)
@@ -87,4 +173,4 @@ class _TestPattern(Pattern):
     """For testing purposes only; color based on XYZ components."""
 
     def at_point(self, pt: Rayple) -> Rayple:  # noqa: D102
-        return color(*pt)
+        return color(pt.x, pt.y, pt.z)
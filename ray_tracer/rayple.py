@@ -3,20 +3,27 @@ from __future__ import annotations
 import math
 import typing as t
 from dataclasses import dataclass
-from enum import IntEnum
 
 import numpy as np
 
 from ray_tracer import EPSILON, NUMERIC_T
 
+# Rayple types are stored as plain integers rather than enum members since they're checked by
+# nearly every Rayple operation, and comparing against an IntEnum is much slower than a raw int
+VECTOR = 0
+POINT = 1
+COLOR = 2
 
-class RaypleType(IntEnum):  # noqa: D101
-    VECTOR = 0
-    POINT = 1
-    COLOR = 2
 
+class RaypleType:
+    """Namespace of the integer `Rayple` type constants, retained for external callers."""
 
-@dataclass(frozen=True, slots=True)
+    VECTOR = VECTOR
+    POINT = POINT
+    COLOR = COLOR
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class Rayple:
     """
     The Ray Tracer's generic ordered list of (x,y,z) things, classified by `Rayple.w`.
@@ -34,6 +41,9 @@ class Rayple:
             * Colors may only be subtracted from Colors
         * Negation
 
+    Undefined additions & subtractions raise a `TypeError`, including any mix of a Color with a
+    non-Color in either order (e.g. `vector + color`).
+
     The following operations are supported for Vectors and Colors:
         * Scalar multiplication
         * Scalar division
@@ -51,98 +61,80 @@ class Rayple:
     x: NUMERIC_T
     y: NUMERIC_T
     z: NUMERIC_T
-    w: RaypleType | int
+    w: int
+
+    def __init__(self, x: NUMERIC_T, y: NUMERIC_T, z: NUMERIC_T, w: int) -> None:
+        # Rayples are created constantly while rendering, so skip the frozen dataclass __init__,
+        # which routes every field through object.__setattr__, and fill the slots directly
+        _set_x(self, x)
+        _set_y(self, y)
+        _set_z(self, z)
+        _set_w(self, w)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Rayple):
             return NotImplemented
 
-        return all(
-            (
-                self.w == other.w,
-                math.isclose(self.x, other.x, abs_tol=EPSILON),
-                math.isclose(self.y, other.y, abs_tol=EPSILON),
-                math.isclose(self.z, other.z, abs_tol=EPSILON),
-            )
+        # Check the type first since it's the cheapest comparison, then bail on the first mismatch
+        # Folding the components into a single max() comparison is ~2x slower here since it gives
+        # up the short circuit & adds a builtin call; see RaypleBatch.isclose for the batched form
+        # The exact check comes first so matching infinite components (e.g. from a BoundingBox)
+        # compare equal, since inf - inf is nan. Unlike math.isclose, no relative tolerance is used
+        return (
+            self.w == other.w
+            and (self.x == other.x or abs(self.x - other.x) <= EPSILON)
+            and (self.y == other.y or abs(self.y - other.y) <= EPSILON)
+            and (self.z == other.z or abs(self.z - other.z) <= EPSILON)
         )
 
     def __add__(self, other: object) -> Rayple:
         if not isinstance(other, Rayple):
             return NotImplemented
 
-        if self.w == RaypleType.POINT and other.w == RaypleType.POINT:
+        if self.w == POINT and other.w == POINT:
             raise TypeError("Cannot add two Points.")
 
-        if self.w == RaypleType.COLOR and other.w != RaypleType.COLOR:
-            raise TypeError("Cannot add non-Color to Color.")
-
-        # Colors break our clever enum addition logic so we have to calc separately
-        if self.w == RaypleType.COLOR:
-            out_type = RaypleType.COLOR
-        else:
-            out_type = RaypleType(self.w + other.w)
+        if (self.w == COLOR) != (other.w == COLOR):
+            raise TypeError("Colors may only be added to Colors.")
 
-        return Rayple(
-            x=self.x + other.x,
-            y=self.y + other.y,
-            z=self.z + other.z,
-            w=out_type,
-        )
+        # Colors break our clever type addition logic, but otherwise the sum of the types is the
+        # output type (Vector + Vector = Vector, Point + Vector = Point)
+        out_type = COLOR if self.w == COLOR else self.w + other.w
+        return Rayple(self.x + other.x, self.y + other.y, self.z + other.z, out_type)
 
     def __sub__(self, other: object) -> Rayple:
         if not isinstance(other, Rayple):
             return NotImplemented
 
-        if self.w == RaypleType.VECTOR and other.w == RaypleType.POINT:
+        if self.w == VECTOR and other.w == POINT:
             raise TypeError("Cannot subtract a Point from a Vector.")
 
-        if self.w == RaypleType.COLOR and other.w != RaypleType.COLOR:
-            raise TypeError("Cannot subtract non-Color from Color.")
-
-        # Colors break our clever enum subtraction logic so we have to calc separately
-        if self.w == RaypleType.COLOR:
-            out_type = RaypleType.COLOR
-        else:
-            out_type = RaypleType(self.w - other.w)
+        if (self.w == COLOR) != (other.w == COLOR):
+            raise TypeError("Colors may only be subtracted from Colors.")
 
-        return Rayple(
-            x=self.x - other.x,
-            y=self.y - other.y,
-            z=self.z - other.z,
-            w=out_type,
-        )
+        # Colors break our clever type subtraction logic, but otherwise the difference of the types
+        # is the output type (Point - Point = Vector, Point - Vector = Point)
+        out_type = COLOR if self.w == COLOR else self.w - other.w
+        return Rayple(self.x - other.x, self.y - other.y, self.z - other.z, out_type)
 
     def __neg__(self) -> Rayple:
-        return Rayple(
-            x=-self.x,
-            y=-self.y,
-            z=-self.z,
-            w=self.w,
-        )
+        return Rayple(-self.x, -self.y, -self.z, self.w)
 
     def __mul__(self, other: object) -> Rayple:
+        # Scalar multiplication is by far the most common, so check for it first; each case is only
+        # type checked once before going straight to the math
+        if isinstance(other, (int, float)):
+            return Rayple(self.x * other, self.y * other, self.z * other, self.w)
+
         if isinstance(other, Rayple):
-            if self.w != RaypleType.COLOR or other.w != RaypleType.COLOR:
+            if self.w != COLOR or other.w != COLOR:
                 raise TypeError(
                     f"Nonscalar multiplication only supported between Colors. Received: {self.w} and {other.w}."  # noqa: E501
                 )
-        elif not isinstance(other, (int, float)):
-            return NotImplemented
 
-        if isinstance(other, Rayple):
-            return Rayple(
-                x=self.x * other.x,
-                y=self.y * other.y,
-                z=self.z * other.z,
-                w=self.w,
-            )
-        else:
-            return Rayple(
-                x=self.x * other,
-                y=self.y * other,
-                z=self.z * other,
-                w=self.w,
-            )
+            return Rayple(self.x * other.x, self.y * other.y, self.z * other.z, self.w)
+
+        return NotImplemented
 
     def __rmul__(self, other: object) -> Rayple:
         return self * other
@@ -151,18 +143,13 @@ class Rayple:
         if not isinstance(other, (int, float)):
             return NotImplemented
 
-        return Rayple(
-            x=self.x / other,
-            y=self.y / other,
-            z=self.z / other,
-            w=self.w,
-        )
+        return Rayple(self.x / other, self.y / other, self.z / other, self.w)
 
     def __abs__(self) -> float:
-        if self.w != RaypleType.VECTOR:
+        if self.w != VECTOR:
             raise TypeError("Cannot calculate the magnitude of a non-Vector.")
 
-        return math.sqrt(self.x**2 + self.y**2 + self.z**2)
+        return math.hypot(self.x, self.y, self.z)
 
     def __iter__(self) -> t.Generator[NUMERIC_T, None, None]:
         yield self.x
@@ -171,25 +158,26 @@ class Rayple:
 
     def normalize(self) -> Rayple:
         """Normalize into a unit Vector."""
-        if self.w != RaypleType.VECTOR:
+        if self.w != VECTOR:
             raise TypeError("Cannot normalize a non-Vector.")
 
-        return Rayple(
-            x=self.x / abs(self),
-            y=self.y / abs(self),
-            z=self.z / abs(self),
-            w=self.w,
-        )
+        # Calculate the magnitude once & scale by its reciprocal rather than dividing each component
+        inv_mag = 1 / math.hypot(self.x, self.y, self.z)
+        return Rayple(self.x * inv_mag, self.y * inv_mag, self.z * inv_mag, self.w)
 
     def reflect(self, normal: Rayple) -> Rayple:
         """Calculate the reflected vector."""
-        if self.w != RaypleType.VECTOR:
+        if self.w != VECTOR:
             raise ValueError("Cannot reflect a non-vector.")
 
-        if normal.w != RaypleType.VECTOR:
+        if normal.w != VECTOR:
             raise ValueError("Normal must be a vector.")
 
-        return self - (normal * 2 * dot(self, normal))
+        # Work on the components directly rather than building the scaled normal as its own Rayple
+        scale = 2 * (self.x * normal.x + self.y * normal.y + self.z * normal.z)
+        return Rayple(
+            self.x - normal.x * scale, self.y - normal.y * scale, self.z - normal.z * scale, VECTOR
+        )
 
     def as_array(self) -> np.ndarray:
         """Provide the `Rayple` as a `1x4` array."""
@@ -207,13 +195,20 @@ class Rayple:
         return Rayple(x, y, z, w)
 
 
+# Slot setters for the frozen Rayple, since the dataclass's own attribute setting is blocked
+_set_x = Rayple.x.__set__  # type: ignore[attr-defined]
+_set_y = Rayple.y.__set__  # type: ignore[attr-defined]
+_set_z = Rayple.z.__set__  # type: ignore[attr-defined]
+_set_w = Rayple.w.__set__  # type: ignore[attr-defined]
+
+
 def dot(left: Rayple, right: Rayple) -> NUMERIC_T:
     """
     Calculate the dot product of two Vectors.
 
     See: https://en.wikipedia.org/wiki/Dot_product
     """
-    if not (left.w == RaypleType.VECTOR and right.w == RaypleType.VECTOR):
+    if not (left.w == VECTOR and right.w == VECTOR):
         raise ValueError(f"Both operands must be vectors. Received: {left.w} and {right.w}.")
 
     return (left.x * right.x) + (left.y * right.y) + (left.z * right.z)
@@ -225,39 +220,39 @@ def cross(left: Rayple, right: Rayple) -> Rayple:
 
     See: https://en.wikipedia.org/wiki/Cross_product
     """
-    if not (left.w == RaypleType.VECTOR and right.w == RaypleType.VECTOR):
+    if not (left.w == VECTOR and right.w == VECTOR):
         raise ValueError(f"Both operands must be vectors. Received: {left.w} and {right.w}.")
 
     return Rayple(
         x=(left.y * right.z - left.z * right.y),
         y=(left.z * right.x - left.x * right.z),
         z=(left.x * right.y - left.y * right.x),
-        w=RaypleType.VECTOR,
+        w=VECTOR,
     )
 
 
 def point(x: NUMERIC_T, y: NUMERIC_T, z: NUMERIC_T) -> Rayple:
     """Shortcut for a Point `Rayple` (`w = 1`)."""
-    return Rayple(x, y, z, RaypleType.POINT)
+    return Rayple(x, y, z, POINT)
 
 
 def vector(x: NUMERIC_T, y: NUMERIC_T, z: NUMERIC_T) -> Rayple:
     """Shortcut for a Vector `Rayple` (`w = 0`)."""
-    return Rayple(x, y, z, RaypleType.VECTOR)
+    return Rayple(x, y, z, VECTOR)
 
 
 def color(red: NUMERIC_T, green: NUMERIC_T, blue: NUMERIC_T) -> Rayple:
     """Shortcut for a Color `Rayple` (`w = 2`)."""
-    return Rayple(red, green, blue, RaypleType.COLOR)
+    return Rayple(red, green, blue, COLOR)
 
 
 def is_point(inp: Rayple) -> bool:  # noqa: D103
-    return inp.w == RaypleType.POINT
+    return inp.w == POINT
 
 
 def is_vector(inp: Rayple) -> bool:  # noqa: D103
-    return inp.w == RaypleType.VECTOR
+    return inp.w == VECTOR
 
 
 def is_color(inp: Rayple) -> bool:  # noqa: D103
-    return inp.w == RaypleType.COLOR
+    return inp.w == COLOR
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import typing as t
+from dataclasses import dataclass
+
+import numpy as np
+
+from ray_tracer import EPSILON
+from ray_tracer.rayple import COLOR, POINT, Rayple, VECTOR
+from ray_tracer.transforms import Matrix
+
+
+@dataclass(frozen=True, slots=True)
+class RaypleBatch:
+    """
+    A batch of `Rayple`s of the same type, stored as an `Nx3` array of their `(x, y, z)` components.
+
+    Operations are applied to the entire batch at once with NumPy, so the per-element Python
+    dispatch and allocation of a `Rayple` is only paid once per batch rather than once per element.
+    Batches follow the same typing rules as `Rayple`, e.g. adding two batches of Points is
+    undefined.
+
+    Indexing or iterating over a `RaypleBatch` yields scalar `Rayple` instances for legacy callers.
+    """
+
+    xyz: np.ndarray
+    w: int
+
+    def __post_init__(self) -> None:
+        if self.xyz.ndim != 2 or self.xyz.shape[1] != 3:
+            raise ValueError(f"Components must be an Nx3 array, received: {self.xyz.shape}")
+
+    def __len__(self) -> int:
+        return len(self.xyz)
+
+    def __getitem__(self, idx: int) -> Rayple:
+        x, y, z = self.xyz[idx].tolist()
+        return Rayple(x, y, z, self.w)
+
+    def __iter__(self) -> t.Generator[Rayple, None, None]:
+        for x, y, z in self.xyz.tolist():
+            yield Rayple(x, y, z, self.w)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RaypleBatch):
+            return NotImplemented
+
+        return self.xyz.shape == other.xyz.shape and bool(self.isclose(other).all())
+
+    def __add__(self, other: object) -> RaypleBatch:
+        if not isinstance(other, RaypleBatch):
+            return NotImplemented
+
+        if self.w == POINT and other.w == POINT:
+            raise TypeError("Cannot add two Points.")
+
+        if (self.w == COLOR) != (other.w == COLOR):
+            raise TypeError("Colors may only be added to Colors.")
+
+        out_type = COLOR if self.w == COLOR else self.w + other.w
+        return RaypleBatch(self.xyz + other.xyz, out_type)
+
+    def __sub__(self, other: object) -> RaypleBatch:
+        if not isinstance(other, RaypleBatch):
+            return NotImplemented
+
+        if self.w == VECTOR and other.w == POINT:
+            raise TypeError("Cannot subtract a Point from a Vector.")
+
+        if (self.w == COLOR) != (other.w == COLOR):
+            raise TypeError("Colors may only be subtracted from Colors.")
+
+        out_type = COLOR if self.w == COLOR else self.w - other.w
+        return RaypleBatch(self.xyz - other.xyz, out_type)
+
+    def __neg__(self) -> RaypleBatch:
+        return RaypleBatch(-self.xyz, self.w)
+
+    def __mul__(self, other: object) -> RaypleBatch:
+        if isinstance(other, RaypleBatch):
+            if self.w != COLOR or other.w != COLOR:
+                raise TypeError(
+                    f"Nonscalar multiplication only supported between Colors. Received: {self.w} and {other.w}."  # noqa: E501
+                )
+
+            return RaypleBatch(self.xyz * other.xyz, self.w)
+        elif isinstance(other, (int, float)):
+            return RaypleBatch(self.xyz * other, self.w)
+        elif isinstance(other, np.ndarray) and other.ndim == 1:
+            # Scale each element by its own factor
+            return RaypleBatch(self.xyz * other[:, np.newaxis], self.w)
+        else:
+            return NotImplemented
+
+    def __rmul__(self, other: object) -> RaypleBatch:
+        return self * other
+
+    def __truediv__(self, other: object) -> RaypleBatch:
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+
+        return RaypleBatch(self.xyz / other, self.w)
+
+    def isclose(self, other: RaypleBatch) -> np.ndarray:
+        """
+        Compare the batches element-wise, using the same tolerance as `Rayple` equality.
+
+        As with `Rayple`, components are checked for an exact match first so matching infinite
+        components compare equal, since `inf - inf` is `nan`.
+        """
+        if self.w != other.w:
+            return np.zeros(len(self.xyz), dtype=bool)
+
+        with np.errstate(invalid="ignore"):
+            close = (self.xyz == other.xyz) | (np.abs(self.xyz - other.xyz) <= EPSILON)
+
+        return close.all(axis=1)
+
+    def magnitude(self) -> np.ndarray:
+        """Calculate the magnitude of each Vector in the batch."""
+        if self.w != VECTOR:
+            raise TypeError("Cannot calculate the magnitude of a non-Vector.")
+
+        return np.sqrt(np.einsum("ij,ij->i", self.xyz, self.xyz))
+
+    def normalize(self) -> RaypleBatch:
+        """Normalize each element into a unit Vector."""
+        return RaypleBatch(self.xyz / self.magnitude()[:, np.newaxis], VECTOR)
+
+    def as_array(self) -> np.ndarray:
+        """Provide the batch as an `Nx4` array of homogeneous `(x, y, z, w)` rows."""
+        return np.column_stack((self.xyz, np.full(len(self.xyz), self.w)))
+
+    def transform(self, t_matrix: Matrix) -> RaypleBatch:
+        """Apply the provided transformation to every element of the batch with a single matmul."""
+        # Rows are transformed by right-multiplying by the transpose, which is equivalent to
+        # left-multiplying each column vector by the matrix
+        transformed = self.as_array() @ t_matrix.matrix.T
+        return RaypleBatch(transformed[:, :3], self.w)
+
+    @classmethod
+    def from_rayples(cls, rayples: t.Sequence[Rayple]) -> RaypleBatch:
+        """Pack a non-empty sequence of `Rayple`s of the same type into a batch."""
+        if not rayples:
+            raise ValueError("Cannot build a batch from an empty sequence.")
+
+        w = rayples[0].w
+        if any(r.w != w for r in rayples):
+            raise ValueError("All Rayples in a batch must be of the same type.")
+
+        return cls(np.array([(r.x, r.y, r.z) for r in rayples], dtype=float), w)
+
+
+def dot_batch(left: RaypleBatch, right: RaypleBatch) -> np.ndarray:
+    """Calculate the row-wise dot products of two batches of Vectors."""
+    if not (left.w == VECTOR and right.w == VECTOR):
+        raise ValueError(f"Both operands must be vectors. Received: {left.w} and {right.w}.")
+
+    return np.einsum("ij,ij->i", left.xyz, right.xyz)
+
+
+def cross_batch(left: RaypleBatch, right: RaypleBatch) -> RaypleBatch:
+    """Calculate the row-wise cross products of two batches of Vectors."""
+    if not (left.w == VECTOR and right.w == VECTOR):
+        raise ValueError(f"Both operands must be vectors. Received: {left.w} and {right.w}.")
+
+    return RaypleBatch(np.cross(left.xyz, right.xyz), VECTOR)
+
+
+def point_batch(xyz: np.ndarray) -> RaypleBatch:
+    """Shortcut for a batch of Points from an `Nx3` array."""
+    return RaypleBatch(np.asarray(xyz, dtype=float), POINT)
+
+
+def vector_batch(xyz: np.ndarray) -> RaypleBatch:
+    """Shortcut for a batch of Vectors from an `Nx3` array."""
+    return RaypleBatch(np.asarray(xyz, dtype=float), VECTOR)
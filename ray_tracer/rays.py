@@ -3,8 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from ray_tracer import NUMERIC_T
-from ray_tracer.rayple import Rayple, RaypleType
-from ray_tracer.transforms import Matrix
+from ray_tracer.rayple import POINT, Rayple, VECTOR
+from ray_tracer.transforms import Matrix, ZERO_TOL
 
 
 @dataclass(frozen=True, slots=True)
@@ -13,10 +13,10 @@ class Ray:  # noqa: D101
     direction: Rayple
 
     def __post_init__(self) -> None:
-        if self.origin.w != RaypleType.POINT:
+        if self.origin.w != POINT:
             raise ValueError("Ray origin must be a point")
 
-        if self.direction.w != RaypleType.VECTOR:
+        if self.direction.w != VECTOR:
             raise ValueError("Ray direction must be a vector")
 
     def position(self, t: NUMERIC_T) -> Rayple:
@@ -30,7 +30,32 @@ class Ray:  # noqa: D101
         The transformation is applied to both the origin and direction of the current ray; note that
         the direction vector is not normalized after the transformation is applied.
         """
-        new_origin = t_matrix * self.origin
-        new_direction = t_matrix * self.direction
-
-        return Ray(new_origin, new_direction)
+        # A single ray is too small to benefit from NumPy, so both the origin & direction are
+        # transformed with scalar math on the matrix rows. Rays are only subject to affine
+        # transformations, so the bottom row is skipped & the origin's w component is always 1.
+        (m00, m01, m02, m03), (m10, m11, m12, m13), (m20, m21, m22, m23), _ = t_matrix.rows()
+        origin, direction = self.origin, self.direction
+        ox, oy, oz = origin.x, origin.y, origin.z
+        dx, dy, dz = direction.x, direction.y, direction.z
+
+        tox = m00 * ox + m01 * oy + m02 * oz + m03
+        toy = m10 * ox + m11 * oy + m12 * oz + m13
+        toz = m20 * ox + m21 * oy + m22 * oz + m23
+        tdx = m00 * dx + m01 * dy + m02 * dz
+        tdy = m10 * dx + m11 * dy + m12 * dz
+        tdz = m20 * dx + m21 * dy + m22 * dz
+
+        return Ray(
+            Rayple(
+                tox if abs(tox) >= ZERO_TOL else 0,
+                toy if abs(toy) >= ZERO_TOL else 0,
+                toz if abs(toz) >= ZERO_TOL else 0,
+                POINT,
+            ),
+            Rayple(
+                tdx if abs(tdx) >= ZERO_TOL else 0,
+                tdy if abs(tdy) >= ZERO_TOL else 0,
+                tdz if abs(tdz) >= ZERO_TOL else 0,
+                VECTOR,
+            ),
+        )
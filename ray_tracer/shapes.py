@@ -1,14 +1,161 @@
 from __future__ import annotations
 
 import math
+import typing as t
 from dataclasses import dataclass, field
 
+import numpy as np
+import numpy.typing as npt
+
 from ray_tracer import EPSILON, NUMERIC_T
-from ray_tracer.intersections import Intersection, Intersections
+from ray_tracer.bounds import BoundingBox
+from ray_tracer.bvh import BVHNode, build_bvh
+from ray_tracer.intersections import Intersection, Intersections, empty_intersections
 from ray_tracer.materials import Material
-from ray_tracer.rayple import Rayple, RaypleType, cross, dot, point, vector
+from ray_tracer.rayple import POINT, Rayple, VECTOR, cross, dot, vector
 from ray_tracer.rays import Ray
-from ray_tracer.transforms import Matrix
+from ray_tracer.transforms import IDENTITY, Matrix
+
+_Row3 = tuple[float, float, float]
+_Rows3x3 = tuple[_Row3, _Row3, _Row3]
+
+# Rayples are immutable, so the constant normals can be shared rather than allocated per query
+_UP = vector(0, 1, 0)
+_DOWN = vector(0, -1, 0)
+
+# Bound at module level so the kernels below skip the attribute lookup on every call
+_sqrt = math.sqrt
+
+
+# Intersection kernels operate on plain floats rather than Rayples so the hot arithmetic is free of
+# attribute lookups & intermediate allocations; shapes unpack their rays once & only construct
+# `Intersection` instances for hits.
+# The quadratics are solved using half of the linear coefficient, which cancels the factors of 2 &
+# 4 from the usual form of the quadratic formula.
+def _quadratic_roots(a: float, half_b: float, c: float) -> tuple[float, float, bool]:
+    """
+    Solve `a*t^2 + 2*half_b*t + c = 0`, returning the ordered roots & whether any real roots exist.
+
+    If there are no real roots then both returned times are `NaN`.
+    """
+    disc = half_b * half_b - a * c
+    if disc < 0:
+        return math.nan, math.nan, False
+
+    sqrt_disc = _sqrt(disc)
+    t0 = (-half_b - sqrt_disc) / a
+    t1 = (-half_b + sqrt_disc) / a
+    if t0 > t1:
+        return t1, t0, True
+
+    return t0, t1, True
+
+
+def _sphere_hit(
+    ox: float, oy: float, oz: float, dx: float, dy: float, dz: float
+) -> tuple[float, float, bool]:
+    """
+    Calculate the intersection times of the ray `o + t*d` with the unit sphere.
+
+    Since the sphere is centered at the origin, the sphere-to-ray vector is just the ray's origin.
+    If the ray misses then both returned times are `NaN`.
+    """
+    a = dx * dx + dy * dy + dz * dz
+    half_b = dx * ox + dy * oy + dz * oz
+    c = ox * ox + oy * oy + oz * oz - 1
+    discriminant = half_b * half_b - a * c
+    if discriminant < 0:
+        return math.nan, math.nan, False
+
+    sqrt_disc = _sqrt(discriminant)
+    return (-half_b - sqrt_disc) / a, (-half_b + sqrt_disc) / a, True
+
+
+def _cube_hit(
+    ox: float, oy: float, oz: float, dx: float, dy: float, dz: float
+) -> tuple[float, float, bool]:
+    """
+    Calculate the entry & exit times of the ray `o + t*d` with the unit cube.
+
+    Each pair of parallel faces will have a minimum t closest to the ray origin, and a maximum t
+    farther away; the cube is hit if the largest of these minimum t values is no larger than the
+    smallest of the maximum t values.
+
+    If the ray is parallel to a pair of faces then it's either always or never between them, which
+    is represented by infinite times of the appropriate sign rather than dividing by zero.
+    """
+    if abs(dx) >= EPSILON:
+        t_min, t_max = (-1 - ox) / dx, (1 - ox) / dx
+    else:
+        t_min, t_max = math.copysign(math.inf, -1 - ox), math.copysign(math.inf, 1 - ox)
+    if t_min > t_max:
+        t_min, t_max = t_max, t_min
+
+    if abs(dy) >= EPSILON:
+        t0, t1 = (-1 - oy) / dy, (1 - oy) / dy
+    else:
+        t0, t1 = math.copysign(math.inf, -1 - oy), math.copysign(math.inf, 1 - oy)
+    if t0 > t1:
+        t0, t1 = t1, t0
+    if t0 > t_min:
+        t_min = t0
+    if t1 < t_max:
+        t_max = t1
+
+    if abs(dz) >= EPSILON:
+        t0, t1 = (-1 - oz) / dz, (1 - oz) / dz
+    else:
+        t0, t1 = math.copysign(math.inf, -1 - oz), math.copysign(math.inf, 1 - oz)
+    if t0 > t1:
+        t0, t1 = t1, t0
+    if t0 > t_min:
+        t_min = t0
+    if t1 < t_max:
+        t_max = t1
+
+    return t_min, t_max, t_min <= t_max
+
+
+def _caps_hit(
+    ox: float,
+    oy: float,
+    oz: float,
+    dx: float,
+    dy: float,
+    dz: float,
+    y_min: float,
+    y_max: float,
+    r2_min: float,
+    r2_max: float,
+) -> tuple[float, ...]:
+    """
+    Calculate the times where the ray `o + t*d` passes through the caps of a y-axis aligned solid.
+
+    The caps lie in the planes `y = y_min` and `y = y_max`, and a cap is hit if the ray passes
+    within a squared distance of `r2_min` or `r2_max`, respectively, of the y-axis. Rays parallel
+    to the caps can't pass through them, so no times are returned.
+    """
+    if abs(dy) < EPSILON:
+        return ()
+
+    t_lo = (y_min - oy) / dy
+    x = ox + t_lo * dx
+    z = oz + t_lo * dz
+    hit_lo = (x * x + z * z) <= r2_min
+
+    t_hi = (y_max - oy) / dy
+    x = ox + t_hi * dx
+    z = oz + t_hi * dz
+    hit_hi = (x * x + z * z) <= r2_max
+
+    if hit_lo and hit_hi:
+        return t_lo, t_hi
+    elif hit_lo:
+        return (t_lo,)
+    elif hit_hi:
+        return (t_hi,)
+    else:
+        return ()
 
 
 @dataclass(slots=True, eq=False)
@@ -18,21 +165,85 @@ class Shape:
 
     Child classes must define `_local_intersect` and `_local_normal_at` to calculate their
     respective local values, which are then transformed into world coordinates by the base methods.
+    Child classes must also define `bounds` to provide their object space bounding box.
 
     Shapes may be added to a `Group` instance, which will set the `Shape`'s `parent` attribute to
     the group instance. A `Shape` can only be a member of one `Group`; the `Group` instance does not
     check for any current membership before overwriting the `parent`.
 
     NOTE: Shapes are compared by object ID only, so no 2 instances will compare `True`.
+
+    NOTE: The inverse of the shape's `transform`, & the normal matrix derived from it, are
+    calculated on first use & cached until `transform` is reassigned. The same is true of the
+    parent space bounding box used to cull rays before they're intersected with the shape, so a
+    shape's geometry should not be changed once it has been intersected. Reassigning `transform`
+    also resets the cached hierarchy & bounds of any `Group` containing the shape.
     """
 
+    # Bumped whenever a shape's transform is reassigned or a group's children change, which lets
+    # anything caching the placement of shapes (e.g. a `World`'s BVH) tell that it's out of date
+    # with a single comparison
+    _revision: t.ClassVar[int] = 0
+
     transform: Matrix = field(default_factory=Matrix.identity)
     material: Material = Material()
     parent: Group | None = None
 
+    _inverses: tuple[Matrix, _Rows3x3] | None = field(default=None, init=False, repr=False)
+    _inverses_of: Matrix | None = field(default=None, init=False, repr=False)
+    _cull_bounds: BoundingBox | None = field(default=None, init=False, repr=False)
+    _cull_bounds_of: Matrix | None = field(default=None, init=False, repr=False)
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        object.__setattr__(self, name, value)
+
+        # Moving a shape changes the hierarchy & bounds of every group above it, so their caches
+        # need to be reset
+        if name == "transform":
+            try:
+                parent = self.parent
+            except AttributeError:
+                # The dataclass __init__ assigns transform before parent; a new shape can't have
+                # been cached by anything yet
+                return
+
+            Shape._revision += 1
+            if parent is not None:
+                parent._reset_descendants()
+
     def _local_intersect(self, local_ray: Ray) -> Intersections:  # pragma: no cover
         raise NotImplementedError
 
+    def _inverse_transforms(self) -> tuple[Matrix, _Rows3x3]:
+        """
+        Provide the inverse of the shape's `transform` along with the matrix used for normals.
+
+        The normal matrix is the upper left 3x3 submatrix of the inverse transpose, since normals
+        are unaffected by translation; it's provided as nested tuples of rows for scalar math.
+        """
+        inverses = self._inverses
+        if inverses is None or self._inverses_of is not self.transform:
+            inv = self.transform.inv()
+            normal_rows = tuple(tuple(row) for row in inv.matrix[:3, :3].T.tolist())
+            inverses = (inv, normal_rows)  # type: ignore[assignment]
+            self._inverses = inverses
+            self._inverses_of = self.transform
+
+        return inverses
+
+    def _culling_bounds(self) -> BoundingBox | None:
+        """
+        Provide the parent space bounding box used to reject rays before intersecting the shape.
+
+        Shapes with unbounded extents (e.g. `Plane`) can't be culled, so `None` is returned.
+        """
+        if self._cull_bounds_of is not self.transform:
+            box = self.parent_space_bounds()
+            self._cull_bounds = box if box.is_finite else None
+            self._cull_bounds_of = self.transform
+
+        return self._cull_bounds
+
     def intersect(self, ray: Ray) -> Intersections:
         """
         Calculate the time position(s) where the provided Ray intersects the shape.
@@ -43,9 +254,18 @@ class Shape:
         NOTE: Negative timesteps are considered, so if the ray originates inside or beyond the
         shape then negative value(s) can be returned.
         """
+        # A slab test against the bounding box is much cheaper than transforming the ray & solving
+        # for the intersections, so rays that can't hit the shape are rejected up front
+        bounds = self._culling_bounds()
+        if bounds is not None and not bounds.intersects(ray):
+            return empty_intersections()
+
         # Apply the inverse of the shape's transformation to the ray to account for the desired
-        # shape transformation
-        transformed_ray = ray.transform(self.transform.inv())
+        # shape transformation; untransformed shapes can use the ray as-is
+        if self.transform.kind == IDENTITY:
+            return self._local_intersect(ray)
+
+        transformed_ray = ray.transform(self._inverse_transforms()[0])
         return self._local_intersect(transformed_ray)
 
     def _local_normal_at(
@@ -53,6 +273,14 @@ class Shape:
     ) -> Rayple:  # pragma: no cover
         raise NotImplementedError
 
+    def bounds(self) -> BoundingBox:  # pragma: no cover
+        """Calculate the shape's axis-aligned bounding box in object space."""
+        raise NotImplementedError
+
+    def parent_space_bounds(self) -> BoundingBox:
+        """Calculate the shape's axis-aligned bounding box after its `transform` is applied."""
+        return self.bounds().transform(self.transform)
+
     def normal_at(self, query: Rayple, hit: Intersection) -> Rayple:
         """
         Calculate the normal vector from the shape at the provided surface point.
@@ -60,7 +288,7 @@ class Shape:
         `hit` is passed through to assist with normal interpolation for `SmoothTriangle`; it is
         unused otherwise.
         """
-        if query.w != RaypleType.POINT:
+        if query.w != POINT:
             raise ValueError("Query location must be a point.")
 
         # To account for transformations, we have to shift the query point from world space to the
@@ -71,24 +299,67 @@ class Shape:
         # Once we've shifted to object space to get the object normal, we need to shift this back to
         # the world space by transforming it with the inverse transpose of the sphere's
         # transformation matrix
-        # Technically, we should be finding the 3x3 submatrix of the transform in order to prevent
-        # any translation from messing with the rayple type; to get around this, we can just make a
-        # new vector from the components
         world_normal = self.normal_to_world(local_normal)
 
         return world_normal
 
+    def hit_and_normal(self, ray: Ray) -> tuple[Intersection, Rayple, Rayple] | None:
+        """
+        Calculate the world space `Ray`'s hit with the shape, along with the hit's surface point &
+        normal vector in world space.
+
+        This is equivalent to calling `intersect`, then `normal_at` for the hit, but the object
+        space ray is reused to locate the hit in object space rather than shifting the world space
+        point back through the shape's transformations. `None` is returned if there is no hit.
+
+        NOTE: Unlike `intersect`, the ray is expected to be in world space, so any parent
+        transformations are also applied.
+        """
+        transformed_ray = ray.transform(self.world_to_object_matrix())
+        inters = self._local_intersect(transformed_ray)
+        inters.sort()
+        hit = inters.hit
+        if hit is None:
+            return None
+
+        world_point = ray.position(hit.t)
+        if hit.obj is not self:
+            # Composite shapes (e.g. Group) report the child that was hit, which owns the normal
+            return hit, world_point, hit.obj.normal_at(world_point, hit)
+
+        local_normal = self._local_normal_at(transformed_ray.position(hit.t), hit)
+        return hit, world_point, self.normal_to_world(local_normal)
+
     def world_to_object(self, pt: Rayple) -> Rayple:
         """Take a point in world space and transform to object space, considering any parent."""
         if self.parent is not None:
             pt = self.parent.world_to_object(pt)
 
-        return self.transform.inv() * pt
+        if self.transform.kind == IDENTITY:
+            return pt
+
+        return self._inverse_transforms()[0] * pt
+
+    def world_to_object_matrix(self) -> Matrix:
+        """Compose the transformation from world space to object space, considering any parent."""
+        to_object = self._inverse_transforms()[0]
+        if self.parent is not None:
+            to_object = to_object * self.parent.world_to_object_matrix()
+
+        return to_object
 
     def normal_to_world(self, norm: Rayple) -> Rayple:
         """Take a normal in object space and transform to world space, considering any parent."""
-        norm = self.transform.inv().transpose() * norm
-        new_norm = vector(*norm).normalize()
+        # Only the 3x3 submatrix of the inverse transpose is used, so any translation can't leak
+        # into the result & it's always a vector
+        (n00, n01, n02), (n10, n11, n12), (n20, n21, n22) = self._inverse_transforms()[1]
+        x, y, z = norm.x, norm.y, norm.z
+        wx = n00 * x + n01 * y + n02 * z
+        wy = n10 * x + n11 * y + n12 * z
+        wz = n20 * x + n21 * y + n22 * z
+
+        mag = math.hypot(wx, wy, wz)
+        new_norm = Rayple(wx / mag, wy / mag, wz / mag, VECTOR)
 
         if self.parent is not None:
             new_norm = self.parent.normal_to_world(new_norm)
@@ -109,26 +380,187 @@ class Sphere(Shape):
     identical intersections.
     """
 
+    def intersect(self, ray: Ray) -> Intersections:
+        """
+        Calculate the time position(s) where the provided Ray intersects the sphere.
+
+        The exact hit test for a sphere is about as cheap as a bounding box test, so rather than
+        culling the ray first, it's moved into object space directly as plain floats & passed to
+        the intersection kernel without building an intermediate `Ray`.
+        """
+        origin, direction = ray.origin, ray.direction
+        ox, oy, oz = origin.x, origin.y, origin.z
+        dx, dy, dz = direction.x, direction.y, direction.z
+        if self.transform.kind != IDENTITY:
+            row_x, row_y, row_z, _ = self._inverse_transforms()[0].rows()
+            m00, m01, m02, m03 = row_x
+            m10, m11, m12, m13 = row_y
+            m20, m21, m22, m23 = row_z
+            ox, oy, oz = (
+                m00 * ox + m01 * oy + m02 * oz + m03,
+                m10 * ox + m11 * oy + m12 * oz + m13,
+                m20 * ox + m21 * oy + m22 * oz + m23,
+            )
+            dx, dy, dz = (
+                m00 * dx + m01 * dy + m02 * dz,
+                m10 * dx + m11 * dy + m12 * dz,
+                m20 * dx + m21 * dy + m22 * dz,
+            )
+
+        t0, t1, hit = _sphere_hit(ox, oy, oz, dx, dy, dz)
+        if not hit:
+            return empty_intersections()
+
+        return Intersections([Intersection(t0, self), Intersection(t1, self)])
+
     def _local_intersect(self, transformed_ray: Ray) -> Intersections:
-        # Calculate the discriminant to determine if there are any intersections
-        sphere_to_ray = transformed_ray.origin - point(0, 0, 0)
-        a = dot(transformed_ray.direction, transformed_ray.direction)
-        b = 2 * dot(transformed_ray.direction, sphere_to_ray)
-        c = dot(sphere_to_ray, sphere_to_ray) - 1
-        discriminant = b**2 - (4 * a * c)
-
-        if discriminant < 0:
-            intersections = []
-        else:
-            intersections = [
-                Intersection(((-b - math.sqrt(discriminant))) / (2 * a), self),
-                Intersection(((-b + math.sqrt(discriminant))) / (2 * a), self),
-            ]
+        origin, direction = transformed_ray.origin, transformed_ray.direction
+        t0, t1, hit = _sphere_hit(
+            origin.x, origin.y, origin.z, direction.x, direction.y, direction.z
+        )
+        if not hit:
+            return empty_intersections()
 
-        return Intersections(intersections)
+        return Intersections([Intersection(t0, self), Intersection(t1, self)])
 
     def _local_normal_at(self, local_point: Rayple, hit: Intersection) -> Rayple:
-        return local_point - point(0, 0, 0)
+        # The sphere is centered at the origin, so the normal is just the point's position vector
+        return Rayple(local_point.x, local_point.y, local_point.z, VECTOR)
+
+    def bounds(self) -> BoundingBox:  # noqa: D102
+        return BoundingBox(minimum=(-1, -1, -1), maximum=(1, 1, 1))
+
+    @staticmethod
+    def batch_local_intersect(
+        origins: np.ndarray, directions: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate the intersections of a batch of object space rays with the unit sphere.
+
+        Rays are provided as `Nx3` arrays of origins and directions, laid out so the discriminant
+        can be evaluated for every ray at once rather than one `Ray` at a time.
+
+        Returned are the nearer and farther intersection times, along with a boolean hit mask. Times
+        for rays that miss the sphere are `NaN`.
+
+        NOTE: Times are calculated in the precision of the provided arrays, e.g. `np.float32` rays
+        give `np.float32` times.
+        """
+        a = np.einsum("ij,ij->i", directions, directions)
+        half_b = np.einsum("ij,ij->i", directions, origins)
+        c = np.einsum("ij,ij->i", origins, origins) - 1
+        discriminant = half_b * half_b - a * c
+
+        # Every ray goes through the same arithmetic; rather than filtering out the misses, their
+        # square roots are left as NaN, which carries through to their times
+        hit_mask = discriminant >= 0
+        sqrt_disc = np.sqrt(
+            discriminant,
+            out=np.full(len(discriminant), np.nan, dtype=np.result_type(discriminant, np.float32)),
+            where=hit_mask,
+        )
+        neg_b = -half_b
+
+        return (neg_b - sqrt_disc) / a, (neg_b + sqrt_disc) / a, hit_mask
+
+    def batch_intersect(
+        self, origins: np.ndarray, directions: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate the intersections of a batch of world space rays with the sphere.
+
+        Rays are provided as `Nx3` arrays of origins and directions and are shifted into object
+        space, considering any parent, with a single matrix product before being intersected with
+        `batch_local_intersect`. Returned values are the same as `batch_local_intersect`; since the
+        transformation is affine, the intersection times are also valid in world space.
+
+        NOTE: The transformation is cast to the precision of the provided origins, so e.g.
+        `np.float32` rays aren't silently upcast by the matrix product.
+        """
+        dtype = np.result_type(origins, directions, np.float32)
+        to_object = self.world_to_object_matrix().matrix.astype(dtype, copy=False)
+        rot, offset = to_object[:3, :3], to_object[:3, 3]
+        return self.batch_local_intersect(origins @ rot.T + offset, directions @ rot.T)
+
+
+@dataclass(slots=True)
+class SphereBatch:
+    """
+    Structure of arrays representation of a collection of spheres, for broad phase hit testing.
+
+    The spheres' world to object space transformations are stacked so a ray can be moved into every
+    sphere's object space, and intersected with all of them, using a handful of vectorized
+    operations rather than one `Sphere.intersect` call per sphere. The rotation rows are grouped by
+    axis into a single `3Mx3` array, so the ray's origin & direction are moved into every sphere's
+    object space with one matrix product rather than `M` stacked 3x3 products.
+
+    Transformations are stored, and rays are intersected, using the provided `dtype`. Single
+    precision halves the memory traffic of the broad phase, but its times are only good to roughly
+    `1e-7` relative, which is close to `EPSILON` at typical scene scales, so double precision is
+    the default.
+
+    NOTE: Transformations are captured when the batch is created; changes to a sphere's
+    `transform`, or to the transform of any of its parent groups, are not detected.
+    """
+
+    spheres: list[Sphere]
+    dtype: npt.DTypeLike = np.float64
+
+    _rot_rows: np.ndarray = field(init=False, repr=False)
+    _offset: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        to_object = np.array([s.world_to_object_matrix().matrix for s in self.spheres])
+        to_object = to_object.reshape(-1, 4, 4).astype(self.dtype)
+
+        # Row i * M + j is the ith row of the jth sphere's rotation, so the product with a vector
+        # reshapes into a 3xM array of each sphere's transformed x, y, & z components
+        rot_rows = to_object[:, :3, :3].transpose(1, 0, 2).reshape(-1, 3)
+        self._rot_rows = np.ascontiguousarray(rot_rows)
+        self._offset = np.ascontiguousarray(to_object[:, :3, 3].T)
+
+    def __len__(self) -> int:
+        return len(self.spheres)
+
+    def intersect_all(
+        self, origin: npt.ArrayLike, direction: npt.ArrayLike
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate the intersections of a single world space ray with every sphere in the batch.
+
+        The ray is provided as its `(x, y, z)` origin & direction components. Returned are the
+        intersection times & the indices of the corresponding spheres in `spheres`, sorted by time.
+        As with `Sphere.intersect`, each sphere that is hit contributes two intersections.
+        """
+        # Transform the origin & direction together, as the two columns of a single 3x2 operand
+        ray_cols = np.array((origin, direction), dtype=self.dtype).T
+        transformed = (self._rot_rows @ ray_cols).reshape(3, -1, 2)
+        origins = transformed[:, :, 0] + self._offset
+        directions = transformed[:, :, 1]
+        t0, t1, hit_mask = Sphere.batch_local_intersect(origins.T, directions.T)
+
+        hit_ids = np.flatnonzero(hit_mask)
+        ts = np.concatenate((t0[hit_ids], t1[hit_ids]))
+        ids = np.concatenate((hit_ids, hit_ids))
+
+        order = np.argsort(ts, kind="stable")
+        return ts[order], ids[order]
+
+    def intersect(self, ray: Ray) -> Intersections:
+        """Calculate the `Ray`'s intersections with every sphere in the batch, sorted by time."""
+        # The components are handed over as plain tuples, since intersect_all packs them into a
+        # single array anyway
+        origin, direction = ray.origin, ray.direction
+        ts, ids = self.intersect_all(
+            (origin.x, origin.y, origin.z), (direction.x, direction.y, direction.z)
+        )
+
+        # The times are already sorted, so the collection is filled directly rather than being
+        # sorted again on creation
+        spheres = self.spheres
+        inters = empty_intersections()
+        inters.extend([Intersection(t, spheres[idx]) for t, idx in zip(ts.tolist(), ids.tolist())])
+        return inters
 
 
 @dataclass(slots=True, eq=False)
@@ -145,15 +577,19 @@ class Plane(Shape):
 
     def _local_intersect(self, transformed_ray: Ray) -> Intersections:
         # If the slope is zero then we're parallel/coplanar
-        if abs(transformed_ray.direction.y) < EPSILON:
-            return Intersections([])
+        dy = transformed_ray.direction.y
+        if abs(dy) < EPSILON:
+            return empty_intersections()
 
-        t = -transformed_ray.origin.y / transformed_ray.direction.y
+        t = -transformed_ray.origin.y / dy
         return Intersections([Intersection(t, self)])
 
     def _local_normal_at(self, local_point: Rayple, hit: Intersection) -> Rayple:
         # The normal of a plane is constant everywhere
-        return vector(0, 1, 0)
+        return _UP
+
+    def bounds(self) -> BoundingBox:  # noqa: D102
+        return BoundingBox(minimum=(-math.inf, 0, -math.inf), maximum=(math.inf, 0, math.inf))
 
 
 @dataclass(slots=True, eq=False)
@@ -172,65 +608,34 @@ class Cube(Shape):
         # function to consider these planes in parallel planes; if the cube is intersected then
         # there will be 4 points of intersection, and the intersection with the cube itself will be
         # the largest of the two closest points and the smallest of the two largest points.
-        xt_min, xt_max = self._check_axis(transformed_ray.origin.x, transformed_ray.direction.x)
-        yt_min, yt_max = self._check_axis(transformed_ray.origin.y, transformed_ray.direction.y)
-        zt_min, zt_max = self._check_axis(transformed_ray.origin.z, transformed_ray.direction.z)
-
-        t_min = max(xt_min, yt_min, zt_min)
-        t_max = min(xt_max, yt_max, zt_max)
+        origin, direction = transformed_ray.origin, transformed_ray.direction
+        t_min, t_max, hit = _cube_hit(
+            origin.x, origin.y, origin.z, direction.x, direction.y, direction.z
+        )
+        if not hit:
+            return empty_intersections()
 
-        if t_min > t_max:
-            return Intersections([])
-        else:
-            return Intersections([Intersection(t_min, self), Intersection(t_max, self)])
+        return Intersections([Intersection(t_min, self), Intersection(t_max, self)])
 
     def _local_normal_at(self, local_point: Rayple, hit: Intersection) -> Rayple:
         # We know which plane we're on because it has the component with the largest absolute value
         # In the ideal case it will be the component that equals 1, but we have floats so we can't
         # get by that easy
-        # Use a custom max loop so we can enforce that corners are on either the +x or -x faces
-        for i, comp in enumerate(local_point):
-            if i == 0:
-                max_c = abs(comp)
-                idx = 0
-                continue
-
-            if abs(comp) > max_c:
-                max_c = abs(comp)
-                idx = i
-
-        if idx == 0:
-            return vector(local_point.x, 0, 0)
-        elif idx == 1:
-            return vector(0, local_point.y, 0)
-        else:
-            return vector(0, 0, local_point.z)
-
-    @staticmethod
-    def _check_axis(origin: NUMERIC_T, direction: NUMERIC_T) -> tuple[NUMERIC_T, NUMERIC_T]:
-        """
-        Locate the plane-ray intersection times, if present.
-
-        Each pair of parallel lines will have a minimum t closest to the ray origin, and a maximum t
-        farther away; we want to consider the largest minimum t value and the smallest maximum t
-        value as the plane's intersection points.
-        """
-        t_min_numerator = -1 - origin
-        t_max_numerator = 1 - origin
-
-        if abs(direction) >= EPSILON:
-            t_min = t_min_numerator / direction
-            t_max = t_max_numerator / direction
+        # Check the components in order so corners are on either the +x or -x faces, and edges
+        # prefer x over y over z
+        x, y, z = local_point.x, local_point.y, local_point.z
+        abs_x, abs_y = abs(x), abs(y)
+        max_c = max(abs_x, abs_y, abs(z))
+
+        if abs_x == max_c:
+            return vector(x, 0, 0)
+        elif abs_y == max_c:
+            return vector(0, y, 0)
         else:
-            # If the denominator is 0, multiply by infinity rather than dividing by 0 so we retain
-            # the correct sign
-            t_min = t_min_numerator * math.inf
-            t_max = t_max_numerator * math.inf
+            return vector(0, 0, z)
 
-        if t_min > t_max:
-            t_min, t_max = t_max, t_min
-
-        return t_min, t_max
+    def bounds(self) -> BoundingBox:  # noqa: D102
+        return BoundingBox(minimum=(-1, -1, -1), maximum=(1, 1, 1))
 
 
 @dataclass(slots=True, eq=False)
@@ -254,77 +659,68 @@ class Cylinder(Shape):
     closed: bool = False
 
     def _local_intersect(self, transformed_ray: Ray) -> Intersections:
-        inters = Intersections([])
+        inters = empty_intersections()
+
+        origin, direction = transformed_ray.origin, transformed_ray.direction
+        ox, oy, oz = origin.x, origin.y, origin.z
+        dx, dy, dz = direction.x, direction.y, direction.z
 
-        a = transformed_ray.direction.x**2 + transformed_ray.direction.z**2
-        if math.isclose(a, 0):
+        a = dx * dx + dz * dz
+        if a == 0:
             # Ray is parallel to the y axis, check for cap intersections before returning
-            inters = self._intersect_caps(transformed_ray, inters)
+            inters = self._intersect_caps(inters, ox, oy, oz, dx, dy, dz)
             return inters
 
-        b = (
-            2 * transformed_ray.origin.x * transformed_ray.direction.x
-            + 2 * transformed_ray.origin.z * transformed_ray.direction.z
-        )
-        c = transformed_ray.origin.x**2 + transformed_ray.origin.z**2 - 1
-        disc = b**2 - 4 * a * c
-        if disc < 0:
+        t0, t1, hit = _quadratic_roots(a, ox * dx + oz * dz, ox * ox + oz * oz - 1)
+        if not hit:
             # Ray does not intersect the cylinder
             return inters
 
-        t0 = (-b - math.sqrt(disc)) / (2 * a)
-        t1 = (-b + math.sqrt(disc)) / (2 * a)
-        if t0 > t1:  # pragma: no branch
-            t0, t1 = t1, t0
-
-        y0 = transformed_ray.origin.y + t0 * transformed_ray.direction.y
-        if self.minimum < y0 < self.maximum:
+        y_min, y_max = self.minimum, self.maximum
+        if y_min < oy + t0 * dy < y_max:
             inters.append(Intersection(t0, self))
 
-        y1 = transformed_ray.origin.y + t1 * transformed_ray.direction.y
-        if self.minimum < y1 < self.maximum:
+        if y_min < oy + t1 * dy < y_max:
             inters.append(Intersection(t1, self))
 
-        inters = self._intersect_caps(transformed_ray, inters)
+        inters = self._intersect_caps(inters, ox, oy, oz, dx, dy, dz)
         return inters
 
-    @staticmethod
-    def _check_cap(transformed_ray: Ray, t: NUMERIC_T) -> bool:
-        """See if the intersection at `t` is within a radius of `1` from the y-axis."""
-        x = transformed_ray.origin.x + t * transformed_ray.direction.x
-        z = transformed_ray.origin.z + t * transformed_ray.direction.z
-
-        return (x**2 + z**2) <= 1
-
-    def _intersect_caps(self, transformed_ray: Ray, inters: Intersections) -> Intersections:
+    def _intersect_caps(
+        self,
+        inters: Intersections,
+        ox: float,
+        oy: float,
+        oz: float,
+        dx: float,
+        dy: float,
+        dz: float,
+    ) -> Intersections:
         """Check for any cap intersection(s) and add them to the `Intersections` collection."""
         if not self.closed:
             return inters
 
-        # Check lower cap intersection
-        t = (self.minimum - transformed_ray.origin.y) / transformed_ray.direction.y
-        if self._check_cap(transformed_ray, t):
-            inters.append(Intersection(t, self))
-
-        # Check upper cap intersection
-        t = (self.maximum - transformed_ray.origin.y) / transformed_ray.direction.y
-        if self._check_cap(transformed_ray, t):
-            inters.append(Intersection(t, self))
+        # Both caps have a radius of 1
+        for cap_t in _caps_hit(ox, oy, oz, dx, dy, dz, self.minimum, self.maximum, 1, 1):
+            inters.append(Intersection(cap_t, self))
 
         return inters
 
     def _local_normal_at(self, local_point: Rayple, hit: Intersection) -> Rayple:
         # If the point lies less than one unit from the y axis, and is within EPSILON of one of the
         # caps, then it must be on one of the caps
-        dist = local_point.x**2 + local_point.z**2
+        dist = local_point.x * local_point.x + local_point.z * local_point.z
         if dist < 1 and local_point.y >= (self.maximum - EPSILON):
-            return vector(0, 1, 0)
+            return _UP
         elif dist < 1 and local_point.y <= (self.minimum + EPSILON):
-            return vector(0, -1, 0)
+            return _DOWN
         else:
             # Otherwise, it's not on one of the caps
             return vector(local_point.x, 0, local_point.z)
 
+    def bounds(self) -> BoundingBox:  # noqa: D102
+        return BoundingBox(minimum=(-1, self.minimum, -1), maximum=(1, self.maximum, 1))
+
 
 @dataclass(slots=True, eq=False)
 class Cone(Shape):
@@ -348,89 +744,73 @@ class Cone(Shape):
     closed: bool = False
 
     def _local_intersect(self, transformed_ray: Ray) -> Intersections:
-        inters = Intersections([])
+        inters = empty_intersections()
 
-        a = (
-            transformed_ray.direction.x**2
-            - transformed_ray.direction.y**2
-            + transformed_ray.direction.z**2
-        )
-        b = (
-            2 * transformed_ray.origin.x * transformed_ray.direction.x
-            - 2 * transformed_ray.origin.y * transformed_ray.direction.y
-            + 2 * transformed_ray.origin.z * transformed_ray.direction.z
-        )
-        c = (
-            transformed_ray.origin.x**2
-            - transformed_ray.origin.y**2
-            + transformed_ray.origin.z**2
-        )
+        origin, direction = transformed_ray.origin, transformed_ray.direction
+        ox, oy, oz = origin.x, origin.y, origin.z
+        dx, dy, dz = direction.x, direction.y, direction.z
+
+        a = dx * dx - dy * dy + dz * dz
+        half_b = ox * dx - oy * dy + oz * dz
+        c = ox * ox - oy * oy + oz * oz
 
         # If a is 0, the ray is parallel to one of the cones halves but may intersect the other
         # half of the cone.
-        if math.isclose(a, 0):
-            # If b is also 0, then the ray misses entirely
-            if not math.isclose(b, 0):
-                t = -c / (2 * b)
-                inters.append(Intersection(t, self))
-                inters = self._intersect_caps(transformed_ray, inters)
-                return inters
-
-        disc = b**2 - 4 * a * c
-        if disc < 0:
-            # Ray does not intersect the cone
+        if a == 0:
+            # If b is also 0, then the ray misses the walls entirely
+            if half_b != 0:
+                t = -c / (4 * half_b)  # i.e. -c / 2b
+                if self.minimum < oy + t * dy < self.maximum:
+                    inters.append(Intersection(t, self))
+
+            inters = self._intersect_caps(inters, ox, oy, oz, dx, dy, dz)
             return inters
 
-        t0 = (-b - math.sqrt(disc)) / (2 * a)
-        t1 = (-b + math.sqrt(disc)) / (2 * a)
-        if t0 > t1:  # pragma: no branch
-            t0, t1 = t1, t0
+        t0, t1, hit = _quadratic_roots(a, half_b, c)
+        if not hit:
+            # Ray does not intersect the cone
+            return inters
 
-        y0 = transformed_ray.origin.y + t0 * transformed_ray.direction.y
-        if self.minimum < y0 < self.maximum:
+        y_min, y_max = self.minimum, self.maximum
+        if y_min < oy + t0 * dy < y_max:
             inters.append(Intersection(t0, self))
 
-        y1 = transformed_ray.origin.y + t1 * transformed_ray.direction.y
-        if self.minimum < y1 < self.maximum:
+        if y_min < oy + t1 * dy < y_max:
             inters.append(Intersection(t1, self))
 
-        inters = self._intersect_caps(transformed_ray, inters)
+        inters = self._intersect_caps(inters, ox, oy, oz, dx, dy, dz)
 
         return inters
 
-    @staticmethod
-    def _check_cap(transformed_ray: Ray, t: NUMERIC_T, cap_y: NUMERIC_T) -> bool:
-        """See if the intersection at `t` is within a radius of `cap_y` from the y-axis."""
-        x = transformed_ray.origin.x + t * transformed_ray.direction.x
-        z = transformed_ray.origin.z + t * transformed_ray.direction.z
-
-        return (x**2 + z**2) <= abs(cap_y)
-
-    def _intersect_caps(self, transformed_ray: Ray, inters: Intersections) -> Intersections:
+    def _intersect_caps(
+        self,
+        inters: Intersections,
+        ox: float,
+        oy: float,
+        oz: float,
+        dx: float,
+        dy: float,
+        dz: float,
+    ) -> Intersections:
         """Check for any cap intersection(s) and add them to the `Intersections` collection."""
         if not self.closed:
             return inters
 
-        # Check lower cap intersection
-        t = (self.minimum - transformed_ray.origin.y) / transformed_ray.direction.y
-        if self._check_cap(transformed_ray, t, self.minimum):
-            inters.append(Intersection(t, self))
-
-        # Check upper cap intersection
-        t = (self.maximum - transformed_ray.origin.y) / transformed_ray.direction.y
-        if self._check_cap(transformed_ray, t, self.maximum):
-            inters.append(Intersection(t, self))
+        # Cap radius is directly related to y
+        y_min, y_max = self.minimum, self.maximum
+        for cap_t in _caps_hit(ox, oy, oz, dx, dy, dz, y_min, y_max, abs(y_min), abs(y_max)):
+            inters.append(Intersection(cap_t, self))
 
         return inters
 
     def _local_normal_at(self, local_point: Rayple, hit: Intersection) -> Rayple:
         # Cap radius is directly related to y; if the point lies less than y units from the y axis,
         # and is within EPSILON of one of the caps, then it must be on one of the caps
-        dist = local_point.x**2 + local_point.z**2
+        dist = local_point.x * local_point.x + local_point.z * local_point.z
         if dist < abs(local_point.y) and local_point.y >= (self.maximum - EPSILON):
-            return vector(0, 1, 0)
+            return _UP
         elif dist < abs(local_point.y) and local_point.y <= (self.minimum + EPSILON):
-            return vector(0, -1, 0)
+            return _DOWN
         else:
             # Otherwise, it's not on one of the caps
             norm_y = math.sqrt(dist)
@@ -439,6 +819,14 @@ class Cone(Shape):
 
             return vector(local_point.x, norm_y, local_point.z)
 
+    def bounds(self) -> BoundingBox:  # noqa: D102
+        # The cone's radius at any y is |y|, so the widest point is at whichever end is farthest
+        # from the origin
+        limit = max(abs(self.minimum), abs(self.maximum))
+        return BoundingBox(
+            minimum=(-limit, self.minimum, -limit), maximum=(limit, self.maximum, limit)
+        )
+
 
 @dataclass(slots=True, eq=False)
 class Group(Shape):
@@ -449,26 +837,117 @@ class Group(Shape):
     shapes they contain. This allows us to organize them into trees, with groups containing both
     other groups and concrete primatives. Group transforms are applied implicitly to any shapes
     contained by the group, simplifying calculations on its members.
+
+    As with `World`, children with finite bounds are organized into a bounding volume hierarchy
+    (BVH) so each ray only tests the children whose bounding boxes it passes through; unbounded
+    children are tested against every ray. The hierarchy is built on first use and is rebuilt when
+    children are added to this group or any group it contains, or when the `transform` of any of
+    these children is reassigned.
+
+    These changes also bump the class-wide `Shape._revision` counter, which lets anything caching
+    the bounds of a group (e.g. a `World`'s BVH) tell that it's out of date with a single
+    comparison.
+
+    NOTE: As with the shapes' own cached data, changes made in place to a child's `transform` are
+    not detected; assign a new `Matrix` instead.
     """
 
     children: set[Shape] = field(default_factory=set)
+    _descendants: frozenset[Shape] | None = field(default=None, init=False, repr=False)
+    _hierarchy: tuple[BVHNode | None, list[Shape]] | None = field(
+        default=None, init=False, repr=False
+    )
 
     def _local_intersect(self, transformed_ray: Ray) -> Intersections:
-        all_inters = Intersections([])
-        for child in self.children:
+        bvh, unbounded = self._get_hierarchy()
+
+        all_inters = empty_intersections()
+        for child in unbounded:
             all_inters.extend(child.intersect(transformed_ray))
 
+        if bvh is not None:
+            all_inters.extend(bvh.intersect(transformed_ray))
+
         all_inters.sort()
         return all_inters
 
+    def _get_hierarchy(self) -> tuple[BVHNode | None, list[Shape]]:
+        """Provide the BVH of the group's bounded children along with its unbounded children."""
+        if self._hierarchy is None:
+            bounded = []
+            unbounded = []
+            for child in self.children:
+                if child.parent_space_bounds().is_finite:
+                    bounded.append(child)
+                else:
+                    unbounded.append(child)
+
+            self._hierarchy = (build_bvh(bounded) if bounded else None, unbounded)
+
+        return self._hierarchy
+
     def _local_normal_at(self, local_point: Rayple, hit: Intersection) -> Rayple:
         raise NotImplementedError("Groups shold be delegating this call to children.")
 
+    def bounds(self) -> BoundingBox:  # noqa: D102
+        box = BoundingBox()
+        for child in self.children:
+            box = box.merge(child.parent_space_bounds())
+
+        return box
+
     def add_child(self, other: Shape) -> None:
         """Add a `Shape` subclass to the group & set its `parent` attribute appropriately."""
         self.children.add(other)
         other.parent = self
 
+        self._reset_descendants()
+
+    def extend_children(self, others: t.Iterable[Shape]) -> None:
+        """
+        Add multiple `Shape` subclasses to the group & set their `parent` attributes appropriately.
+
+        This is equivalent to calling `add_child` for each shape, but the cached descendants & BVH
+        are only reset once for the whole batch.
+        """
+        for other in others:
+            self.children.add(other)
+            other.parent = self
+
+        self._reset_descendants()
+
+    def _reset_descendants(self) -> None:
+        # Adding or moving a child changes the descendants, hierarchy, & bounds of this group &
+        # every group above it
+        Shape._revision += 1
+        group: Group | None = self
+        while group is not None:
+            group._descendants = None
+            group._hierarchy = None
+            group._cull_bounds_of = None
+            group = group.parent
+
+    @property
+    def descendants(self) -> frozenset[Shape]:
+        """
+        All shapes contained by the group, including those contained by any nested groups.
+
+        Descendants are cached on first access & the cache is reset when `add_child` is called on
+        this group or any group it contains.
+        """
+        if self._descendants is None:
+            found: set[Shape] = set()
+            obj_queue: list[Shape] = [self]
+            while obj_queue:
+                obj = obj_queue.pop()
+                if isinstance(obj, Group):
+                    found.update(obj.children)
+                    obj_queue.extend(obj.children)
+
+            self._descendants = frozenset(found)
+
+        return self._descendants
+
 
 @dataclass(kw_only=True, slots=True, eq=False)  # kwonly so we don't have to specify vertex defaults
 class Triangle(Shape):
@@ -493,7 +972,7 @@ class Triangle(Shape):
         self.norm = cross(self.e2, self.e1).normalize()
 
     def _local_intersect(self, transformed_ray: Ray) -> Intersections:
-        inters = Intersections([])
+        inters = empty_intersections()
 
         # First see if the ray is parallel
         dir_cross_e2 = cross(transformed_ray.direction, self.e2)
@@ -523,6 +1002,13 @@ class Triangle(Shape):
         # Normal vector is the same for the entire triangle
         return self.norm
 
+    def bounds(self) -> BoundingBox:  # noqa: D102
+        box = BoundingBox()
+        for vertex in (self.p1, self.p2, self.p3):
+            box.add_point(vertex.x, vertex.y, vertex.z)
+
+        return box
+
 
 @dataclass(kw_only=True, slots=True, eq=False)  # kwonly so we don't have to specify vertex defaults
 class SmoothTriangle(Triangle):
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import typing as t
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from math import cos, sin
 
 import numpy as np
@@ -11,32 +11,74 @@ from ray_tracer.rayple import Rayple, cross
 
 ZERO_TOL = 1e-16
 
+# Matrix kinds are tracked so the inverse of common transformations can be calculated in closed form
+# rather than with a full LU decomposition
+# As with Rayple types, these are stored as plain integers to keep the checks cheap
+GENERIC = 0
+IDENTITY = 1
+TRANSLATION = 2
+SCALING = 3
+ROTATION = 4
+RIGID = 5  # Rotation & translation
+
+# Chaining any combination of these kinds yields a rigid transformation
+_RIGID_KINDS = {TRANSLATION, ROTATION, RIGID}
+
 
 @dataclass(slots=True)
 class Matrix:
-    """Thin wrapper around `np.ndarray` to support `Rayple` multiplication."""
+    """
+    Thin wrapper around `np.ndarray` to support `Rayple` multiplication.
+
+    Matrices may be tagged with the `kind` of transformation they represent, which is carried
+    through chained multiplications and used to invert them in closed form where possible. Matrices
+    are otherwise assumed to be generic.
+
+    NOTE: The inverse & the rows used for `Rayple` multiplication are calculated on first use &
+    cached, so the underlying array should not be modified in place once the matrix has been used.
+    """
 
     matrix: np.ndarray
+    kind: int = field(default=GENERIC, compare=False)
+    _inv: Matrix | None = field(default=None, init=False, repr=False, compare=False)
+    _rows: list[list[float]] | None = field(default=None, init=False, repr=False, compare=False)
 
     @t.overload
-    def __mul__(self, other: Rayple) -> Rayple:
-        ...
+    def __mul__(self, other: Rayple) -> Rayple: ...
 
     @t.overload
-    def __mul__(self, other: Matrix) -> Matrix:
-        ...
+    def __mul__(self, other: Matrix) -> Matrix: ...
 
     def __mul__(self, other: object) -> Rayple | Matrix:
         if isinstance(other, Rayple):
-            transformed = self.matrix.dot(other.as_array())
-            transformed[np.abs(transformed) < ZERO_TOL] = 0
-
-            return Rayple.from_np(transformed)
+            # A single 4x4 matrix-vector product is too small to benefit from NumPy, so it's done
+            # with scalar math on the matrix rows rather than round tripping the Rayple through a
+            # freshly allocated array
+            if self._rows is None:
+                self._rows = self.matrix.tolist()
+
+            row_x, row_y, row_z, row_w = self._rows
+            m00, m01, m02, m03 = row_x
+            m10, m11, m12, m13 = row_y
+            m20, m21, m22, m23 = row_z
+            m30, m31, m32, m33 = row_w
+            x, y, z, w = other.x, other.y, other.z, other.w
+            tx = m00 * x + m01 * y + m02 * z + m03 * w
+            ty = m10 * x + m11 * y + m12 * z + m13 * w
+            tz = m20 * x + m21 * y + m22 * z + m23 * w
+            tw = m30 * x + m31 * y + m32 * z + m33 * w
+
+            return Rayple(
+                tx if abs(tx) >= ZERO_TOL else 0,
+                ty if abs(ty) >= ZERO_TOL else 0,
+                tz if abs(tz) >= ZERO_TOL else 0,
+                int(tw),  # Cast may be fragile in some cases, but matches Rayple.from_np
+            )
         elif isinstance(other, Matrix):
             chained = self.matrix.dot(other.matrix)
             chained[np.abs(chained) < ZERO_TOL] = 0
 
-            return Matrix(chained)
+            return Matrix(chained, _chained_kind(self.kind, other.kind))
         else:
             return NotImplemented
 
@@ -48,7 +90,21 @@ class Matrix:
 
     def inv(self) -> Matrix:
         """Return an inverted `Matrix` instance."""
-        return Matrix(np.linalg.inv(self.matrix))
+        # Shapes & patterns invert their transform for every ray or shading sample, so the inverse
+        # is only solved once; the inverse's own inverse is the current instance
+        if self._inv is None:
+            inverted = Matrix(_invert(self.matrix, self.kind), self.kind)
+            inverted._inv = self
+            self._inv = inverted
+
+        return self._inv
+
+    def rows(self) -> list[list[float]]:
+        """Provide the matrix as a list of its rows, for scalar math on small operands."""
+        if self._rows is None:
+            self._rows = self.matrix.tolist()
+
+        return self._rows
 
     def transpose(self) -> Matrix:
         """Return a transposed `Matrix` instance."""
@@ -57,7 +113,84 @@ class Matrix:
     @classmethod
     def identity(cls) -> Matrix:
         """Initialize an identity matrix."""
-        return cls(np.identity(4))
+        return cls(np.identity(4), IDENTITY)
+
+
+def _chained_kind(left: int, right: int) -> int:
+    """Determine the kind of matrix resulting from chaining matrices of the provided kinds."""
+    if left == IDENTITY:
+        return right
+    if right == IDENTITY or left == right:
+        return left
+    if left in _RIGID_KINDS and right in _RIGID_KINDS:
+        return RIGID
+
+    return GENERIC
+
+
+def _invert(matrix: np.ndarray, kind: int) -> np.ndarray:
+    """Invert the provided matrix, using a closed form inverse if one is available for its kind."""
+    if kind == IDENTITY:
+        return np.identity(4)
+
+    if kind == TRANSLATION:
+        inverted = np.identity(4)
+        inverted[:3, 3] = -matrix[:3, 3]
+        return inverted
+
+    if kind == SCALING:
+        diag = matrix.diagonal()
+        if diag.all():
+            return np.diag(1 / diag)
+
+    if kind == ROTATION or kind == RIGID:
+        # Rotations are orthonormal, so their inverse is their transpose & the translation is undone
+        # by shifting back along the inverse rotation
+        inverted = np.identity(4)
+        rot_t = matrix[:3, :3].T
+        inverted[:3, :3] = rot_t
+        inverted[:3, 3] = -rot_t @ matrix[:3, 3]
+        return inverted
+
+    if kind == GENERIC and matrix[3].tolist() == [0, 0, 0, 1]:
+        return _invert_affine(matrix)
+
+    # Fall back to a full inversion for non-affine matrices & singular scalings, the latter of which
+    # will raise
+    return np.linalg.inv(matrix)
+
+
+def _invert_affine(matrix: np.ndarray) -> np.ndarray:
+    """
+    Invert the provided affine matrix in closed form.
+
+    The upper left 3x3 submatrix `A` is inverted using its cofactors & the translation `t` is undone
+    by shifting back along the inverted submatrix, i.e. `inv([A | t]) = [inv(A) | -inv(A) @ t]`.
+    A 3x3 is small enough that this is cheaper as scalar math than calling into LAPACK.
+    """
+    (a, b, c, tx), (d, e, f, ty), (g, h, i, tz), _ = matrix.tolist()
+    c00, c01, c02 = e * i - f * h, c * h - b * i, b * f - c * e
+    c10, c11, c12 = f * g - d * i, a * i - c * g, c * d - a * f
+    c20, c21, c22 = d * h - e * g, b * g - a * h, a * e - b * d
+
+    det = a * c00 + b * c10 + c * c20
+    if det == 0:
+        # Match the error raised by np.linalg.inv
+        raise np.linalg.LinAlgError("Singular matrix")
+
+    inv_det = 1 / det
+    c00, c01, c02 = c00 * inv_det, c01 * inv_det, c02 * inv_det
+    c10, c11, c12 = c10 * inv_det, c11 * inv_det, c12 * inv_det
+    c20, c21, c22 = c20 * inv_det, c21 * inv_det, c22 * inv_det
+
+    return np.array(
+        (
+            (c00, c01, c02, -(c00 * tx + c01 * ty + c02 * tz)),
+            (c10, c11, c12, -(c10 * tx + c11 * ty + c12 * tz)),
+            (c20, c21, c22, -(c20 * tx + c21 * ty + c22 * tz)),
+            (0.0, 0.0, 0.0, 1.0),
+        )
+    )
 
 
 def translation(x: NUMERIC_T, y: NUMERIC_T, z: NUMERIC_T) -> Matrix:
@@ -65,7 +198,7 @@ def translation(x: NUMERIC_T, y: NUMERIC_T, z: NUMERIC_T) -> Matrix:
     matrix = np.identity(4)
     matrix[0:3, 3] = (x, y, z)
 
-    return Matrix(matrix)
+    return Matrix(matrix, TRANSLATION)
 
 
 def scaling(x: NUMERIC_T, y: NUMERIC_T, z: NUMERIC_T) -> Matrix:
@@ -73,7 +206,7 @@ def scaling(x: NUMERIC_T, y: NUMERIC_T, z: NUMERIC_T) -> Matrix:
     matrix = np.identity(4)
     np.fill_diagonal(matrix, (x, y, z, 1))
 
-    return Matrix(matrix)
+    return Matrix(matrix, SCALING)
 
 
 def rot_x(mag: float) -> Matrix:
@@ -86,7 +219,7 @@ def rot_x(mag: float) -> Matrix:
     np.fill_diagonal(matrix, (1, cos(mag), cos(mag), 1))
     np.fill_diagonal(np.flipud(matrix), (0, sin(mag), -sin(mag), 0))  # anti-diagonal
 
-    return Matrix(matrix)
+    return Matrix(matrix, ROTATION)
 
 
 def rot_y(mag: float) -> Matrix:
@@ -99,7 +232,7 @@ def rot_y(mag: float) -> Matrix:
     matrix[0, :] = (cos(mag), 0, sin(mag), 0)
     matrix[2, :] = (-sin(mag), 0, cos(mag), 0)
 
-    return Matrix(matrix)
+    return Matrix(matrix, ROTATION)
 
 
 def rot_z(mag: float) -> Matrix:
@@ -112,7 +245,7 @@ def rot_z(mag: float) -> Matrix:
     matrix[0, :] = (cos(mag), -sin(mag), 0, 0)
     matrix[1, :] = (sin(mag), cos(mag), 0, 0)
 
-    return Matrix(matrix)
+    return Matrix(matrix, ROTATION)
 
 
 def rot(x: float = 0, y: float = 0, z: float = 0) -> Matrix:
@@ -1,37 +1,125 @@
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+from ray_tracer.bvh import BVHNode, build_bvh
 from ray_tracer.colors import BLACK, WHITE
-from ray_tracer.intersections import Comps, Intersections, prepare_computations, schlick
-from ray_tracer.lights import PointLight, lighting
+from ray_tracer.intersections import (
+    Comps,
+    Intersections,
+    empty_intersections,
+    prepare_computations,
+    schlick,
+)
+from ray_tracer.lights import PointLight, _lighting_unchecked
 from ray_tracer.materials import Material
-from ray_tracer.rayple import Rayple, color, dot, point
+from ray_tracer.rayple import Rayple, VECTOR, color, dot, point
 from ray_tracer.rays import Ray
-from ray_tracer.shapes import Shape, Sphere
+from ray_tracer.shapes import Shape, Sphere, SphereBatch
 from ray_tracer.transforms import scaling
 
 DEFAULT_LIGHT = PointLight(point(-10, 10, -10), WHITE)
 
 REF_LIMIT = 5
 
+# Batching has a fixed cost per ray, so it only pays off over a BVH for larger numbers of spheres
+SPHERE_BATCH_MIN = 64
+
 
 @dataclass(slots=True)
-class World:  # noqa: D101
+class World:
+    """
+    Scene representation, containing a light source and the objects it illuminates.
+
+    Objects with finite bounds are organized into a bounding volume hierarchy (BVH) so each ray only
+    tests the objects whose bounding boxes it passes through; unbounded objects (e.g. `Plane`) are
+    tested against every ray. The hierarchy is built on first use & is rebuilt automatically when
+    objects are added to or removed from `objects`, when `objects` is reassigned, when any shape's
+    `transform` is reassigned, or when children are added to any `Group`.
+
+    Worlds containing at least `SPHERE_BATCH_MIN` spheres instead intersect them all at once as a
+    `SphereBatch`, rather than one `Sphere.intersect` call per sphere.
+
+    NOTE: As with the shapes' own cached data, changes made in place to an object's `transform` are
+    never detected; assign a new `Matrix` instead.
+
+    NOTE: To keep the per-ray check constant time, replacing an element of `objects` without
+    changing its length (e.g. `world.objects[0] = shape`) is only picked up by `rebuild`, which
+    `Camera.render` calls at the start of every render.
+    """
+
     light: PointLight
     objects: list[Shape]
 
+    _bvh: BVHNode | None = field(default=None, init=False, repr=False)
+    _unbounded: list[Shape] = field(default_factory=list, init=False, repr=False)
+    _bvh_objects: list[Shape] = field(default_factory=list, init=False, repr=False)
+    _objects_of: list[Shape] | None = field(default=None, init=False, repr=False)
+    _spheres: SphereBatch | None = field(default=None, init=False, repr=False)
+    _bvh_revision: int = field(default=-1, init=False, repr=False)
+
+    def rebuild(self) -> None:
+        """
+        Rebuild the world's BVH & sphere batch if its objects have changed since they were built.
+
+        The hierarchy is rebuilt if the contents of `objects` have changed, if any shape's
+        `transform` has been reassigned, or if children have been added to any `Group`.
+
+        NOTE: Checking for changes scans every object, so this is intended to be called once per
+        render rather than once per ray.
+        """
+        if self._bvh_revision == Shape._revision and self._bvh_objects == self.objects:
+            self._objects_of = self.objects
+            return
+
+        spheres = [obj for obj in self.objects if type(obj) is Sphere]
+        self._spheres = SphereBatch(spheres) if len(spheres) >= SPHERE_BATCH_MIN else None
+
+        bounded = []
+        self._unbounded = []
+        for obj in self.objects:
+            if self._spheres is not None and type(obj) is Sphere:
+                continue
+
+            box = obj.parent_space_bounds()
+            if box.is_finite:
+                bounded.append(obj)
+            else:
+                self._unbounded.append(obj)
+
+        self._bvh = build_bvh(bounded) if bounded else None
+        self._bvh_objects = list(self.objects)
+        self._bvh_revision = Shape._revision
+        self._objects_of = self.objects
+
     def intersect_world(self, ray: Ray) -> Intersections:
         """
         Calculate the `Ray`'s intersections with all objects in the current world.
 
         NOTE: Intersections are aggregated & sorted by their `t` values.
         """
-        all_intersections = Intersections([])
-        for obj in self.objects:
+        # Only changes that can be detected in constant time are checked for on every ray: moved
+        # shapes, group changes, & objects being added, removed, or reassigned. Anything else is
+        # left to rebuild()
+        objects = self.objects
+        if (
+            self._bvh_revision != Shape._revision
+            or self._objects_of is not objects
+            or len(objects) != len(self._bvh_objects)
+        ):
+            self.rebuild()
+
+        all_intersections = empty_intersections()
+        for obj in self._unbounded:
             all_intersections.extend(obj.intersect(ray))
 
+        if self._bvh is not None:
+            all_intersections.extend(self._bvh.intersect(ray))
+
+        if self._spheres is not None:
+            all_intersections.extend(self._spheres.intersect(ray))
+
         all_intersections.sort()
         return all_intersections
 
@@ -46,7 +134,7 @@ class World:  # noqa: D101
         # value bumps the query point slightly towards the normal so it's not accidentally
         # considered inside
         shadowed = self.is_shadowed(comps.over_point)
-        surface = lighting(
+        surface = _lighting_unchecked(
             material=comps.obj.material,
             obj=comps.obj,
             light=self.light,
@@ -85,10 +173,12 @@ class World:  # noqa: D101
     def is_shadowed(self, pt: Rayple) -> bool:
         """Determine if the query point is shadowed by a world object."""
         # Cast a ray from the point towards the light source & see if it hits anything along the way
+        # The distance to the light is also what normalizes the ray's direction, so the square root
+        # is only taken once rather than separately for the distance & the normalization
         pt_v = self.light.position - pt
-        pt_dist = abs(pt_v)
-        pt_dir = pt_v.normalize()
-        r = Ray(pt, pt_dir)
+        pt_dist = math.hypot(pt_v.x, pt_v.y, pt_v.z)
+        inv_dist = 1 / pt_dist
+        r = Ray(pt, Rayple(pt_v.x * inv_dist, pt_v.y * inv_dist, pt_v.z * inv_dist, VECTOR))
 
         intersections = self.intersect_world(r)
         h = intersections.hit
@@ -133,7 +223,7 @@ class World:  # noqa: D101
         # pass through it
         n_ratio = comps.n1 / comps.n2
         cos_i = dot(comps.eye_v, comps.normal)
-        sin2_t = n_ratio**2 * (1 - cos_i**2)
+        sin2_t = n_ratio * n_ratio * (1 - cos_i * cos_i)
 
         if sin2_t > 1:
             return BLACK
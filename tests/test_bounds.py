@@ -0,0 +1,137 @@
+import math
+
+import pytest
+
+from ray_tracer.bounds import BoundingBox
+from ray_tracer.rayple import point, vector
+from ray_tracer.rays import Ray
+from ray_tracer.shapes import Cone, Cube, Cylinder, Group, Plane, Shape, Sphere, Triangle
+from ray_tracer.transforms import rot_y, scaling, translation
+
+INF = math.inf
+
+
+def test_empty_box() -> None:
+    box = BoundingBox()
+
+    assert box.is_empty
+    assert not box.is_finite
+
+
+def test_add_point() -> None:
+    box = BoundingBox()
+    box.add_point(-5, 2, 0)
+    box.add_point(7, 0, -3)
+
+    assert box.minimum == (-5, 0, -3)
+    assert box.maximum == (7, 2, 0)
+    assert not box.is_empty
+
+
+def test_merge() -> None:
+    box1 = BoundingBox(minimum=(-5, -2, 0), maximum=(7, 4, 4))
+    box2 = BoundingBox(minimum=(8, -7, -2), maximum=(14, 2, 8))
+
+    merged = box1.merge(box2)
+    assert merged.minimum == (-5, -7, -2)
+    assert merged.maximum == (14, 4, 8)
+
+
+def test_centroid_surface_area() -> None:
+    box = BoundingBox(minimum=(-1, 0, 2), maximum=(1, 4, 3))
+
+    assert box.centroid == (0, 2, 2.5)
+    assert box.surface_area == pytest.approx(2 * (2 * 4 + 4 * 1 + 1 * 2))
+
+
+def test_transform_box() -> None:
+    box = BoundingBox(minimum=(-1, -1, -1), maximum=(1, 1, 1))
+    transformed = box.transform(translation(1, 2, 3) * rot_y(math.pi / 4))
+
+    rt_2 = math.sqrt(2)
+    assert transformed.minimum == pytest.approx((1 - rt_2, 1, 3 - rt_2))
+    assert transformed.maximum == pytest.approx((1 + rt_2, 3, 3 + rt_2))
+
+
+def test_transform_infinite_box() -> None:
+    box = BoundingBox(minimum=(-INF, 0, -INF), maximum=(INF, 0, INF))
+    transformed = box.transform(translation(0, 1, 0))
+
+    assert transformed.minimum == (-INF, -INF, -INF)
+    assert transformed.maximum == (INF, INF, INF)
+
+
+def test_transform_empty_box() -> None:
+    assert BoundingBox().transform(scaling(2, 2, 2)).is_empty
+
+
+BOX_INTERSECT_CASES = (
+    (Ray(point(5, 0.5, 0), vector(-1, 0, 0)), True),
+    (Ray(point(-5, 0.5, 0), vector(1, 0, 0)), True),
+    (Ray(point(0.5, 5, 0), vector(0, -1, 0)), True),
+    (Ray(point(0.5, 0, -5), vector(0, 0, 1)), True),
+    (Ray(point(0, 0.5, 0), vector(0, 0, 1)), True),  # inside
+    (Ray(point(0, 0, 5), vector(0, 0, 1)), True),  # behind
+    (Ray(point(0, 1, -5), vector(0, 0, 1)), True),  # grazing the top face
+    (Ray(point(-2, 0, 0), vector(2, 4, 6)), False),
+    (Ray(point(0, -2, 0), vector(6, 2, 4)), False),
+    (Ray(point(2, 0, 2), vector(0, 0, -1)), False),
+    (Ray(point(0, 2, 2), vector(0, -1, 0)), False),
+    (Ray(point(2, 2, 0), vector(-1, 0, 0)), False),
+)
+
+
+@pytest.mark.parametrize(("ray", "truth_hit"), BOX_INTERSECT_CASES)
+def test_box_intersects(ray: Ray, truth_hit: bool) -> None:
+    box = BoundingBox(minimum=(-1, -1, -1), maximum=(1, 1, 1))
+    assert box.intersects(ray) == truth_hit
+
+
+def test_infinite_box_intersects() -> None:
+    box = BoundingBox(minimum=(-INF, 0, -INF), maximum=(INF, 0, INF))
+
+    assert box.intersects(Ray(point(0, 5, 0), vector(1, -1, 0)))
+    assert not box.intersects(Ray(point(0, 5, 0), vector(1, 0, 0)))
+
+
+SHAPE_BOUNDS_CASES = (
+    (Sphere(), (-1, -1, -1), (1, 1, 1)),
+    (Cube(), (-1, -1, -1), (1, 1, 1)),
+    (Plane(), (-INF, 0, -INF), (INF, 0, INF)),
+    (Cylinder(), (-1, -INF, -1), (1, INF, 1)),
+    (Cylinder(minimum=-5, maximum=3), (-1, -5, -1), (1, 3, 1)),
+    (Cone(minimum=-5, maximum=3), (-5, -5, -5), (5, 3, 5)),
+    (
+        Triangle(p1=point(-3, 7, 2), p2=point(6, 2, -4), p3=point(2, -1, -1)),
+        (-3, -1, -4),
+        (6, 7, 2),
+    ),
+)
+
+
+@pytest.mark.parametrize(("shape", "truth_min", "truth_max"), SHAPE_BOUNDS_CASES)
+def test_shape_bounds(
+    shape: Shape, truth_min: tuple[float, ...], truth_max: tuple[float, ...]
+) -> None:
+    box = shape.bounds()
+
+    assert box.minimum == truth_min
+    assert box.maximum == truth_max
+
+
+def test_parent_space_bounds() -> None:
+    s = Sphere(transform=translation(1, -3, 5) * scaling(0.5, 2, 4))
+    box = s.parent_space_bounds()
+
+    assert box.minimum == pytest.approx((0.5, -5, 1))
+    assert box.maximum == pytest.approx((1.5, -1, 9))
+
+
+def test_group_bounds() -> None:
+    g = Group()
+    g.add_child(Sphere(transform=translation(2, 5, -3) * scaling(2, 2, 2)))
+    g.add_child(Cylinder(minimum=-2, maximum=2, transform=translation(-4, -1, 4)))
+
+    box = g.bounds()
+    assert box.minimum == pytest.approx((-5, -3, -5))
+    assert box.maximum == pytest.approx((4, 7, 5))
@@ -0,0 +1,48 @@
+from ray_tracer.bvh import build_bvh
+from ray_tracer.rayple import point, vector
+from ray_tracer.rays import Ray
+from ray_tracer.shapes import Cube, Sphere
+from ray_tracer.transforms import translation
+
+
+def test_bvh_leaf() -> None:
+    shapes = [Sphere(), Sphere(transform=translation(3, 0, 0))]
+    root = build_bvh(shapes)
+
+    assert root.left is None
+    assert root.right is None
+    assert set(root.shapes) == set(shapes)
+
+
+def test_bvh_split() -> None:
+    shapes = [Sphere(transform=translation(x, 0, 0)) for x in (-9, -6, 6, 9)]
+    root = build_bvh(shapes)
+
+    assert root.left is not None and root.right is not None
+    assert set(root.left.shapes) == set(shapes[:2])
+    assert set(root.right.shapes) == set(shapes[2:])
+    assert root.bounds.minimum == (-10, -1, -1)
+    assert root.bounds.maximum == (10, 1, 1)
+
+
+def test_bvh_intersect_matches_brute_force() -> None:
+    shapes = [Cube(transform=translation(x, y, 0)) for x in range(-6, 7, 3) for y in (-3, 3)]
+    root = build_bvh(shapes)
+
+    for origin_x in range(-8, 9):
+        r = Ray(point(origin_x + 0.5, 2.5, -5), vector(0, 0.1, 1))
+
+        truth = []
+        for obj in shapes:
+            truth.extend(obj.intersect(r))
+
+        inters = root.intersect(r)
+        assert {(i.t, i.obj) for i in inters} == {(i.t, i.obj) for i in truth}
+
+
+def test_bvh_skips_missed_nodes() -> None:
+    shapes = [Sphere(transform=translation(x, 0, 0)) for x in (-9, -6, 6, 9)]
+    root = build_bvh(shapes)
+
+    r = Ray(point(-9, 0, -5), vector(0, 0, 1))
+    assert {inter.obj for inter in root.intersect(r)} == {shapes[0]}
@@ -1,10 +1,11 @@
 from math import pi, sqrt
 
+import numpy as np
 import pytest
 
 from ray_tracer import NUMERIC_T
 from ray_tracer.camera import Camera
-from ray_tracer.rayple import color, point, vector
+from ray_tracer.rayple import Rayple, color, point, vector
 from ray_tracer.rays import Ray
 from ray_tracer.transforms import Matrix, rot_y, translation, view_transform
 from ray_tracer.world import World
@@ -43,6 +44,57 @@ def test_ray_for_pixel(transform: Matrix, x: int, y: int, truth_ray: Ray) -> Non
     assert r == truth_ray
 
 
+OFF_CENTER_PIXEL_CASES = (
+    (0.5, 0.5, vector(0, 0, -1)),  # Fractional coordinates
+    (-1, 0.5, vector(1.5, 0, -1)),  # Left of the canvas
+    (2, 0.5, vector(-1.5, 0, -1)),  # Right of the canvas
+    (0.5, 2, vector(0, -1.5, -1)),  # Below the canvas
+)
+
+
+@pytest.mark.parametrize(("x", "y", "truth_direction"), OFF_CENTER_PIXEL_CASES)
+def test_ray_for_pixel_off_center(x: float, y: float, truth_direction: Rayple) -> None:
+    c = Camera(2, 2, pi / 2)
+    r = c.ray_for_pixel(x, y)
+
+    assert r == Ray(point(0, 0, 0), truth_direction.normalize())
+
+
+@pytest.mark.parametrize(("transform", "x", "y", "truth_ray"), RAY_FOR_PIXEL_CASES)
+def test_rays_for_pixels(transform: Matrix, x: int, y: int, truth_ray: Ray) -> None:
+    c = Camera(201, 101, pi / 2, transform=transform)
+    origins, directions = c.rays_for_pixels(np.array([x]), np.array([y]))
+
+    assert origins.shape == (1, 3)
+    assert directions.shape == (1, 3)
+    assert point(*origins[0]) == truth_ray.origin
+    assert vector(*directions[0]) == truth_ray.direction
+
+
+@pytest.mark.parametrize(("transform", "x", "y", "truth_ray"), RAY_FOR_PIXEL_CASES)
+def test_ray_for_pixel_reassigned_transform(
+    transform: Matrix, x: int, y: int, truth_ray: Ray
+) -> None:
+    c = Camera(201, 101, pi / 2)
+    c.ray_for_pixel(x, y)
+    c.transform = transform
+
+    assert c.ray_for_pixel(x, y) == truth_ray
+    origins, directions = c.rays_for_pixels(np.array([x]), np.array([y]))
+    assert point(*origins[0]) == truth_ray.origin
+    assert vector(*directions[0]) == truth_ray.direction
+
+
+def test_rays_for_pixels_matches_ray_for_pixel() -> None:
+    trans = view_transform(point(1, 2, -5), point(0, 0, 0), vector(0, 1, 0))
+    c = Camera(7, 5, pi / 3, transform=trans)
+    ys, xs = np.mgrid[0:5, 0:7]
+    origins, directions = c.rays_for_pixels(xs, ys)
+
+    truth_rays = [c.ray_for_pixel(x, y) for x, y in zip(xs.ravel(), ys.ravel())]
+    assert [Ray(point(*o), vector(*d)) for o, d in zip(origins, directions)] == truth_rays
+
+
 def test_render() -> None:
     w = World.default_world()
     trans = view_transform(point(0, 0, -5), point(0, 0, 0), vector(0, 1, 0))
@@ -50,3 +102,35 @@ def test_render() -> None:
 
     img = c.render(w)
     assert img.pixel_at(5, 5) == color(0.38066, 0.47583, 0.2855)
+
+
+def test_render_tile_size_invariant() -> None:
+    w = World.default_world()
+    trans = view_transform(point(0, 0, -5), point(0, 0, 0), vector(0, 1, 0))
+    c = Camera(11, 9, pi / 2, transform=trans)
+
+    full = c.render(w, tile_size=16)
+    tiled = c.render(w, tile_size=4)
+    assert np.allclose(full._pixels, tiled._pixels)
+
+
+def test_render_parallel_matches_serial() -> None:
+    w = World.default_world()
+    trans = view_transform(point(0, 0, -5), point(0, 0, 0), vector(0, 1, 0))
+    c = Camera(11, 9, pi / 2, transform=trans)
+
+    serial = c.render(w, tile_size=4)
+    parallel = c.render(w, tile_size=4, workers=2)
+    assert np.array_equal(serial._pixels, parallel._pixels)
+
+
+def test_render_covers_full_canvas() -> None:
+    w = World.default_world()
+    trans = view_transform(point(0, 0, -5), point(0, 0, 0), vector(0, 1, 0))
+    c = Camera(11, 11, pi / 2, transform=trans)
+
+    img = c.render(w, tile_size=4)
+    for x in range(11):
+        assert img.pixel_at(x, 10) == w.color_at(c.ray_for_pixel(x, 10))
+    for y in range(11):
+        assert img.pixel_at(10, y) == w.color_at(c.ray_for_pixel(10, y))
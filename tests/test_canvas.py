@@ -1,10 +1,17 @@
 from pathlib import Path
-from textwrap import dedent
+from textwrap import dedent, fill
 
 import numpy as np
 import pytest
 
-from ray_tracer.canvas import Canvas, _build_ppm_header, _pixels_to_ppm
+from ray_tracer.canvas import (
+    Canvas,
+    QuantizedCanvas,
+    _build_ppm_header,
+    _pixels_to_ppm,
+    _quantize,
+    _wrap_values,
+)
 from ray_tracer.rayple import color, point
 
 
@@ -24,6 +31,16 @@ def test_write_pixel() -> None:
     assert c._pixels[3, 2, :] == pytest.approx((1, 0, 0))  # numpy indexing is row-first
 
 
+def test_write_pixel_single_precision_rounding() -> None:
+    # 0.79999999 * 255 truncates to 203 in double precision, but single precision storage rounds
+    # the color up to 0.8
+    c = Canvas(1, 1)
+    c.write_pixel(0, 0, color(0.79999999, 0, 0))
+
+    assert c._pixels.dtype == np.float32
+    assert c._quantized().tolist() == [[[204, 0, 0]]]
+
+
 def test_get_pixel() -> None:
     c = Canvas(10, 20)
     c._pixels[3, 2, :] = (1, 0, 0)  # numpy indexing is row-first
@@ -32,6 +49,54 @@ def test_get_pixel() -> None:
     assert c.pixel_at(2, 3) == red
 
 
+def test_get_pixel_rgb() -> None:
+    c = Canvas(10, 20)
+    c._pixels[3, 2, :] = (1, 0.5, 0)  # numpy indexing is row-first
+
+    assert c.pixel_at_rgb(2, 3) == (1, 0.5, 0)
+
+
+def test_write_block() -> None:
+    c = Canvas(10, 20)
+    block = np.ones((3, 2, 3))
+    block[2, 1, :] = (1, 0, 0)
+
+    c.write_block(4, 5, block)
+    assert c._pixels[5:8, 4:6, :] == pytest.approx(block)
+    assert c.pixel_at(5, 7) == color(1, 0, 0)
+    assert c._pixels.sum() == pytest.approx(block.sum())
+
+
+WRITE_BLOCK_RAISES_CASES = (
+    (0, 0, np.ones((3, 2))),
+    (9, 0, np.ones((3, 2, 3))),
+    (0, 18, np.ones((3, 2, 3))),
+    (-1, 0, np.ones((3, 2, 3))),
+)
+
+
+@pytest.mark.parametrize(("x0", "y0", "block"), WRITE_BLOCK_RAISES_CASES)
+def test_write_block_raises(x0: int, y0: int, block: np.ndarray) -> None:
+    c = Canvas(10, 20)
+    with pytest.raises(ValueError):
+        c.write_block(x0, y0, block)
+
+
+def test_canvas_from_array() -> None:
+    pixels = np.zeros((20, 10, 3))
+    pixels[3, 2, :] = (1, 0, 0)
+
+    c = Canvas.from_array(pixels)
+    assert c.width == 10
+    assert c.height == 20
+    assert c.pixel_at(2, 3) == color(1, 0, 0)
+
+
+def test_canvas_from_bad_array_raises() -> None:
+    with pytest.raises(ValueError):
+        Canvas.from_array(np.zeros((20, 10)))
+
+
 def test_non_color_write_raises() -> None:
     c = Canvas(10, 20)
     with pytest.raises(ValueError):
@@ -43,6 +108,21 @@ def test_build_ppm_header() -> None:
     assert _build_ppm_header(5, 3, "Hello", 20) == "Hello\n5 3\n20"
 
 
+def test_quantize() -> None:
+    a = np.array([[[1.5, 0, 0.5], [-0.5, 1, 0.999]]])
+    scaled = _quantize(a)
+
+    assert scaled.dtype == np.uint8
+    assert scaled.tolist() == [[[255, 0, 127], [0, 255, 254]]]
+
+
+def test_quantize_wide_maxval() -> None:
+    scaled = _quantize(np.array([[[1.5, 0.5, -1]]]), maxval=1000)
+
+    assert scaled.dtype == np.uint16
+    assert scaled.tolist() == [[[1000, 500, 0]]]
+
+
 def test_array_to_ppm_no_wrap() -> None:
     a = np.zeros(shape=(5, 3, 3))
     a[0, 0, :] = (1.5, 0, 0)
@@ -93,3 +173,84 @@ def test_ppm_write(tmp_path: Path) -> None:
         """
     )
     assert out_img.read_text() == truth
+
+
+def test_ppm_binary_write(tmp_path: Path) -> None:
+    c = Canvas(5, 3)
+    c.write_pixel(0, 0, color(1.5, 0, 0))
+    c.write_pixel(2, 1, color(0, 0.5, 0))
+    c.write_pixel(4, 2, color(-0.5, 0, 1))
+
+    out_img = tmp_path / "my_img.ppm"
+    c.to_ppm_binary(out_img)
+
+    truth_pixels = bytearray(5 * 3 * 3)
+    truth_pixels[0] = 255
+    truth_pixels[(1 * 5 + 2) * 3 + 1] = 127
+    truth_pixels[(2 * 5 + 4) * 3 + 2] = 255
+    assert out_img.read_bytes() == b"P6\n5 3\n255\n" + truth_pixels
+
+
+def test_quantized_canvas_write_read() -> None:
+    c = QuantizedCanvas(10, 20)
+    c.write_pixel(2, 3, color(1.5, 0.5, -0.5))
+
+    assert c._pixels.dtype == np.uint16
+    assert c._pixels[3, 2, :].tolist() == [65535, 32767, 0]
+    assert c.pixel_at_rgb(2, 3) == pytest.approx((1, 0.5, 0), abs=1e-4)
+    assert c.pixel_at(2, 3) == color(1, 0.5, 0)
+
+
+def test_quantized_canvas_from_array() -> None:
+    pixels = np.zeros((20, 10, 3))
+    pixels[3, 2, :] = (1, 0.25, 0)
+
+    c = QuantizedCanvas.from_array(pixels)
+    assert c._pixels.dtype == np.uint16
+    assert c.pixel_at_rgb(2, 3) == pytest.approx((1, 0.25, 0), abs=1 / 65535)
+
+
+def test_quantized_canvas_non_color_write_raises() -> None:
+    c = QuantizedCanvas(10, 20)
+    with pytest.raises(ValueError):
+        c.write_pixel(2, 3, point(1, 2, 3))
+
+
+def test_quantized_canvas_ppm_matches(tmp_path: Path) -> None:
+    canvases = (Canvas(5, 3), QuantizedCanvas(5, 3))
+    for c in canvases:
+        c.write_pixel(0, 0, color(1.5, 0, 0))
+        c.write_pixel(2, 1, color(0, 0.5, 0))
+        c.write_pixel(4, 2, color(-0.5, 0, 1))
+
+    float_img = tmp_path / "float.ppm"
+    canvases[0].to_ppm(float_img)
+    quantized_img = tmp_path / "quantized.ppm"
+    canvases[1].to_ppm(quantized_img)
+
+    assert quantized_img.read_text() == float_img.read_text()
+
+
+def test_quantized_canvas_quantized_matches_random() -> None:
+    pixels = np.random.default_rng(42).random((32, 32, 3))
+
+    float_canvas = Canvas.from_array(pixels)
+    quantized_canvas = QuantizedCanvas.from_array(pixels)
+
+    np.testing.assert_array_equal(quantized_canvas._quantized(), float_canvas._quantized())
+
+
+WRAP_CASES = (
+    ("255 0 0 0 127 0\n0 0 255 12 7 0", 7),
+    ("255 0 0 0 127 0\n0 0 255 12 7 0", 8),
+    ("255 0 0 0 127 0\n0 0 255 12 7 0", 70),
+)
+
+
+@pytest.mark.parametrize(("text", "width"), WRAP_CASES)
+def test_wrap_values(text: str, width: int) -> None:
+    assert _wrap_values(text, width=width) == fill(text, width=width)
+
+
+def test_wrap_values_splits_long_values() -> None:
+    assert _wrap_values("255 0 127", width=2) == "25\n5\n0\n12\n7"
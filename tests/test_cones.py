@@ -39,10 +39,21 @@ def test_cone_parallel_ray() -> None:
     assert inters[0].t == pytest.approx(0.3535533)
 
 
+def test_truncated_cone_parallel_ray_outside_bounds() -> None:
+    # The ray is parallel to the cone's side, and its single root lies at y = 1.25
+    c = Cone(minimum=-0.5, maximum=0.5)
+    norm_direction = vector(0, 1, 1).normalize()
+    r = Ray(point(0, 0, -5), norm_direction)
+
+    inters = c._local_intersect(r)
+    assert len(inters) == 0
+
+
 CAPPED_CONE_INTERSECTION_CASES = (
     (point(0, 0, -5), vector(0, 1, 0), 0),
     (point(0, 0, -0.25), vector(0, 1, 1), 2),
     (point(0, 0, -0.25), vector(0, 1, 0), 4),
+    (point(0, 0.25, -5), vector(0, 0, 1), 2),  # parallel to the caps
 )
 
 
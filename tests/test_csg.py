@@ -1,10 +1,10 @@
 import pytest
 
-from ray_tracer.csg import CSG, Operation
+from ray_tracer.csg import CSG, Operation, check_includes
 from ray_tracer.intersections import Intersection, Intersections
 from ray_tracer.rayple import point, vector
 from ray_tracer.rays import Ray
-from ray_tracer.shapes import Cube, Sphere
+from ray_tracer.shapes import Cube, Group, Sphere
 from ray_tracer.transforms import translation
 
 ALLOWED_INTERSECTION_CASES = (
@@ -92,3 +92,54 @@ def test_ray_hits_csg() -> None:
 
     assert inters[1].t == pytest.approx(6.5)
     assert inters[1].obj == s2
+
+
+ONE_SIDED_HIT_CASES = (
+    (Operation.UNION, 0, 2),
+    (Operation.UNION, 6, 2),
+    (Operation.INTERSECTION, 0, 0),
+    (Operation.INTERSECTION, 6, 0),
+    (Operation.DIFFERENCE, 0, 2),
+    (Operation.DIFFERENCE, 6, 0),
+)
+
+
+@pytest.mark.parametrize(("op", "ray_x", "truth_n_inters"), ONE_SIDED_HIT_CASES)
+def test_one_sided_csg_hit(op: Operation, ray_x: float, truth_n_inters: int) -> None:
+    left = Sphere()
+    right = Sphere(transform=translation(6, 0, 0))
+    geo = CSG(operation=op, left_shape=left, right_shape=right)
+
+    r = Ray(point(ray_x, 0, -5), vector(0, 0, 1))
+    inters = geo._local_intersect(r)
+    assert len(inters) == truth_n_inters
+    assert all(inter.obj == (left if ray_x == 0 else right) for inter in inters)
+
+
+def test_check_includes() -> None:
+    s1 = Sphere()
+    s2 = Cube()
+    inner = Group()
+    inner.add_child(s2)
+    outer = Group()
+    outer.add_child(inner)
+
+    assert check_includes(s1, s1)
+    assert not check_includes(s1, s2)
+    assert check_includes(outer, s2)
+    assert not check_includes(outer, s1)
+
+
+def test_intersection_filter_nested_left() -> None:
+    s1 = Sphere()
+    s2 = Cube()
+    left = Group()
+    left.add_child(s1)
+    geo = CSG(operation=Operation.DIFFERENCE, left_shape=left, right_shape=s2)
+
+    inters = Intersections(
+        (Intersection(1, s1), Intersection(2, s2), Intersection(3, s1), Intersection(4, s2))
+    )
+
+    filtered = geo._filter_intersections(inters)
+    assert filtered == [inters[0], inters[1]]
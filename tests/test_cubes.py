@@ -16,6 +16,7 @@ CUBE_RAY_INTERSECTION_CASES = (
     (point(0.5, 0, 5), vector(0, 0, -1), 4, 6),
     (point(0.5, 0, -5), vector(0, 0, 1), 4, 6),
     (point(0, 0.5, 0), vector(0, 0, 1), -1, 1),
+    (point(1, 0.5, -5), vector(0, 0, 1), 4, 6),  # grazing the +x face
 )
 
 
@@ -60,6 +61,7 @@ CUBE_NORMAL_CASES = (
     (point(0.4, 0.4, -1), vector(0, 0, -1)),
     (point(1, 1, 1), vector(1, 0, 0)),
     (point(-1, -1, -1), vector(-1, 0, 0)),
+    (point(0.5, -1, 1), vector(0, -1, 0)),
 )
 
 
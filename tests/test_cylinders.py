@@ -86,6 +86,7 @@ CAPPED_TRUNCATED_CYL_CASES = (
     (point(0, 4, -2), vector(0, -1, 1)),
     (point(0, 0, -2), vector(0, 1, 2)),
     (point(0, -1, -2), vector(0, 1, 1)),
+    (point(0, 1.5, -2), vector(0, 0, 1)),  # parallel to the caps
 )
 
 
@@ -99,6 +100,21 @@ def test_capped_truncated_cylinder_intersection(origin: Rayple, direction: Raypl
     assert len(inters) == 2
 
 
+NEAR_PARALLEL_CYL_CASES = (
+    (False, (0.500001,)),
+    (True, (-0.500001, 0.500001)),
+)
+
+
+@pytest.mark.parametrize(("closed", "truth_ts"), NEAR_PARALLEL_CYL_CASES)
+def test_near_parallel_cylinder_intersection(closed: bool, truth_ts: tuple[float, ...]) -> None:
+    cyl = Cylinder(minimum=-1, maximum=1, closed=closed)
+    r = Ray(point(0.999, -0.5, 0), vector(0.002, 1, 0).normalize())
+
+    inters = cyl._local_intersect(r)
+    assert sorted(i.t for i in inters) == pytest.approx(truth_ts)
+
+
 CAPPED_CYL_NORMAL_CASES = (
     (point(0, 1, 0), vector(0, -1, 0)),
     (point(0.5, 1, 0), vector(0, -1, 0)),
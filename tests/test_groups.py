@@ -3,7 +3,7 @@ import math
 from ray_tracer.intersections import Intersection
 from ray_tracer.rayple import point, vector
 from ray_tracer.rays import Ray
-from ray_tracer.shapes import Group, Sphere
+from ray_tracer.shapes import Group, Plane, Sphere
 from ray_tracer.transforms import rot, scaling, translation
 
 DUMMY_INTER = Intersection(1, Group(), 2, 3)
@@ -19,6 +19,16 @@ def test_adding_child() -> None:
     assert s.parent == g
 
 
+def test_extend_children() -> None:
+    shapes = [Sphere(), Sphere()]
+    g = Group()
+
+    g.extend_children(shapes)
+
+    assert g.children == set(shapes)
+    assert all(s.parent == g for s in shapes)
+
+
 def test_empty_group_ray_intersect() -> None:
     g = Group()
     r = Ray(point(0, 0, 0), vector(0, 0, 1))
@@ -46,6 +56,49 @@ def test_filled_group_ray_intersect() -> None:
     assert inters[3].obj == s1
 
 
+def test_group_unbounded_child_intersect() -> None:
+    g = Group()
+    p = Plane()
+    s = Sphere(transform=translation(0, 3, 0))
+    g.extend_children((p, s))
+
+    r = Ray(point(0, 5, 0), vector(0, -1, 0))
+    inters = g.intersect(r)
+    assert [inter.obj for inter in inters] == [s, s, p]
+
+
+def test_group_hierarchy_reset_on_nested_add() -> None:
+    g1 = Group()
+    g2 = Group()
+    g1.add_child(g2)
+    g2.add_child(Sphere())
+
+    r = Ray(point(0, 5, -5), vector(0, 0, 1))
+    assert len(g1.intersect(r)) == 0
+
+    # The new sphere is outside of the previous bounds of both groups
+    s = Sphere(transform=translation(0, 5, 0))
+    g2.add_child(s)
+    inters = g1.intersect(r)
+    assert [inter.obj for inter in inters] == [s, s]
+
+
+def test_group_hierarchy_reset_on_child_transform() -> None:
+    g1 = Group()
+    g2 = Group()
+    g1.add_child(g2)
+    s = Sphere()
+    g2.add_child(s)
+
+    r = Ray(point(5, 0, -5), vector(0, 0, 1))
+    assert len(g1.intersect(r)) == 0
+
+    # The moved sphere is outside of the previous bounds of both groups
+    s.transform = translation(5, 0, 0)
+    inters = g1.intersect(r)
+    assert [inter.obj for inter in inters] == [s, s]
+
+
 def test_group_array_transform() -> None:
     g = Group(transform=scaling(2, 2, 2))
     s = Sphere(transform=translation(5, 0, 0))
@@ -93,3 +146,55 @@ def test_child_normal_at() -> None:
 
     norm = s.normal_at(point(1.7321, 1.1547, -5.5774), DUMMY_INTER)
     assert norm == vector(0.28570, 0.42854, -0.85716)
+
+
+def test_hit_and_normal_nested() -> None:
+    g1 = Group(transform=rot(y=math.pi / 2))
+    g2 = Group(transform=scaling(1, 2, 3))
+    g1.add_child(g2)
+
+    s = Sphere(transform=translation(5, 0, 0))
+    g2.add_child(s)
+
+    r = Ray(point(0.5, 0.5, -15), vector(0, 0, 1))
+    for obj in (g1, g2, s):
+        hit, world_point, normal = obj.hit_and_normal(r)  # type: ignore[misc]
+        assert hit.obj is s
+        assert world_point == r.position(hit.t)
+        assert normal == s.normal_at(world_point, hit)
+
+
+def test_group_descendants() -> None:
+    g1 = Group()
+    g2 = Group()
+    s1 = Sphere()
+    s2 = Sphere()
+
+    g1.add_child(g2)
+    g1.add_child(s1)
+    g2.add_child(s2)
+
+    assert g1.descendants == {g2, s1, s2}
+    assert g2.descendants == {s2}
+
+
+def test_group_descendants_reset_on_nested_add() -> None:
+    g1 = Group()
+    g2 = Group()
+    g1.add_child(g2)
+    assert g1.descendants == {g2}
+
+    s = Sphere()
+    g2.add_child(s)
+    assert g1.descendants == {g2, s}
+
+
+def test_group_descendants_reset_on_nested_extend() -> None:
+    g1 = Group()
+    g2 = Group()
+    g1.add_child(g2)
+    assert g1.descendants == {g2}
+
+    shapes = [Sphere(), Sphere()]
+    g2.extend_children(shapes)
+    assert g1.descendants == {g2, *shapes}
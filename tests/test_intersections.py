@@ -1,6 +1,7 @@
 import math
 from functools import partial
 
+import numpy as np
 import pytest
 
 from ray_tracer import EPSILON
@@ -8,11 +9,13 @@ from ray_tracer.intersections import (
     Comps,
     Intersection,
     Intersections,
+    empty_intersections,
     prepare_computations,
     schlick,
+    schlick_batch,
 )
 from ray_tracer.materials import Material
-from ray_tracer.rayple import point, vector
+from ray_tracer.rayple import dot, point, vector
 from ray_tracer.rays import Ray
 from ray_tracer.shapes import Plane, Sphere
 from ray_tracer.transforms import scaling, translation
@@ -27,6 +30,16 @@ def test_intersections_container() -> None:
     assert intersections[1].t == 2
 
 
+def test_empty_intersections() -> None:
+    inters = empty_intersections()
+    assert isinstance(inters, Intersections)
+    assert inters.hit is None
+
+    # Each call provides a new collection
+    inters.append(Intersection(1, Sphere()))
+    assert len(empty_intersections()) == 0
+
+
 def test_intersections_sorted() -> None:
     s = Sphere()
     intersections = Intersections([Intersection(2, s), Intersection(1, s)])
@@ -40,6 +53,9 @@ HIT_TEST_CASES = (
     (Intersections([P_INT(-1), P_INT(1)]), P_INT(1)),
     (Intersections([P_INT(-2), P_INT(-1)]), None),
     (Intersections([P_INT(5), P_INT(7), P_INT(-3), P_INT(2)]), P_INT(2)),
+    # Long enough to be bisected
+    (Intersections([P_INT(t) for t in range(-20, 20)]), P_INT(1)),
+    (Intersections([P_INT(t) for t in range(-20, 0)]), None),
 )
 
 
@@ -166,6 +182,14 @@ def test_refraction_indices(
     assert comps.n2 == pytest.approx(n2)
 
 
+def test_refraction_indices_non_member_raises(refraction_scenario: Intersections) -> None:
+    r = Ray(point(0, 0, -4), vector(0, 0, 1))
+    # Intersections are located by identity, so an equivalent copy isn't a member
+    copied = Intersection(refraction_scenario[1].t, refraction_scenario[1].obj)
+    with pytest.raises(ValueError):
+        _ = prepare_computations(inter=copied, ray=r, all_inters=refraction_scenario)
+
+
 def test_total_internal_reflection_schlick() -> None:
     s = Sphere(material=Material(transparency=1, refractive_index=1.5))
     r = Ray(point(0, 0, RT_2 / 2), vector(0, 1, 0))
@@ -192,3 +216,24 @@ def test_total_internal_reflection_schlick_small_angle() -> None:
     comps = prepare_computations(inters[0], r, inters)
     # Truth reflectance tweaked from textbook to lazily fix floating point issues
     assert schlick(comps) == pytest.approx(0.4887308)
+
+
+def test_schlick_batch() -> None:
+    s = Sphere(material=Material(transparency=1, refractive_index=1.5))
+    scenarios = (
+        (Ray(point(0, 0, RT_2 / 2), vector(0, 1, 0)), (-RT_2 / 2, RT_2 / 2), 1),
+        (Ray(point(0, 0, 0), vector(0, 1, 0)), (-1, 1), 1),
+        (Ray(point(0, 0.99, -2), vector(0, 0, 1)), (1.8589,), 0),
+    )
+
+    all_comps = []
+    for r, ts, idx in scenarios:
+        inters = Intersections([Intersection(t, s) for t in ts])
+        all_comps.append(prepare_computations(inters[idx], r, inters))
+
+    reflectance = schlick_batch(
+        n1=np.array([comps.n1 for comps in all_comps]),
+        n2=np.array([comps.n2 for comps in all_comps]),
+        eye_dot_normal=np.array([dot(comps.eye_v, comps.normal) for comps in all_comps]),
+    )
+    assert reflectance == pytest.approx([schlick(comps) for comps in all_comps])
@@ -1,10 +1,11 @@
 import math
 from functools import partial
 
+import numpy as np
 import pytest
 
 from ray_tracer.colors import BLACK, WHITE
-from ray_tracer.lights import PointLight, lighting
+from ray_tracer.lights import PointLight, _lighting_scalar, lighting, lighting_batch
 from ray_tracer.materials import Material
 from ray_tracer.patterns import Stripe
 from ray_tracer.rayple import Rayple, RaypleType, color, point, vector
@@ -39,6 +40,24 @@ def test_lighting(eye_v: Rayple, light: PointLight, truth_lit: Rayple) -> None:
     assert lit == truth_lit
 
 
+@pytest.mark.parametrize(("eye_v", "light", "truth_lit"), ILLUMINATION_TEST_CASES)
+def test_lighting_scalar(eye_v: Rayple, light: PointLight, truth_lit: Rayple) -> None:
+    lit = _lighting_scalar(
+        surf_color=(1, 1, 1),
+        ambient=BASE_MATERIAL.ambient,
+        diffuse=BASE_MATERIAL.diffuse,
+        specular=BASE_MATERIAL.specular,
+        shininess=BASE_MATERIAL.shininess,
+        light_pos=(*light.position,),
+        intensity=(*light.intensity,),
+        surf_pos=(*BASE_POSITION,),
+        eye_v=(*eye_v,),
+        normal=(*BASE_NORM,),
+    )
+
+    assert lit == pytest.approx((*truth_lit,), abs=1e-4)
+
+
 def test_lighting_nonpoint_surface_raises() -> None:
     with pytest.raises(ValueError):
         _ = lighting(
@@ -99,3 +118,47 @@ def test_lighting_with_pattern() -> None:
         material=m, obj=obj, light=light, surf_pos=point(1.1, 0, 0), eye_v=eye_v, normal=normal
     )
     assert c2 == BLACK
+
+
+@pytest.mark.parametrize(("eye_v", "light", "truth_lit"), ILLUMINATION_TEST_CASES)
+def test_lighting_batch(eye_v: Rayple, light: PointLight, truth_lit: Rayple) -> None:
+    n_points = 3
+    lit = lighting_batch(
+        material=BASE_MATERIAL,
+        obj=DUMMY_SHAPE,
+        light=light,
+        surf_pos=np.tile((*BASE_POSITION,), (n_points, 1)).astype(float),
+        eye_v=np.tile((*eye_v,), (n_points, 1)),
+        normal=np.tile((*BASE_NORM,), (n_points, 1)),
+    )
+
+    assert lit.shape == (n_points, 3)
+    assert lit == pytest.approx(np.tile((*truth_lit,), (n_points, 1)), abs=1e-4)
+
+
+def test_lighting_batch_in_shadow() -> None:
+    lit = lighting_batch(
+        material=BASE_MATERIAL,
+        obj=DUMMY_SHAPE,
+        light=LIGHT_P(point(0, 0, -10)),
+        surf_pos=np.zeros((2, 3)),
+        eye_v=np.array([(0, 0, -1), (0, 0, -1)]),
+        normal=np.array([(0, 0, -1), (0, 0, -1)]),
+        in_shadow=np.array([True, False]),
+    )
+
+    assert lit == pytest.approx(np.array([(0.1, 0.1, 0.1), (1.9, 1.9, 1.9)]))
+
+
+def test_lighting_batch_with_pattern() -> None:
+    m = Material(pattern=Stripe(), ambient=1, diffuse=0, specular=0)
+    lit = lighting_batch(
+        material=m,
+        obj=Sphere(),
+        light=PointLight(point(0, 0, -10), WHITE),
+        surf_pos=np.array([(0.9, 0, 0), (1.1, 0, 0)]),
+        eye_v=np.array([(0, 0, -1), (0, 0, -1)]),
+        normal=np.array([(0, 0, -1), (0, 0, -1)]),
+    )
+
+    assert lit == pytest.approx(np.array([(*WHITE,), (*BLACK,)]))
@@ -1,7 +1,7 @@
 import pytest
 
 from ray_tracer.colors import WHITE
-from ray_tracer.materials import Material
+from ray_tracer.materials import Material, RefractionIndex
 
 
 def test_material_invalid_ambient_raises() -> None:
@@ -22,3 +22,10 @@ def test_material_invalid_specular_raises() -> None:
 def test_material_invalid_shininess_raises() -> None:
     with pytest.raises(ValueError):
         _ = Material(color=WHITE, pattern=None, ambient=1, diffuse=1, specular=1, shininess=-1)
+
+
+def test_material_refractive_index_is_float() -> None:
+    m = Material(refractive_index=RefractionIndex.GLASS)
+
+    assert type(m.refractive_index) is float
+    assert m.refractive_index == pytest.approx(1.52)
@@ -46,6 +46,40 @@ def test_parse_vertex_records() -> None:
     assert vertices[3] == point(1, 1, 0)
 
 
+def test_parse_single_vertex_irregular_spacing() -> None:
+    src = "v  -1\t0.5   2\n"
+
+    vertices, *_ = parse_obj_src(src)
+    assert list(vertices) == [point(-1, 0.5, 2)]
+
+
+def test_parse_tab_separated_statements() -> None:
+    src = "v\t-1\t1\t0\nv\t-1 0 0\nv 1 0 0\nvn\t0 0 1\ng\tFirstGroup\nf\t1 2 3\n"
+
+    vertices, triangles, groups, normals = parse_obj_src(src)
+    assert list(vertices) == [point(-1, 1, 0), point(-1, 0, 0), point(1, 0, 0)]
+    assert list(normals) == [vector(0, 0, 1)]
+    assert len(triangles) == 1
+    assert triangles[0].p3 == point(1, 0, 0)
+    assert len(groups) == 2
+    assert groups[1].children == {triangles[0]}
+
+
+def test_skip_texture_vertices() -> None:
+    src = dedent(
+        """\
+        v -1 1 0
+        vt 0.5 0.5
+        vn 0 0 1
+        vp 0.2 0.3
+        """
+    )
+
+    vertices, tris, groups, normals = parse_obj_src(src)
+    assert list(vertices) == [point(-1, 1, 0)]
+    assert list(normals) == [vector(0, 0, 1)]
+
+
 def test_parse_triangles() -> None:
     src = dedent(
         """\
@@ -153,6 +187,27 @@ def test_obj_file_parse() -> None:
     assert len(group.children) == 2
 
 
+def test_empty_obj_file_parse(tmp_path: Path) -> None:
+    sample_file = tmp_path / "empty.obj"
+    sample_file.touch()
+
+    group = parse_obj_file(sample_file)
+    assert len(group.children) == 0
+
+
+def test_obj_file_parse_crlf(tmp_path: Path) -> None:
+    sample_file = tmp_path / "crlf.obj"
+    sample_file.write_bytes(b"# Comment\r\nv -1 1 0\r\nv -1 0 0\r\nv 1 0 0\r\n\r\ng G\r\nf 1 2 3\r\n")
+
+    group = parse_obj_file(sample_file)
+    assert len(group.children) == 1
+
+    (named_group,) = group.children
+    (tri,) = named_group.children
+    assert tri.p1 == point(-1, 1, 0)
+    assert tri.p3 == point(1, 0, 0)
+
+
 def test_vertex_normals() -> None:
     src = dedent(
         """\
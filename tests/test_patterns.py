@@ -1,10 +1,22 @@
+import math
+import pickle
+
+import numpy as np
 import pytest
 
 from ray_tracer.colors import BLACK, WHITE
-from ray_tracer.patterns import Checker, Gradient, Ring, Stripe
+from ray_tracer.patterns import (
+    Checker,
+    Gradient,
+    Pattern,
+    Ring,
+    Stripe,
+    _TestPattern,
+    _specialize_point_transform,
+)
 from ray_tracer.rayple import Rayple, color, point
-from ray_tracer.shapes import Sphere
-from ray_tracer.transforms import scaling, translation
+from ray_tracer.shapes import Group, Sphere
+from ray_tracer.transforms import Matrix, rot_y, rot_z, scaling, translation
 
 STRIPED_TEST_CASES = (
     (point(0, 0, 0), WHITE),
@@ -53,6 +65,29 @@ def test_striped_pattern_object_transform() -> None:
     assert c == WHITE
 
 
+SPECIALIZED_TRANSFORM_CASES = (
+    translation(0.5, -2, 3),
+    rot_y(0.3) * scaling(0.5, 2, 1),
+    rot_z(math.pi / 2),  # Produces values on the order of 1e-17 that get snapped to 0
+)
+
+
+@pytest.mark.parametrize("t_matrix", SPECIALIZED_TRANSFORM_CASES)
+def test_specialized_point_transform(t_matrix: Matrix) -> None:
+    to_pattern = _specialize_point_transform(t_matrix)
+    for pt in (point(1, 0, 0), point(1.5, -2, 0.25)):
+        transformed = to_pattern(pt)
+        truth = t_matrix * pt
+
+        assert (transformed.x, transformed.y, transformed.z) == (truth.x, truth.y, truth.z)
+        assert transformed.w == truth.w
+
+
+def test_specialized_identity_passthrough() -> None:
+    pt = point(1.5, -2, 0.25)
+    assert _specialize_point_transform(Matrix.identity())(pt) is pt
+
+
 GRADIENT_CASES = (
     (point(0, 0, 0), WHITE),
     (point(0.25, 0, 0), color(0.75, 0.75, 0.75)),
@@ -96,3 +131,42 @@ CHECKER_CASES = (
 def test_checker(pt: Rayple, truth_color: Rayple) -> None:
     pattern = Checker()
     assert pattern.at_point(pt) == truth_color
+
+
+BATCH_CASES = (
+    (Stripe(), STRIPED_TEST_CASES),
+    (Gradient(), GRADIENT_CASES),
+    (Ring(), RING_CASES),
+    (Checker(), CHECKER_CASES),
+    (_TestPattern(), CHECKER_CASES),
+)
+
+
+@pytest.mark.parametrize(("pattern", "cases"), BATCH_CASES)
+def test_at_points_matches_at_point(pattern: Pattern, cases: tuple) -> None:
+    pts = np.array([(*pt,) for pt, _ in cases])
+    colors = pattern.at_points(pts)
+
+    assert colors.shape == (len(cases), 3)
+    for c, (pt, _) in zip(colors.tolist(), cases):
+        assert color(*c) == pattern.at_point(pt)
+
+
+def test_at_object_batch_matches_at_object() -> None:
+    g = Group(rot_y(0.5))
+    obj = Sphere(transform=scaling(2, 2, 2))
+    g.add_child(obj)
+    pattern = Checker(transform=translation(0.5, 0.25, 0))
+
+    world_pts = [point(1.5, 0, 0), point(2.5, -1, 0.3), point(-0.7, 1.2, 3)]
+    colors = pattern.at_object_batch(obj, np.array([(*pt,) for pt in world_pts]))
+
+    assert [color(*c) for c in colors.tolist()] == [pattern.at_object(obj, pt) for pt in world_pts]
+
+
+def test_pattern_pickle_roundtrip() -> None:
+    pattern = Stripe(WHITE, BLACK, translation(0.5, 0, 0))
+    loaded = pickle.loads(pickle.dumps(pattern))
+
+    assert loaded == pattern
+    assert loaded.at_object(Sphere(), point(0.25, 0, 0)) == BLACK
@@ -1,3 +1,4 @@
+import math
 from functools import partial
 
 import pytest
@@ -6,6 +7,7 @@ from ray_tracer.intersections import Intersection, Intersections
 from ray_tracer.rayple import Rayple, point, vector
 from ray_tracer.rays import Ray
 from ray_tracer.shapes import Plane
+from ray_tracer.transforms import rot_x
 
 DUMMY_INTER = Intersection(1, Plane(), 2, 3)
 
@@ -39,3 +41,9 @@ def test_plane_intersection(ray: Ray, truth_intersection: list[float]) -> None:
     intersections = BASE_PLANE.intersect(ray)
 
     assert intersections == truth_intersection
+
+
+def test_plane_not_culled() -> None:
+    p = Plane(rot_x(math.pi / 4))
+    assert p._culling_bounds() is None
+    assert len(p.intersect(Ray(point(0, 1, 0), vector(0, -1, 0)))) == 1
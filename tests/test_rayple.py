@@ -1,3 +1,4 @@
+import dataclasses
 import math
 
 import numpy as np
@@ -24,6 +25,12 @@ def test_rayple_iterable() -> None:
     assert list(c) == [1, 2, 3]
 
 
+def test_rayple_immutable() -> None:
+    p = point(1, 2, 3)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        p.x = 5  # type: ignore[misc]
+
+
 def test_rayple_helpers() -> None:
     p = point(1, 2, 3)
     v = vector(1, 2, 3)
@@ -50,6 +57,9 @@ EQ_CASES = (
     (vector(1, 2, 3), vector(-1.0, 2.0, 3.0), False),
     (color(1, 2, 3), color(-1.0, 2.0, 3.0), False),
     (point(1, 2, 3), vector(1, 2, 3), False),
+    (point(-math.inf, 0, 0), point(-math.inf, 0, 0), True),
+    (point(math.inf, 0, 0), point(-math.inf, 0, 0), False),
+    (point(math.inf, 0, 0), point(1e10, 0, 0), False),
     (point(1, 2, 3), 5, False),
     (vector(1, 2, 3), 5, False),
     (color(1, 2, 3), 5, False),
@@ -109,6 +119,14 @@ def test_sum_color_noncolor_raises() -> None:
         c + p
 
 
+def test_sum_noncolor_color_raises() -> None:
+    c = color(0, 0, 0)
+    v = vector(1, 2, 3)
+
+    with pytest.raises(TypeError):
+        v + c
+
+
 def test_sum_rayple_nonrayple_raises() -> None:
     with pytest.raises(TypeError):
         point(0, 0, 0) + 5
@@ -143,6 +161,14 @@ def test_diff_color_noncolor_raises() -> None:
         c - p
 
 
+def test_diff_noncolor_color_raises() -> None:
+    c = color(0, 0, 0)
+    p = point(1, 2, 3)
+
+    with pytest.raises(TypeError):
+        p - c
+
+
 def test_diff_rayple_nonrayple_raises() -> None:
     with pytest.raises(TypeError):
         point(0, 0, 0) - 5
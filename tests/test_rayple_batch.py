@@ -0,0 +1,175 @@
+import numpy as np
+import pytest
+
+from ray_tracer.rayple import COLOR, POINT, VECTOR, color, cross, dot, point, vector
+from ray_tracer.rayple_batch import (
+    RaypleBatch,
+    cross_batch,
+    dot_batch,
+    point_batch,
+    vector_batch,
+)
+from ray_tracer.transforms import rot_x, scaling, translation
+
+POINTS = [point(1, 2, 3), point(-1, 0, 4.5)]
+VECTORS = [vector(1, 0, 0), vector(2, 3, 4)]
+COLORS = [color(0.5, 0.25, 1), color(1, 1, 0)]
+
+
+def test_from_rayples_round_trip() -> None:
+    batch = RaypleBatch.from_rayples(POINTS)
+
+    assert batch.w == POINT
+    assert len(batch) == 2
+    assert batch[1] == POINTS[1]
+    assert list(batch) == POINTS
+
+
+FROM_RAYPLES_RAISES_CASES = (
+    [],
+    [point(1, 2, 3), vector(1, 2, 3)],
+)
+
+
+@pytest.mark.parametrize("rayples", FROM_RAYPLES_RAISES_CASES)
+def test_from_rayples_raises(rayples: list) -> None:
+    with pytest.raises(ValueError):
+        RaypleBatch.from_rayples(rayples)
+
+
+def test_bad_shape_raises() -> None:
+    with pytest.raises(ValueError):
+        RaypleBatch(np.zeros((3, 4)), POINT)
+
+
+def test_eq() -> None:
+    batch = RaypleBatch.from_rayples(POINTS)
+
+    assert batch == point_batch(np.array([(1, 2, 3), (-1, 0, 4.5)]))
+    assert batch != vector_batch(np.array([(1, 2, 3), (-1, 0, 4.5)]))
+    assert batch != point_batch(np.array([(1, 2, 3)]))
+    assert batch.__eq__(POINTS[0]) is NotImplemented
+
+
+def test_isclose() -> None:
+    batch = RaypleBatch.from_rayples(POINTS)
+    other = RaypleBatch.from_rayples([point(1, 2, 3.000001), point(-1, 0.1, 4.5)])
+
+    assert batch.isclose(other).tolist() == [True, False]
+    assert batch.isclose(RaypleBatch.from_rayples(VECTORS)).tolist() == [False, False]
+
+
+def test_isclose_infinite() -> None:
+    batch = point_batch(np.array([(-np.inf, 0, 0), (np.inf, 0, 0)]))
+    other = point_batch(np.array([(-np.inf, 0, 0), (-np.inf, 0, 0)]))
+
+    assert batch.isclose(other).tolist() == [True, False]
+    assert batch == point_batch(batch.xyz.copy())
+
+
+ARITHMETIC_CASES = (
+    (POINTS, VECTORS, "add"),
+    (VECTORS, VECTORS, "add"),
+    (COLORS, COLORS, "add"),
+    (POINTS, POINTS, "sub"),
+    (POINTS, VECTORS, "sub"),
+    (VECTORS, VECTORS, "sub"),
+    (COLORS, COLORS, "sub"),
+    (COLORS, COLORS, "mul"),
+)
+
+
+@pytest.mark.parametrize(("left", "right", "op"), ARITHMETIC_CASES)
+def test_arithmetic_matches_rayple(left: list, right: list, op: str) -> None:
+    op_name = f"__{op}__"
+    batched = getattr(RaypleBatch.from_rayples(left), op_name)(RaypleBatch.from_rayples(right))
+    truth = [getattr(a, op_name)(b) for a, b in zip(left, right)]
+
+    assert list(batched) == truth
+    assert batched.w == truth[0].w
+
+
+ARITHMETIC_RAISES_CASES = (
+    (POINTS, POINTS, "add"),
+    (COLORS, VECTORS, "add"),
+    (VECTORS, POINTS, "sub"),
+    (VECTORS, COLORS, "sub"),
+    (VECTORS, VECTORS, "mul"),
+)
+
+
+@pytest.mark.parametrize(("left", "right", "op"), ARITHMETIC_RAISES_CASES)
+def test_arithmetic_raises(left: list, right: list, op: str) -> None:
+    op_name = f"__{op}__"
+    with pytest.raises(TypeError):
+        getattr(RaypleBatch.from_rayples(left), op_name)(RaypleBatch.from_rayples(right))
+
+
+def test_scalar_ops() -> None:
+    batch = RaypleBatch.from_rayples(VECTORS)
+
+    assert list(-batch) == [-v for v in VECTORS]
+    assert list(batch * 2) == [v * 2 for v in VECTORS]
+    assert list(2 * batch) == [v * 2 for v in VECTORS]
+    assert list(batch / 2) == [v / 2 for v in VECTORS]
+    assert list(batch * np.array([2, 3])) == [VECTORS[0] * 2, VECTORS[1] * 3]
+
+
+def test_unsupported_operand() -> None:
+    batch = RaypleBatch.from_rayples(VECTORS)
+
+    assert batch.__add__(VECTORS[0]) is NotImplemented
+    assert batch.__sub__(VECTORS[0]) is NotImplemented
+    assert batch.__mul__("a") is NotImplemented
+    assert batch.__truediv__(batch) is NotImplemented
+
+
+def test_magnitude_normalize() -> None:
+    batch = RaypleBatch.from_rayples(VECTORS)
+
+    assert batch.magnitude() == pytest.approx([abs(v) for v in VECTORS])
+    assert list(batch.normalize()) == [v.normalize() for v in VECTORS]
+
+
+def test_magnitude_non_vector_raises() -> None:
+    with pytest.raises(TypeError):
+        RaypleBatch.from_rayples(POINTS).magnitude()
+
+
+def test_dot_cross() -> None:
+    left = RaypleBatch.from_rayples(VECTORS)
+    right = RaypleBatch.from_rayples(VECTORS[::-1])
+
+    assert dot_batch(left, right) == pytest.approx(
+        [dot(a, b) for a, b in zip(VECTORS, VECTORS[::-1])]
+    )
+    assert list(cross_batch(left, right)) == [cross(a, b) for a, b in zip(VECTORS, VECTORS[::-1])]
+
+
+def test_dot_cross_non_vector_raises() -> None:
+    points = RaypleBatch.from_rayples(POINTS)
+    vectors = RaypleBatch.from_rayples(VECTORS)
+
+    with pytest.raises(ValueError):
+        dot_batch(points, vectors)
+
+    with pytest.raises(ValueError):
+        cross_batch(vectors, points)
+
+
+def test_as_array() -> None:
+    assert RaypleBatch.from_rayples(POINTS).as_array().tolist() == [[1, 2, 3, 1], [-1, 0, 4.5, 1]]
+
+
+@pytest.mark.parametrize("rayples", (POINTS, VECTORS))
+def test_transform_matches_rayple(rayples: list) -> None:
+    t_matrix = translation(5, -3, 2) * rot_x(0.5) * scaling(2, 1, 3)
+
+    transformed = RaypleBatch.from_rayples(rayples).transform(t_matrix)
+    assert list(transformed) == [t_matrix * r for r in rayples]
+    assert transformed.w in (POINT, VECTOR)
+
+
+def test_color_batch_type() -> None:
+    assert RaypleBatch.from_rayples(COLORS).w == COLOR
+    assert vector_batch(np.zeros((1, 3))).w == VECTOR
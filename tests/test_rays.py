@@ -3,7 +3,7 @@ import pytest
 from ray_tracer import NUMERIC_T
 from ray_tracer.rayple import Rayple, point, vector
 from ray_tracer.rays import Ray
-from ray_tracer.transforms import Matrix, scaling, translation
+from ray_tracer.transforms import Matrix, rot_x, scaling, translation
 
 
 def test_ray_nonpoint_origin_raises() -> None:
@@ -47,3 +47,12 @@ RAY_TRANSFORMATION_CASES = (
 def test_ray_transformation(t_matrix: Matrix, truth_ray: Ray) -> None:
     r = Ray(point(1, 2, 3), vector(0, 1, 0))
     assert r.transform(t_matrix) == truth_ray
+
+
+def test_ray_transformation_matches_matrix_mul() -> None:
+    t_matrix = translation(3, 4, 5) * rot_x(0.3) * scaling(2, 3, 4)
+    r = Ray(point(1, 2, 3), vector(0, 0.6, 0.8))
+
+    transformed = r.transform(t_matrix)
+    assert transformed.origin == t_matrix * r.origin
+    assert transformed.direction == t_matrix * r.direction
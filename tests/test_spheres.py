@@ -1,12 +1,14 @@
 import math
 from functools import partial
 
+import numpy as np
 import pytest
 
+from ray_tracer.bounds import BoundingBox
 from ray_tracer.intersections import Intersection, Intersections
 from ray_tracer.rayple import Rayple, point, vector
 from ray_tracer.rays import Ray
-from ray_tracer.shapes import Sphere
+from ray_tracer.shapes import Group, Sphere, SphereBatch
 from ray_tracer.transforms import Matrix, rot_z, scaling, translation
 
 DUMMY_INTER = Intersection(1, Sphere(), 2, 3)
@@ -35,6 +37,43 @@ def test_unit_sphere_intersection(ray: Ray, truth_intersection: list[float]) ->
     assert intersections == truth_intersection
 
 
+def test_unit_sphere_batch_intersection() -> None:
+    rays = [ray for ray, _ in UNIT_SPHERE_INTERSECT_CASES]
+    origins = np.array([(*ray.origin,) for ray in rays])
+    directions = np.array([(*ray.direction,) for ray in rays])
+
+    t0, t1, hit_mask = Sphere.batch_local_intersect(origins, directions)
+
+    truth_hits = [bool(truth) for _, truth in UNIT_SPHERE_INTERSECT_CASES]
+    assert hit_mask.tolist() == truth_hits
+    for t_near, t_far, (_, truth) in zip(t0, t1, UNIT_SPHERE_INTERSECT_CASES):
+        if truth:
+            assert (t_near, t_far) == pytest.approx([inter.t for inter in truth])
+        else:
+            assert np.isnan(t_near) and np.isnan(t_far)
+
+
+def test_world_batch_intersection_matches_scalar() -> None:
+    s = Sphere(scaling(2, 1, 1) * rot_z(math.pi / 4))
+    g = Group(translation(0, 1, 0))
+    g.add_child(s)
+
+    rays = [
+        Ray(point(0, 1, -5), vector(0, 0, 1)),
+        Ray(point(0.5, 0.5, -5), vector(0, 0.1, 1)),
+        Ray(point(0, 5, -5), vector(0, 0, 1)),
+    ]
+    origins = np.array([(*ray.origin,) for ray in rays])
+    directions = np.array([(*ray.direction,) for ray in rays])
+
+    t0, t1, hit_mask = s.batch_intersect(origins, directions)
+
+    assert hit_mask.tolist() == [True, True, False]
+    for ray, t_near, t_far, hit in zip(rays, t0, t1, hit_mask):
+        if hit:
+            assert (t_near, t_far) == pytest.approx([inter.t for inter in g.intersect(ray)])
+
+
 TRANSFORMED_SPHERE_INTERSECT_CASES = (
     (scaling(2, 2, 2), (3.0, 7.0)),
     (translation(5, 0, 0), ()),
@@ -52,6 +91,72 @@ def test_transformed_sphere_intersection(transform: Matrix, truth_t: tuple[float
     assert intersections == truth_intersections
 
 
+def test_sphere_batch_intersect_matches_scalar() -> None:
+    g = Group(translation(0, 0, 3))
+    nested = Sphere(scaling(0.5, 0.5, 0.5))
+    g.add_child(nested)
+    spheres = [Sphere(), Sphere(translation(0, 0.5, 1)), Sphere(translation(5, 0, 0)), nested]
+    batch = SphereBatch(spheres)
+
+    r = Ray(point(0, 0, -5), vector(0, 0, 1))
+    inters = batch.intersect(r)
+
+    # Parent transforms are applied by the group, so the nested sphere has to be reached through it
+    truth = Intersections([inter for obj in (*spheres[:3], g) for inter in obj.intersect(r)])
+    truth.sort()
+    assert [inter.t for inter in inters] == pytest.approx([inter.t for inter in truth])
+    assert [inter.obj for inter in inters] == [inter.obj for inter in truth]
+
+
+def test_single_precision_sphere_batch() -> None:
+    spheres = [Sphere(), Sphere(translation(0, 0.5, 1)), Sphere(scaling(2, 2, 2))]
+    single = SphereBatch(spheres, dtype=np.float32)
+    double = SphereBatch(spheres)
+
+    origin, direction = np.array((0, 0.25, -5)), np.array((0, 0, 1))
+    single_ts, single_ids = single.intersect_all(origin, direction)
+    double_ts, double_ids = double.intersect_all(origin, direction)
+
+    assert single_ts.dtype == np.float32
+    assert single_ts == pytest.approx(double_ts, abs=1e-5)
+    assert single_ids.tolist() == double_ids.tolist()
+
+
+def test_identity_fast_path_matches_generic() -> None:
+    fast = Sphere()
+    generic = Sphere(Matrix(np.identity(4)))
+    r = Ray(point(0.25, 0.5, -5), vector(0, 0, 1))
+
+    assert [i.t for i in fast.intersect(r)] == pytest.approx([i.t for i in generic.intersect(r)])
+    assert fast.world_to_object(point(1, 2, 3)) == generic.world_to_object(point(1, 2, 3))
+
+
+def test_empty_sphere_batch() -> None:
+    batch = SphereBatch([])
+    assert len(batch) == 0
+    assert len(batch.intersect(Ray(point(0, 0, -5), vector(0, 0, 1)))) == 0
+
+
+def test_sphere_culled_by_bounds() -> None:
+    s = Sphere(translation(0, 0, 5))
+    assert s._culling_bounds() == BoundingBox(minimum=(-1, -1, 4), maximum=(1, 1, 6))
+    assert len(s.intersect(Ray(point(0, 2, -5), vector(0, 0, 1)))) == 0
+
+    # Grazing the bounding box's corner still misses the sphere itself
+    assert len(s.intersect(Ray(point(0.99, 0.99, -5), vector(0, 0, 1)))) == 0
+    assert len(s.intersect(Ray(point(0, 0, -5), vector(0, 0, 1)))) == 2
+
+
+def test_reassigned_transform_resets_inverse() -> None:
+    s = Sphere(scaling(2, 2, 2))
+    r = Ray(point(0, 0, -5), vector(0, 0, 1))
+    assert [inter.t for inter in s.intersect(r)] == pytest.approx([3, 7])
+
+    s.transform = translation(5, 0, 0)
+    assert len(s.intersect(r)) == 0
+    assert s.normal_at(point(6, 0, 0), DUMMY_INTER) == vector(1, 0, 0)
+
+
 UNIT_SPHERE_NORMAL_CASES = (
     (point(1, 0, 0), vector(1, 0, 0)),
     (point(0, 1, 0), vector(0, 1, 0)),
@@ -97,3 +202,18 @@ def test_normal_transformed_sphere() -> None:
     truth_vector = vector(0, 0.97014, -0.24253)
 
     assert s.normal_at(query, DUMMY_INTER) == truth_vector
+
+
+def test_hit_and_normal_matches_normal_at() -> None:
+    s = Sphere(scaling(1, 0.5, 1) * rot_z(math.pi / 5))
+    r = Ray(point(0.1, 0.2, -5), vector(0, 0, 1))
+
+    hit, world_point, normal = s.hit_and_normal(r)  # type: ignore[misc]
+    assert hit == s.intersect(r).hit
+    assert world_point == r.position(hit.t)
+    assert normal == s.normal_at(world_point, hit)
+
+
+def test_hit_and_normal_miss() -> None:
+    s = Sphere()
+    assert s.hit_and_normal(Ray(point(0, 2, -5), vector(0, 0, 1))) is None
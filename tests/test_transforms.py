@@ -5,7 +5,13 @@ import pytest
 
 from ray_tracer.rayple import Rayple, point, vector
 from ray_tracer.transforms import (
+    GENERIC,
+    IDENTITY,
     Matrix,
+    RIGID,
+    ROTATION,
+    SCALING,
+    TRANSLATION,
     rot,
     rot_x,
     rot_y,
@@ -27,6 +33,18 @@ def test_matrix_nonrayple_mul_raises() -> None:
         _ = m * 1  # type: ignore[operator]
 
 
+def test_matrix_rayple_mul_matches_numpy() -> None:
+    m = Matrix(np.arange(16, dtype=float).reshape(4, 4) / 10)
+    m.matrix[3, :] = (0, 0, 0, 1)
+    p = point(1.5, -2, 0.25)
+
+    transformed = m * p
+    truth = m.matrix.dot(p.as_array())
+    assert (transformed.x, transformed.y, transformed.z) == pytest.approx(truth[:3].tolist())
+    assert transformed.w == p.w
+    assert type(transformed.x) is float
+
+
 def test_translation() -> None:
     p = point(-3, 4, 5)
     truth_shifted = point(2, 1, 7)
@@ -43,6 +61,62 @@ def test_inverse_translation() -> None:
     assert shift * p == truth_shifted
 
 
+def test_inverse_is_cached() -> None:
+    t_matrix = translation(5, -3, 2)
+
+    inverted = t_matrix.inv()
+    assert t_matrix.inv() is inverted
+    assert inverted.inv() is t_matrix
+    assert inverted == Matrix(np.linalg.inv(t_matrix.matrix))
+
+
+def test_rows_are_cached() -> None:
+    t_matrix = translation(5, -3, 2)
+
+    rows = t_matrix.rows()
+    assert rows == t_matrix.matrix.tolist()
+    assert t_matrix.rows() is rows
+
+
+CHAINED_KIND_CASES = (
+    (Matrix.identity(), IDENTITY),
+    (translation(1, 2, 3), TRANSLATION),
+    (scaling(1, 2, 3), SCALING),
+    (rot_x(0.5), ROTATION),
+    (Matrix.identity() * scaling(1, 2, 3), SCALING),
+    (translation(1, 2, 3) * Matrix.identity(), TRANSLATION),
+    (translation(1, 2, 3) * translation(3, 2, 1), TRANSLATION),
+    (rot(0.5, 0.3, 0.1), ROTATION),
+    (translation(1, 2, 3) * rot_y(0.3), RIGID),
+    (rot_y(0.3) * translation(1, 2, 3) * rot_z(1), RIGID),
+    (translation(1, 2, 3) * scaling(1, 2, 3), GENERIC),
+    (shearing(1, 0, 0, 0, 0, 0) * Matrix.identity(), GENERIC),
+)
+
+
+@pytest.mark.parametrize(("t_matrix", "truth_kind"), CHAINED_KIND_CASES)
+def test_chained_kind(t_matrix: Matrix, truth_kind: int) -> None:
+    assert t_matrix.kind == truth_kind
+
+
+@pytest.mark.parametrize(("t_matrix", "_"), CHAINED_KIND_CASES)
+def test_closed_form_inverse(t_matrix: Matrix, _: int) -> None:
+    inverted = t_matrix.inv()
+
+    assert inverted.kind == t_matrix.kind
+    assert np.allclose(inverted.matrix, np.linalg.inv(t_matrix.matrix))
+
+
+def test_singular_scaling_inverse_raises() -> None:
+    with pytest.raises(np.linalg.LinAlgError):
+        scaling(1, 0, 1).inv()
+
+
+def test_singular_affine_inverse_raises() -> None:
+    with pytest.raises(np.linalg.LinAlgError):
+        (translation(1, 2, 3) * shearing(1, 0, 0, 0, 0, 0) * scaling(0, 1, 1)).inv()
+
+
 def test_vector_translation_unchanged() -> None:
     v = vector(-3, 4, 5)
 
@@ -2,6 +2,7 @@ import math
 
 import pytest
 
+from ray_tracer.camera import Camera
 from ray_tracer.colors import BLACK, WHITE
 from ray_tracer.intersections import Intersection, Intersections, prepare_computations
 from ray_tracer.lights import PointLight
@@ -9,9 +10,9 @@ from ray_tracer.materials import Material
 from ray_tracer.patterns import _TestPattern
 from ray_tracer.rayple import Rayple, color, point, vector
 from ray_tracer.rays import Ray
-from ray_tracer.shapes import Plane, Sphere
-from ray_tracer.transforms import scaling, translation
-from ray_tracer.world import DEFAULT_LIGHT, World
+from ray_tracer.shapes import Group, Plane, Sphere
+from ray_tracer.transforms import scaling, translation, view_transform
+from ray_tracer.world import DEFAULT_LIGHT, SPHERE_BATCH_MIN, World
 
 
 def test_default_world_intersection() -> None:
@@ -244,3 +245,78 @@ def test_shade_hit_schlick() -> None:
     inters = Intersections([Intersection(RT_2, floor)])
     comps = prepare_computations(inters[0], r, inters)
     assert w._shade_hit(comps) == color(0.93391, 0.69643, 0.69243)
+
+
+def test_world_bvh_excludes_unbounded_objects() -> None:
+    w = World.default_world()
+    floor = Plane(transform=translation(0, -1, 0))
+    w.objects.append(floor)
+
+    r = Ray(point(0, 0, -5), vector(0, -1, 1).normalize())
+    assert floor in {inter.obj for inter in w.intersect_world(r)}
+    assert w._unbounded == [floor]
+
+
+def test_world_bvh_rebuilt_on_object_change() -> None:
+    w = World.default_world()
+    r = Ray(point(5, 0, -5), vector(0, 0, 1))
+    assert len(w.intersect_world(r)) == 0
+
+    s = Sphere(transform=translation(5, 0, 0))
+    w.objects.append(s)
+    assert len(w.intersect_world(r)) == 2
+
+    w.objects.remove(s)
+    assert len(w.intersect_world(r)) == 0
+
+    w.objects = [s]
+    assert len(w.intersect_world(r)) == 2
+
+
+def test_world_bvh_rebuilt_on_transform_change() -> None:
+    w = World.default_world()
+    r = Ray(point(5, 0, -5), vector(0, 0, 1))
+    assert len(w.intersect_world(r)) == 0
+
+    w.objects[0].transform = translation(5, 0, 0)
+    assert len(w.intersect_world(r)) == 2
+
+
+def test_world_bvh_rebuilt_on_group_change() -> None:
+    g = Group()
+    g.add_child(Sphere())
+    w = World(DEFAULT_LIGHT, [g])
+    r = Ray(point(5, 0, -5), vector(0, 0, 1))
+    assert len(w.intersect_world(r)) == 0
+
+    # Adding to a group is picked up without an explicit rebuild
+    g.add_child(Sphere(transform=translation(5, 0, 0)))
+    assert len(w.intersect_world(r)) == 2
+
+
+def test_render_rebuilds_world() -> None:
+    w = World(DEFAULT_LIGHT, [Sphere(translation(50, 0, 0))])
+    trans = view_transform(point(0, 0, -5), point(0, 0, 0), vector(0, 1, 0))
+    c = Camera(5, 5, math.pi / 2, transform=trans)
+    assert c.render(w).pixel_at(2, 2) == BLACK
+
+    # Replacing an object in place isn't detected per ray, so this relies on render's rebuild
+    w.objects[0] = Sphere()
+    assert c.render(w).pixel_at(2, 2) != BLACK
+
+
+def test_world_sphere_batch_matches_bvh() -> None:
+    spheres = [Sphere(translation(2 * idx, 0, 0)) for idx in range(SPHERE_BATCH_MIN)]
+    floor = Plane(transform=translation(0, -1, 0))
+    batched = World(DEFAULT_LIGHT, [*spheres, floor])
+    unbatched = World(DEFAULT_LIGHT, [*spheres[1:], floor])
+
+    r = Ray(point(4, 2, -5), vector(0, -0.5, 1).normalize())
+    batched_inters = batched.intersect_world(r)
+    unbatched_inters = unbatched.intersect_world(r)
+    assert batched._spheres is not None
+    assert unbatched._spheres is None
+    assert len(batched_inters) == 3
+
+    assert [i.t for i in batched_inters] == pytest.approx([i.t for i in unbatched_inters])
+    assert [i.obj for i in batched_inters] == [i.obj for i in unbatched_inters]